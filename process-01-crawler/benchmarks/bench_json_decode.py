@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+JSON 응답 디코딩 경로 벤치마크
+Version 1.0.0 (2026-10-17)
+- 같은 응답(requests.Response)을 여러 방식으로 파싱해 처리량 비교
+    text_json      json.loads(response.text)         (기존 JSON 클라이언트)
+    text_detect    위와 같되 응답에 charset이 없을 때 (requests 문자셋 추정 포함)
+    response_json  response.json()                   (기존 고급 클라이언트)
+    bytes_json     json.loads(response.content)      (표준 json, 바이트 그대로)
+    bytes_orjson   orjson.loads(response.content)    (orjson 설치 시)
+    loads          law_json_decode.loads             (클라이언트가 쓰는 경로)
+- 큰 세법(조세특례제한법, 소득세법, 법인세법) 기준, 로컬 재생 서버 사용 (인터넷 연결 불필요)
+
+사용법 (process-01-crawler 폴더에서):
+    python benchmarks/bench_json_decode.py
+    python benchmarks/bench_json_decode.py --fixtures _cache/detail_cache --laws 268611 --repeat 50
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_pipeline import (BENCH_LAWS, git_revision, measure, print_report, resolve_msts,  # noqa: E402
+                            save_report, summarize)
+from law_api_ratelimit import RateLimiter, RetryPolicy  # noqa: E402
+from law_api_replay import start_replay_server  # noqa: E402
+from law_api_session import create_session, request_with_retry  # noqa: E402
+from law_json_decode import BACKEND, loads, loads_stdlib, orjson  # noqa: E402
+from synthetic_law import LAW_PROFILES, write_fixtures  # noqa: E402
+
+REPEAT = 20
+
+
+def decoders():
+    """단계 이름 → (response → 파싱 결과)"""
+    def text_detect(response):
+        # charset 없는 응답: requests가 본문으로 문자셋을 추정 (response.text 호출마다)
+        response.encoding = None
+        return json.loads(response.text)
+
+    stages = {
+        'text_json': lambda response: json.loads(response.text),
+        'text_detect': text_detect,
+        'response_json': lambda response: response.json(),
+        'bytes_json': lambda response: loads_stdlib(response.content),
+    }
+    if orjson is not None:
+        stages['bytes_orjson'] = lambda response: orjson.loads(response.content)
+    stages['loads'] = lambda response: loads(response.content)
+    return stages
+
+
+def bench_law(session, base_url: str, name: str, mst: str, repeat: int):
+    """법령 하나의 디코딩 경로별 측정 (응답은 한 번만 받음)"""
+    params = {'OC': 'benchuser', 'target': 'law', 'MST': mst, 'type': 'JSON'}
+    response = request_with_retry(session, f"{base_url}/lawService.do", params,
+                                  RateLimiter(0), RetryPolicy(max_retries=0), 30.0)
+    if response.status_code != 200:
+        raise RuntimeError(f"HTTP {response.status_code} ({name})")
+    size = len(response.content)
+    charset = response.encoding
+
+    records = []
+    expected = None
+    for stage, decode in decoders().items():
+        def run(resp):
+            resp.encoding = charset
+            return decode(resp)
+
+        timings, peak, data = measure(run, response, repeat)
+        if expected is None:
+            expected = data
+        elif data != expected:
+            raise RuntimeError(f"{stage} 결과가 다릅니다 ({name})")
+        records.append(summarize(stage, name, timings, peak, size))
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON 응답 디코딩 경로 벤치마크")
+    parser.add_argument('--fixtures', help="재생 서버 픽스처 폴더 (없으면 합성 세법 픽스처를 임시 생성)")
+    parser.add_argument('--laws', nargs='*', help=f"법령명 또는 MST (기본: {', '.join(BENCH_LAWS)})")
+    parser.add_argument('--repeat', type=int, default=REPEAT, help="경로별 반복 횟수")
+    parser.add_argument('--output', help="결과 JSON 경로")
+    parser.add_argument('--compare', help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    repeat = max(1, args.repeat)
+    names = args.laws or BENCH_LAWS
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        fixtures = args.fixtures
+        if not fixtures:
+            fixtures = os.path.join(work_dir, 'fixtures')
+            write_fixtures(fixtures, [name for name in names if name in LAW_PROFILES] or BENCH_LAWS)
+
+        server = start_replay_server(fixtures)
+        session = create_session()
+        report = {
+            'benchmark': 'json_decode',
+            'started_at': datetime.now().isoformat(timespec='seconds'),
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'params': {'repeat': repeat, 'fixtures': args.fixtures or 'synthetic', 'backend': BACKEND},
+            'results': [],
+        }
+
+        print("=" * 78)
+        print(f"📊 JSON 응답 디코딩 벤치마크 (반복 {repeat}회, loads 백엔드: {BACKEND})")
+        print("=" * 78)
+        try:
+            for name, mst in resolve_msts(server, names):
+                report['results'].extend(bench_law(session, server.base_url, name, mst, repeat))
+        finally:
+            session.close()
+            server.shutdown()
+            server.server_close()
+
+    if not report['results']:
+        print("❌ 측정할 법령이 없습니다.")
+        sys.exit(1)
+
+    print_report(report['results'], baseline)
+    print(f"\n💾 {save_report(report, args.output)} 저장 완료")
+
+
+if __name__ == "__main__":
+    main()
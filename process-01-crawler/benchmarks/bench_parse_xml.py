@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+법령 상세 XML 구조화 파싱 벤치마크
+Version 1.0.0 (2026-10-17)
+- 이전 구현 (findall('.//...') 하위 전체 검색 + 필드별 find) vs
+  현재 구현 (law_xml_stream.build_law_detail, 한 번 순회)
+- 큰 세법(조세특례제한법, 소득세법, 법인세법) 기준
+
+사용법 (process-01-crawler 폴더에서):
+    python benchmarks/bench_parse_xml.py                 # 합성 법령
+    python benchmarks/bench_parse_xml.py 조특법.xml ...   # 실제 응답 파일
+"""
+
+import os
+import statistics
+import sys
+import time
+import xml.etree.ElementTree as ET
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from law_xml_stream import build_law_detail  # noqa: E402
+from synthetic_law import build_law, law_to_xml  # noqa: E402
+
+BENCH_LAWS = ['조세특례제한법', '소득세법', '법인세법']
+REPEAT = 5
+
+
+def legacy_extract(root: ET.Element, article_tag: str = '조문') -> Dict:
+    """이전 AdvancedLawAPIClient.parse_law_detail_xml의 추출 단계 (비교용 사본)"""
+    result = {'기본정보': {}, '조문': [], '부칙': [], '별표': [], '개정문': None, '제개정이유': None}
+
+    basic_fields = [
+        '법령ID', '법령명_한글', '법령명_한자', '법령명약칭',
+        '공포일자', '공포번호', '시행일자', '소관부처',
+        '제개정구분', '소관부처명', '부서명', '부서연락처'
+    ]
+    for field in basic_fields:
+        elem = root.find(f'.//{field}')
+        if elem is not None and elem.text:
+            result['기본정보'][field] = elem.text
+
+    for article in root.findall(f'.//{article_tag}'):
+        article_info = {}
+        for field in ['조문번호', '조문가지번호', '조문제목', '조문내용',
+                      '조문시행일자', '조문제개정유형', '조문변경여부']:
+            elem = article.find(field)
+            if elem is not None and elem.text:
+                article_info[field] = elem.text
+
+        article_info['항'] = []
+        for para in article.findall('.//항'):
+            para_info = {}
+            for field in ['항번호', '항내용', '항제개정유형']:
+                elem = para.find(field)
+                if elem is not None and elem.text:
+                    para_info[field] = elem.text
+            para_info['호'] = []
+            for item in para.findall('.//호'):
+                item_info = {}
+                for field in ['호번호', '호내용']:
+                    elem = item.find(field)
+                    if elem is not None and elem.text:
+                        item_info[field] = elem.text
+                if item_info:
+                    para_info['호'].append(item_info)
+            if para_info:
+                article_info['항'].append(para_info)
+        if article_info:
+            result['조문'].append(article_info)
+
+    for addendum in root.findall('.//부칙'):
+        add_info = {}
+        for field in ['부칙공포일자', '부칙공포번호', '부칙내용']:
+            elem = addendum.find(field)
+            if elem is not None and elem.text:
+                add_info[field] = elem.text
+        if add_info:
+            result['부칙'].append(add_info)
+
+    return result
+
+
+def count_nodes(parsed) -> Tuple[int, int, int]:
+    """(조문, 항, 호) 개수 (Law 모델은 to_dict()로 같은 형식 변환)"""
+    if not isinstance(parsed, dict):
+        parsed = parsed.to_dict()
+    articles = parsed.get('조문', [])
+    paragraphs = [p for a in articles for p in a.get('항', [])]
+    items = [h for p in paragraphs for h in p.get('호', [])]
+    return len(articles), len(paragraphs), len(items)
+
+
+def time_call(func: Callable, arg, repeat: int = REPEAT) -> Tuple[float, object]:
+    """중앙값(초)과 마지막 결과"""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(arg)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def load_inputs(paths: List[str]) -> List[Tuple[str, bytes]]:
+    if paths:
+        inputs = []
+        for path in paths:
+            with open(path, 'rb') as f:
+                inputs.append((os.path.basename(path), f.read()))
+        return inputs
+    return [(name, law_to_xml(build_law(name))) for name in BENCH_LAWS]
+
+
+def main():
+    inputs = load_inputs(sys.argv[1:])
+    extractors = [
+        ('이전 구현 (.//조문)', legacy_extract),
+        ('이전 구현 (.//조문단위)', lambda root: legacy_extract(root, '조문단위')),
+        ('현재 구현 (한 번 순회)', build_law_detail),
+    ]
+
+    print("=" * 78)
+    print(f"📊 법령 상세 XML 구조화 파싱 벤치마크 (중앙값, 반복 {REPEAT}회)")
+    print("=" * 78)
+    print("※ 트리 생성(ET.fromstring)은 모든 구현이 같으므로 따로 표시하고,")
+    print("  아래 시간은 트리 → 구조화 데이터 추출 단계만 측정")
+
+    for name, xml_content in inputs:
+        tree_time, root = time_call(ET.fromstring, xml_content)
+        print(f"\n📋 {name} ({len(xml_content):,} bytes, 트리 생성 {tree_time * 1000:.1f} ms)")
+        baseline = None
+        for label, func in extractors:
+            elapsed, parsed = time_call(func, root)
+            n_articles, n_paragraphs, n_items = count_nodes(parsed)
+            if baseline is None:
+                baseline = elapsed
+            print(f"  {label:20s} {elapsed * 1000:8.1f} ms  x{baseline / elapsed:5.2f}  "
+                  f"(전체 {(tree_time + elapsed) * 1000:6.1f} ms)  "
+                  f"조문 {n_articles:4d} / 항 {n_paragraphs:5d} / 호 {n_items:5d}")
+
+
+if __name__ == "__main__":
+    main()
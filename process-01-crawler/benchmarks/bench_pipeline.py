@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+법령 상세 처리 파이프라인 벤치마크
+Version 1.0.0 (2026-10-17)
+- 단계별 측정: 조회(로컬 재생 서버) → 파싱(JSON/XML) → sanitize_data → 구조화(Law) → 저장
+- 단계마다 처리량(ops/s, MB/s), p50/p99 지연, tracemalloc 최대 메모리
+- 결과를 커밋 해시와 함께 JSON으로 저장 (benchmarks/results/), --compare로 이전 결과와 비교
+- 큰 세법(조세특례제한법, 소득세법, 법인세법) 기준, 인터넷 연결 불필요
+- JSON 파싱은 클라이언트와 같은 경로 (law_json_decode.loads, 사용한 백엔드를 결과에 기록)
+- 구조화는 기존 law_from_json과 스키마 디코더(law_schema.decode_law)를 함께 측정
+
+사용법 (process-01-crawler 폴더에서):
+    python benchmarks/bench_pipeline.py                           # 합성 세법 픽스처
+    python benchmarks/bench_pipeline.py --fixtures _cache/detail_cache --laws 268611
+    python benchmarks/bench_pipeline.py --latency-ms 80 --repeat 20
+    python benchmarks/bench_pipeline.py --compare benchmarks/results/이전결과.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from law_api_ratelimit import RateLimiter, RetryPolicy  # noqa: E402
+from law_api_replay import ReplayOptions, start_replay_server  # noqa: E402
+from law_api_sanitize import sanitize_data  # noqa: E402
+from law_api_session import create_session, request_with_retry  # noqa: E402
+from law_json_decode import BACKEND, loads  # noqa: E402
+from law_model import law_from_json  # noqa: E402
+from law_schema import decode_law  # noqa: E402
+from law_xml_stream import build_law_detail  # noqa: E402
+from synthetic_law import LAW_PROFILES, write_fixtures  # noqa: E402
+
+BENCH_LAWS = ['조세특례제한법', '소득세법', '법인세법']
+REPEAT = 10
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+# sanitize_data에 넘길 이메일 ID (마스킹 분기까지 실행되도록 임의 값)
+EMAIL_ID = 'benchuser'
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """q(0~100) 백분위수 (최근접 순위, 표본이 적어도 실제 측정값 반환)"""
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * q // 100))
+    return ordered[int(rank) - 1]
+
+
+def measure(func: Callable, arg, repeat: int) -> Tuple[List[float], float, object]:
+    """
+    repeat회 실행 시간(초) 목록, 최대 메모리(bytes), 마지막 결과
+
+    tracemalloc은 실행을 느리게 하므로 시간 측정과 별도로 한 번 더 실행해 메모리만 잼
+    """
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(arg)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func(arg)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return timings, peak, result
+
+
+def summarize(stage: str, law: str, timings: List[float], peak: int, size: int) -> Dict:
+    """측정값 → 결과 레코드 한 건"""
+    total = sum(timings)
+    return {
+        'stage': stage,
+        'law': law,
+        'bytes': size,
+        'runs': len(timings),
+        'p50_ms': percentile(timings, 50) * 1000,
+        'p99_ms': percentile(timings, 99) * 1000,
+        'mean_ms': total / len(timings) * 1000,
+        'ops_per_s': len(timings) / total if total > 0 else 0.0,
+        'mb_per_s': size * len(timings) / total / 1e6 if total > 0 else 0.0,
+        'peak_kb': peak / 1024,
+    }
+
+
+def git_revision() -> Dict:
+    """현재 커밋 해시와 작업 트리 변경 여부 (git이 없으면 빈 값)"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                                    capture_output=True, text=True, check=True).stdout.strip())
+        return {'commit': commit, 'dirty': dirty}
+    except (OSError, subprocess.CalledProcessError):
+        return {'commit': None, 'dirty': None}
+
+
+def resolve_msts(server, names: List[str]) -> List[Tuple[str, str]]:
+    """법령명 또는 MST → (표시 이름, MST) (재생 서버 목록에서 조회)"""
+    items = server.store.search_items('law')
+    resolved = []
+    for name in names:
+        hit = next((item for item in items
+                    if name in (item.get('법령명한글'), item.get('법령일련번호'))), None)
+        if hit:
+            resolved.append((hit.get('법령명한글') or name, hit['법령일련번호']))
+        elif name.isdigit():
+            resolved.append((name, name))
+        else:
+            print(f"⚠️ 픽스처에 없는 법령: {name}")
+    return resolved
+
+
+def bench_law(session, base_url: str, name: str, mst: str, repeat: int, save_dir: str) -> List[Dict]:
+    """법령 하나의 단계별 측정"""
+    records = []
+    url = f"{base_url}/lawService.do"
+    # 재생 서버는 속도 제한 없이, 지연 주입 시에도 재시도 없이 측정
+    limiter, retry = RateLimiter(0), RetryPolicy(max_retries=0)
+
+    def fetch(output_type: str) -> bytes:
+        params = {'OC': EMAIL_ID, 'target': 'law', 'MST': mst, 'type': output_type}
+        response = request_with_retry(session, url, params, limiter, retry, 30.0)
+        if response.status_code != 200:
+            raise RuntimeError(f"HTTP {response.status_code} ({name}, {output_type})")
+        return response.content
+
+    bodies = {}
+    for output_type in ('JSON', 'XML'):
+        timings, peak, body = measure(fetch, output_type, repeat)
+        bodies[output_type] = body
+        records.append(summarize(f'fetch_{output_type.lower()}', name, timings, peak, len(body)))
+
+    json_body, xml_body = bodies['JSON'], bodies['XML']
+
+    timings, peak, json_data = measure(loads, json_body, repeat)
+    records.append(summarize('parse_json', name, timings, peak, len(json_body)))
+
+    timings, peak, xml_root = measure(ET.fromstring, xml_body, repeat)
+    records.append(summarize('parse_xml', name, timings, peak, len(xml_body)))
+
+    timings, peak, _ = measure(lambda data: sanitize_data(data, EMAIL_ID), json_data, repeat)
+    records.append(summarize('sanitize', name, timings, peak, len(json_body)))
+
+    timings, peak, law = measure(law_from_json, json_data, repeat)
+    records.append(summarize('structure_json', name, timings, peak, len(json_body)))
+
+    # 클라이언트의 parse_law_detail_json / parse_law_detail_xml과 같은 함수
+    timings, peak, _ = measure(decode_law, json_data, repeat)
+    records.append(summarize('structure_schema', name, timings, peak, len(json_body)))
+
+    timings, peak, _ = measure(build_law_detail, xml_root, repeat)
+    records.append(summarize('structure_xml', name, timings, peak, len(xml_body)))
+
+    # save_results와 같은 방식 (민감정보 제거 후 들여쓰기 JSON)
+    path = os.path.join(save_dir, f'{mst}.json')
+
+    def save(data: Dict) -> int:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(sanitize_data(data, EMAIL_ID), f, ensure_ascii=False, indent=2)
+        return os.path.getsize(path)
+
+    structured = law.to_dict()
+    timings, peak, size = measure(save, structured, repeat)
+    records.append(summarize('save', name, timings, peak, size))
+    return records
+
+
+def print_report(records: List[Dict], baseline: Optional[Dict] = None):
+    """결과 표 (baseline이 있으면 p50 변화율 표시)"""
+    base = {(r['stage'], r['law']): r for r in (baseline or {}).get('results', [])}
+    current_law = None
+    for record in records:
+        if record['law'] != current_law:
+            current_law = record['law']
+            print(f"\n📋 {current_law}")
+            print(f"  {'단계':16s} {'크기':>11s} {'p50 ms':>9s} {'p99 ms':>9s} "
+                  f"{'ops/s':>8s} {'MB/s':>8s} {'최대 KB':>10s}")
+        line = (f"  {record['stage']:16s} {record['bytes']:11,d} {record['p50_ms']:9.2f} "
+                f"{record['p99_ms']:9.2f} {record['ops_per_s']:8.1f} {record['mb_per_s']:8.1f} "
+                f"{record['peak_kb']:10,.0f}")
+        previous = base.get((record['stage'], record['law']))
+        if previous and previous['p50_ms'] > 0:
+            change = (record['p50_ms'] - previous['p50_ms']) / previous['p50_ms'] * 100
+            line += f"  {change:+6.1f}%"
+        print(line)
+
+
+def save_report(report: Dict, output: Optional[str]) -> str:
+    """결과 JSON 저장 (기본: results/<시각>_<커밋 앞 8자리>.json)"""
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        commit = (report['revision']['commit'] or 'nogit')[:8]
+        if report['revision']['dirty']:
+            commit += '-dirty'
+        output = os.path.join(RESULTS_DIR, f"{report['started_at'].replace(':', '')}_{commit}.json")
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description="법령 상세 처리 파이프라인 벤치마크")
+    parser.add_argument('--fixtures', help="재생 서버 픽스처 폴더 (없으면 합성 세법 픽스처를 임시 생성)")
+    parser.add_argument('--laws', nargs='*', help=f"법령명 또는 MST (기본: {', '.join(BENCH_LAWS)})")
+    parser.add_argument('--repeat', type=int, default=REPEAT, help="단계별 반복 횟수")
+    parser.add_argument('--latency-ms', type=float, default=0.0, help="재생 서버 응답 지연 (ms)")
+    parser.add_argument('--bandwidth-kbps', type=float, default=0.0, help="재생 서버 전송 속도 상한 (KB/s)")
+    parser.add_argument('--output', help="결과 JSON 경로")
+    parser.add_argument('--compare', help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    repeat = max(1, args.repeat)
+    names = args.laws or BENCH_LAWS
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        fixtures = args.fixtures
+        if not fixtures:
+            fixtures = os.path.join(work_dir, 'fixtures')
+            write_fixtures(fixtures, [name for name in names if name in LAW_PROFILES] or BENCH_LAWS)
+
+        options = ReplayOptions(latency_ms=args.latency_ms, bandwidth_kbps=args.bandwidth_kbps)
+        server = start_replay_server(fixtures, options=options)
+        session = create_session()
+        report = {
+            'benchmark': 'pipeline',
+            'started_at': datetime.now().isoformat(timespec='seconds'),
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'params': {'repeat': repeat, 'fixtures': args.fixtures or 'synthetic',
+                       'latency_ms': args.latency_ms, 'bandwidth_kbps': args.bandwidth_kbps,
+                       'json_backend': BACKEND},
+            'results': [],
+        }
+
+        print("=" * 78)
+        print(f"📊 법령 상세 처리 파이프라인 벤치마크 (반복 {repeat}회, 재생 서버 {server.base_url})")
+        print("=" * 78)
+        try:
+            for name, mst in resolve_msts(server, names):
+                report['results'].extend(bench_law(session, server.base_url, name, mst, repeat, work_dir))
+        finally:
+            session.close()
+            server.shutdown()
+            server.server_close()
+
+    if not report['results']:
+        print("❌ 측정할 법령이 없습니다.")
+        sys.exit(1)
+
+    print_report(report['results'], baseline)
+    print(f"\n💾 {save_report(report, args.output)} 저장 완료")
+
+
+if __name__ == "__main__":
+    main()
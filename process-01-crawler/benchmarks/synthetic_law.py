@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+벤치마크용 합성 법령 생성기
+Version 1.0.0 (2026-10-17)
+- lawService.do 응답과 같은 구조의 법령 상세 XML/JSON 생성
+- 실제 응답(_cache/detail_cache 등)이 없는 오프라인 환경용
+- 같은 이름/시드면 항상 같은 결과 (실행 간 비교 가능)
+- 로컬 재생 서버(law_api_replay)용 픽스처 생성
+  (시행일 법령 eflaw 목록은 실제 응답처럼 LawSearch/law 형식)
+
+사용법 (process-01-crawler 폴더에서):
+    python benchmarks/synthetic_law.py --out _fixtures/synthetic
+
+크기 프로필은 실제 세법의 대략적인 규모를 따름:
+    조세특례제한법 > 소득세법 > 법인세법 > 부가가치세법
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+from typing import Dict, List
+from xml.sax.saxutils import escape
+
+# 법령명 → (조문 수, 장 수, 법령ID, 법령일련번호)
+LAW_PROFILES = {
+    '조세특례제한법': (720, 12, '001584', '268600'),
+    '소득세법': (420, 10, '001565', '268601'),
+    '법인세법': (320, 9, '001563', '268611'),
+    '부가가치세법': (150, 10, '001571', '268602'),
+}
+
+CIRCLED = '①②③④⑤⑥⑦⑧⑨⑩⑪⑫⑬⑭⑮'
+GANADA = '가나다라마바사아자차카타파하'
+
+SENTENCES = [
+    '내국법인이 해당 사업연도에 지출한 금액은 대통령령으로 정하는 바에 따라 손금에 산입한다',
+    '제{ref}조제1항에 따른 과세표준은 각 사업연도의 소득에서 이월결손금을 공제한 금액으로 한다',
+    '같은 법 시행령 제{ref}조에서 정하는 요건을 갖춘 경우에는 그러하지 아니하다',
+    '「조세특례제한법」 제{ref}조에 따라 감면받은 세액은 납부할 세액에서 공제한다',
+    '납세지 관할 세무서장은 신고 내용에 오류 또는 누락이 있는 경우 이를 경정한다',
+    '이 조에서 규정한 사항 외에 필요한 사항은 기획재정부령으로 정한다',
+]
+
+
+def _sentence(rng: random.Random, n_articles: int) -> str:
+    return rng.choice(SENTENCES).format(ref=rng.randint(1, n_articles))
+
+
+def build_law(law_name: str, seed: int = 20250101) -> Dict:
+    """
+    합성 법령 데이터 생성 (XML/JSON 변환 전 공통 구조)
+
+    Returns:
+        {'기본정보': {...}, '조문': [조문단위 dict...], '부칙': [...]}
+    """
+    n_articles, n_chapters, law_id, mst = LAW_PROFILES.get(law_name, (200, 6, '999999', '999999'))
+    rng = random.Random(f"{law_name}:{seed}")
+
+    articles: List[Dict] = []
+    per_chapter = max(1, n_articles // n_chapters)
+    num = 0
+    for i in range(n_articles):
+        new_chapter = i % per_chapter == 0 and i // per_chapter < n_chapters
+        if new_chapter:
+            chapter = i // per_chapter + 1
+            articles.append({
+                '조문키': f"{num + 1:04d}000",
+                '조문번호': str(num + 1),
+                '조문여부': '전문',
+                '조문내용': f"제{chapter}장 {rng.choice(['총칙', '과세표준', '세액계산', '신고와 납부', '보칙'])}",
+            })
+            # 큰 장은 절로 한 번 더 나눔
+            if rng.random() < 0.5:
+                articles.append({
+                    '조문키': f"{num + 1:04d}000",
+                    '조문번호': str(num + 1),
+                    '조문여부': '전문',
+                    '조문내용': f"제1절 {rng.choice(['통칙', '익금', '손금', '세액공제'])}",
+                })
+
+        # 약 15%는 가지조문 (제N조의2)
+        branch = 0
+        if num and not new_chapter and rng.random() < 0.15:
+            branch = 2
+        else:
+            num += 1
+
+        paragraphs = []
+        for p in range(rng.randint(1, 6)):
+            items = []
+            if rng.random() < 0.5:
+                for h in range(rng.randint(1, 8)):
+                    subitems = []
+                    if rng.random() < 0.2:
+                        for m in range(rng.randint(1, 4)):
+                            subitems.append({
+                                '목번호': f"{GANADA[m]}.",
+                                '목내용': f"{GANADA[m]}. {_sentence(rng, n_articles)}",
+                            })
+                    items.append({
+                        '호번호': f"{h + 1}.",
+                        '호내용': f"{h + 1}. {_sentence(rng, n_articles)}",
+                        '목': subitems,
+                    })
+            paragraphs.append({
+                '항번호': CIRCLED[p],
+                '항내용': f"{CIRCLED[p]} {_sentence(rng, n_articles)}. {_sentence(rng, n_articles)}.",
+                '호': items,
+            })
+
+        title = rng.choice(['정의', '납세의무자', '과세소득의 범위', '세율', '세액공제', '신고', '가산세'])
+        label = f"제{num}조의{branch}" if branch else f"제{num}조"
+        articles.append({
+            '조문키': f"{num:04d}{branch:02d}1",
+            '조문번호': str(num),
+            '조문가지번호': str(branch) if branch else '',
+            '조문여부': '조문',
+            '조문제목': title,
+            '조문시행일자': rng.choice(['20240101', '20250101', '20250701']),
+            '조문내용': f"{label}({title})",
+            '항': paragraphs,
+        })
+
+    addenda = [{
+        '부칙키': f"2024123{i}",
+        '부칙공포일자': f"2024123{i}",
+        '부칙공포번호': str(20000 + i),
+        '부칙내용': f"부칙 <제{20000 + i}호, 2024. 12. 3{i}.>\n제1조(시행일) 이 법은 2025년 1월 1일부터 시행한다.",
+    } for i in range(2)]
+
+    return {
+        '법령키': f"{law_id}2024123120613",
+        '기본정보': {
+            '법령ID': law_id,
+            '법령명_한글': law_name,
+            '공포일자': '20241231',
+            '공포번호': '20613',
+            '시행일자': '20250101',
+            '소관부처': '기획재정부',
+            '제개정구분': '일부개정',
+        },
+        'MST': mst,
+        '조문': articles,
+        '부칙': addenda,
+    }
+
+
+def _xml_field(tag: str, value: str) -> str:
+    return f"<{tag}>{escape(value)}</{tag}>" if value else ''
+
+
+def law_to_xml(law: Dict) -> bytes:
+    """합성 법령 → lawService.do XML 응답 형식"""
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>', f'<법령 법령키="{law["법령키"]}">', '<기본정보>']
+    parts += [_xml_field(tag, value) for tag, value in law['기본정보'].items()]
+    parts.append('</기본정보><조문>')
+
+    for article in law['조문']:
+        parts.append(f'<조문단위 조문키="{article["조문키"]}">')
+        for tag in ('조문번호', '조문가지번호', '조문여부', '조문제목', '조문시행일자', '조문내용'):
+            parts.append(_xml_field(tag, article.get(tag, '')))
+        for para in article.get('항', []):
+            parts.append('<항>')
+            parts.append(_xml_field('항번호', para['항번호']))
+            parts.append(_xml_field('항내용', para['항내용']))
+            for item in para['호']:
+                parts.append('<호>')
+                parts.append(_xml_field('호번호', item['호번호']))
+                parts.append(_xml_field('호내용', item['호내용']))
+                for sub in item['목']:
+                    parts.append(f"<목>{_xml_field('목번호', sub['목번호'])}{_xml_field('목내용', sub['목내용'])}</목>")
+                parts.append('</호>')
+            parts.append('</항>')
+        parts.append('</조문단위>')
+
+    parts.append('</조문><부칙>')
+    for addendum in law['부칙']:
+        parts.append(f'<부칙단위 부칙키="{addendum["부칙키"]}">')
+        for tag in ('부칙공포일자', '부칙공포번호', '부칙내용'):
+            parts.append(_xml_field(tag, addendum[tag]))
+        parts.append('</부칙단위>')
+    parts.append('</부칙></법령>')
+
+    return ''.join(parts).encode('utf-8')
+
+
+def _one_or_list(items: List) -> object:
+    """DRF JSON처럼 항목이 하나면 dict, 여러 개면 list"""
+    return items[0] if len(items) == 1 else items
+
+
+def law_to_json(law: Dict) -> bytes:
+    """합성 법령 → lawService.do JSON 응답 형식"""
+    units = []
+    for article in law['조문']:
+        unit = {key: value for key, value in article.items() if key != '항' and value}
+        paragraphs = []
+        for para in article.get('항', []):
+            para_unit = {'항번호': para['항번호'], '항내용': para['항내용']}
+            items = []
+            for item in para['호']:
+                item_unit = {'호번호': item['호번호'], '호내용': item['호내용']}
+                if item['목']:
+                    item_unit['목'] = _one_or_list(item['목'])
+                items.append(item_unit)
+            if items:
+                para_unit['호'] = _one_or_list(items)
+            paragraphs.append(para_unit)
+        if paragraphs:
+            unit['항'] = _one_or_list(paragraphs)
+        units.append(unit)
+
+    data = {'법령': {
+        '법령키': law['법령키'],
+        '기본정보': law['기본정보'],
+        '조문': {'조문단위': units},
+        '부칙': {'부칙단위': law['부칙']},
+    }}
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+def search_item(law: Dict) -> Dict:
+    """합성 법령 → lawSearch.do 목록 항목"""
+    info = law['기본정보']
+    return {
+        '법령일련번호': law['MST'],
+        '법령명한글': info['법령명_한글'],
+        '법령약칭명': '',
+        '법령ID': info['법령ID'],
+        '공포일자': info['공포일자'],
+        '공포번호': info['공포번호'],
+        '제개정구분명': info['제개정구분'],
+        '시행일자': info['시행일자'],
+        '소관부처명': info['소관부처'],
+        '법령구분명': '법률',
+        '법령상세링크': f"/DRF/lawService.do?target=law&MST={law['MST']}&type=HTML",
+    }
+
+
+def write_fixtures(out_dir: str, law_names: List[str] = None, listing_size: int = 0, seed: int = 20250101):
+    """
+    재생 서버용 픽스처 생성
+
+    Args:
+        out_dir: 픽스처 폴더 (law_api_replay.FixtureStore 형식)
+        law_names: 상세(XML/JSON)까지 만들 법령 (기본 LAW_PROFILES 전체)
+        listing_size: 목록에만 추가할 항목 수 (페이지 순회 부하 시험용)
+    """
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from law_api_replay import FixtureStore
+
+    store = FixtureStore(out_dir)
+    items = []
+    for name in law_names or list(LAW_PROFILES):
+        law = build_law(name, seed)
+        store.add_detail('law', law['MST'], law_to_xml(law), 'XML')
+        store.add_detail('law', law['MST'], law_to_json(law), 'JSON')
+        store.add_detail('eflaw', law['MST'], law_to_json(law), 'JSON')
+        items.append(search_item(law))
+
+    for i in range(listing_size):
+        items.append({
+            '법령일련번호': str(900000 + i),
+            '법령명한글': f"합성조세법{i + 1}",
+            '법령ID': f"{800000 + i}",
+            '시행일자': '20250101',
+            '소관부처명': '기획재정부',
+            '법령구분명': '법률',
+        })
+
+    store.set_search_items('law', items)
+    # eflaw 목록은 항목 키가 대상 이름이 아닌 law (LawSearch/law)
+    store.set_search_items('eflaw', items, item_key='law')
+    return store
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 법령 픽스처 생성")
+    parser.add_argument('--out', default='_fixtures/synthetic', help="픽스처 폴더")
+    parser.add_argument('--listing-size', type=int, default=0, help="목록에만 추가할 항목 수")
+    parser.add_argument('laws', nargs='*', help=f"법령명 (기본: {', '.join(LAW_PROFILES)})")
+    args = parser.parse_args()
+
+    store = write_fixtures(args.out, args.laws or None, args.listing_size)
+    print(f"💾 {args.out} 픽스처 생성 완료 (상세 {len(store.detail.index)}건, "
+          f"목록 {len(store.search_items('law'))}건)")
+
+
+if __name__ == "__main__":
+    main()
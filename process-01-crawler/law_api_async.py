@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+법제처 Open API 비동기 클라이언트 (asyncio + aiohttp)
+Version 1.0.0 (2026-10-17)
+- 검색(lawSearch.do)/본문(lawService.do)을 코루틴으로 제공
+- 동시 요청 수 제한 (Semaphore), 요청별 타임아웃, 작업 취소 지원
+- 호출 속도 제한(RateLimiter), 재시도 정책(RetryPolicy), 상세 조회 캐시(LawDetailCache)는
+  동기 클라이언트와 공유
+- 비동기 웹 서비스에 스레드 없이 바로 포함 가능
+- JSON 응답은 바이트 그대로 파싱 (law_json_decode, orjson이 있으면 사용)
+- 목록 순회 실패 페이지는 끝에서 한 번 더 조회, 그래도 누락되면 IncompleteSearchError
+- 본문 응답은 검증 후 캐시 저장 (HTTP 200 오류 페이지 제외), 손상된 캐시 항목은 삭제 후 재조회
+
+필요 패키지: pip install aiohttp
+
+사용 예:
+    async with AsyncLawAPIClient.from_config(config) as client:
+        result = await client.search_law('법인세법')
+        mst = result['laws'][0]['법령일련번호']
+        articles = await client.get_articles(mst=mst, jo_nums=['005500', '005501'])
+"""
+
+import asyncio
+import json
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, Iterable, Optional
+
+try:
+    import aiohttp
+except ImportError:  # 비동기 클라이언트를 쓰지 않으면 필요 없음
+    aiohttp = None
+
+from law_api_cache import LawDetailCache, decode_detail, make_cache_key, DEFAULT_CACHE_DIR
+from law_api_ratelimit import (RETRY_STATUS, RateLimiter, RetryPolicy, create_rate_limiter,
+                               create_retry_policy, parse_retry_after)
+from law_api_search import MAX_DISPLAY, IncompleteSearchError, page_count, parse_search_response
+from law_json_decode import loads
+from law_api_session import DEFAULT_BASE_URL, DEFAULT_POOL_SIZE, DEFAULT_TIMEOUT, USER_AGENT
+
+DEFAULT_CONCURRENCY = 10
+
+
+class AsyncLawAPIClient:
+    """법제처 Open API 비동기 클라이언트 (async with 로 사용)"""
+
+    def __init__(self, email_id: str, base_url: str = DEFAULT_BASE_URL,
+                 max_concurrency: int = DEFAULT_CONCURRENCY, timeout: float = DEFAULT_TIMEOUT,
+                 rate_limiter: RateLimiter = None, retry_policy: RetryPolicy = None,
+                 detail_cache: LawDetailCache = None, pool_size: int = DEFAULT_POOL_SIZE):
+        """
+        Args:
+            email_id: 인증키(OC, 이메일 @ 앞부분)
+            max_concurrency: 동시에 진행할 최대 요청 수
+            timeout: 요청 하나의 최대 시간(초)
+            rate_limiter: 호출 속도 제한 (없으면 제한 없음)
+            retry_policy: 429/5xx/시간 초과 재시도 정책 (없으면 재시도 안 함)
+            detail_cache: 상세 조회 캐시 (없으면 캐시 안 함)
+            pool_size: 연결 풀 크기
+        """
+        if aiohttp is None:
+            raise ImportError("비동기 클라이언트에는 aiohttp가 필요합니다: pip install aiohttp")
+
+        self.email_id = email_id.split('@')[0]
+        self.base_url = base_url
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.detail_cache = detail_cache
+        self.pool_size = pool_size
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._session = None
+
+    @classmethod
+    def from_config(cls, config: Dict, **kwargs) -> 'AsyncLawAPIClient':
+        """API_law.yaml 설정으로 생성 (동기 클라이언트와 같은 키 사용)"""
+        detail_cache = None
+        if config.get('detail_cache', True):
+            detail_cache = LawDetailCache(config.get('cache_dir', DEFAULT_CACHE_DIR))
+
+        options = {
+            'base_url': config.get('base_url', DEFAULT_BASE_URL),
+            'max_concurrency': config.get('async_concurrency', DEFAULT_CONCURRENCY),
+            'timeout': config.get('request_timeout', DEFAULT_TIMEOUT),
+            'rate_limiter': create_rate_limiter(config),
+            'retry_policy': create_retry_policy(config),
+            'detail_cache': detail_cache,
+            'pool_size': config.get('http_pool_size') or DEFAULT_POOL_SIZE,
+        }
+        options.update(kwargs)
+        return cls(config.get('email_id', ''), **options)
+
+    async def open(self):
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={'User-Agent': USER_AGENT, 'Accept-Encoding': 'gzip, deflate'},
+            )
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def request(self, endpoint: str, params: Dict) -> Optional[bytes]:
+        """
+        요청 하나 (동시 요청 수/호출 속도 제한, 429/5xx/시간 초과 재시도 적용)
+
+        재시도 후에도 실패하면 None, 취소(CancelledError)는 그대로 전파
+        """
+        await self.open()
+        params = {'OC': self.email_id, **{k: v for k, v in params.items() if v not in (None, '')}}
+        url = f"{self.base_url}/{endpoint}"
+        target = params.get('target')
+        max_retries = self.retry_policy.max_retries if self.retry_policy else 0
+
+        async with self._semaphore:
+            for attempt in range(max_retries + 1):
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire_async(endpoint, target)
+
+                status, retry_after = None, None
+                try:
+                    async with self._session.get(url, params=params) as response:
+                        if response.status == 200:
+                            return await response.read()
+                        status = response.status
+                        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                    problem = f"HTTP {status}"
+                except asyncio.TimeoutError:
+                    problem = f"시간 초과 ({self.timeout}초)"
+                except aiohttp.ClientError as e:
+                    problem = f"연결 오류: {type(e).__name__}"
+
+                if (status is not None and status not in RETRY_STATUS) or attempt >= max_retries:
+                    print(f"❌ 요청 실패: {problem} ({endpoint}, {target})")
+                    return None
+
+                wait = self.retry_policy.delay(attempt, retry_after)
+                if status == 429 and self.rate_limiter:
+                    # 요청 과다: 다른 작업도 함께 멈춤
+                    self.rate_limiter.pause(wait, endpoint, target)
+                print(f"🔁 {endpoint} ({target}) {problem} → {wait:.1f}초 후 재시도 ({attempt + 1}/{max_retries})")
+                await asyncio.sleep(wait)
+
+    @staticmethod
+    def _decode(content: Optional[bytes], output_type: str) -> Optional[Any]:
+        if content is None:
+            return None
+        if output_type.upper() == 'JSON':
+            try:
+                return loads(content)
+            except json.JSONDecodeError as e:
+                print(f"❌ JSON 파싱 오류: {e}")
+                return None
+        return content.decode('utf-8')
+
+    async def search(self, target: str, query: str = None, output_type: str = 'JSON',
+                     display: int = 20, page: int = 1, **params) -> Optional[Any]:
+        """
+        목록 조회 (lawSearch.do)
+
+        Args:
+            target: 검색 대상 (law, prec, expc, admr, lawterm ...)
+            params: 대상별 추가 파라미터 (예: prec의 curt, org)
+        """
+        content = await self.request('lawSearch.do', {
+            'target': target, 'type': output_type, 'query': query,
+            'display': display, 'page': page, **params,
+        })
+        return self._decode(content, output_type)
+
+    async def service(self, target: str, output_type: str = 'JSON', law_info: Dict = None,
+                      **params) -> Optional[Any]:
+        """
+        본문 조회 (lawService.do, 캐시 우선)
+
+        Args:
+            target: 조회 대상 (law, prec, expc, admr, lsHistory ...)
+            law_info: 검색 결과 항목 (시행일자/공포일자로 캐시 만료 판단)
+            params: ID, MST, JO, LANG 등
+        """
+        cache_key = make_cache_key(target, mst=params.get('MST'), law_id=params.get('ID'),
+                                   jo=params.get('JO'), lang=params.get('LANG'), output_type=output_type,
+                                   ef_yd=params.get('efYd'))
+        if self.detail_cache:
+            # 파일 입출력은 이벤트 루프 밖에서
+            cached = await asyncio.to_thread(self.detail_cache.get, cache_key, law_info)
+            if cached is not None:
+                try:
+                    return decode_detail(cached, output_type, target)
+                except ValueError as e:
+                    # 손상된 항목은 지우고 다시 조회
+                    print(f"⚠️ 캐시 항목 손상, 다시 조회 ({target}): {e}")
+                    self.detail_cache.remove(cache_key)
+
+        content = await self.request('lawService.do', {'target': target, 'type': output_type, **params})
+        if content is None:
+            return None
+        try:
+            data = decode_detail(content, output_type, target)
+        except ValueError as e:
+            # HTTP 200 오류 페이지 등은 캐시에 저장하지 않음
+            print(f"❌ 응답 형식 오류 (lawService.do, {target}): {e}")
+            return None
+        if self.detail_cache:
+            await asyncio.to_thread(self.detail_cache.put, cache_key, content, law_info)
+        return data
+
+    async def iter_search(self, query: Optional[str], target: str = 'law', display: int = MAX_DISPLAY,
+                          max_pages: int = None, item_key: str = None, **params) -> AsyncIterator[Dict]:
+        """
+        목록 조회 전체 페이지 순회 (첫 페이지의 totalCnt로 나머지 페이지를 동시 조회)
+
+        동시에 max_concurrency 페이지만 진행하고 도착하는 순서대로 항목을 yield,
+        순회를 중단하면 남은 페이지 요청은 취소됨
+        (item_key: 목록 항목 키가 대상 이름과 다를 때 지정, eflaw → 'law')
+
+        사용 예:
+            async for law in client.iter_search('조세'):
+                ...
+
+        Raises:
+            IncompleteSearchError: 실패 페이지를 한 번 더 조회해도 받지 못함 (첫 페이지 실패 포함)
+        """
+        display = max(1, min(display, MAX_DISPLAY))
+        data = await self.search(target, query, display=display, page=1, **params)
+        if data is None:
+            data = await self.search(target, query, display=display, page=1, **params)
+        if data is None:
+            raise IncompleteSearchError(target, query, [1])
+
+        first = parse_search_response(data, target, item_key)
+        total_pages = page_count(first['total_count'], display, max_pages)
+        for item in first['items']:
+            yield item
+
+        remaining = iter(range(2, total_pages + 1))
+        pending: Dict[asyncio.Future, int] = {}
+        failed = []
+
+        def schedule(page: int):
+            task = asyncio.ensure_future(self.search(target, query, display=display, page=page, **params))
+            pending[task] = page
+
+        for page in islice(remaining, self.max_concurrency):
+            schedule(page)
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    page = pending.pop(task)
+                    for next_page in islice(remaining, 1):
+                        schedule(next_page)
+
+                    data = task.result()
+                    if data is None:
+                        failed.append(page)
+                        continue
+                    for item in parse_search_response(data, target, item_key)['items']:
+                        yield item
+        finally:
+            for task in pending:
+                task.cancel()
+
+        # 실패 페이지는 마지막에 한 번 더 (일시적인 장애가 지나갔을 수 있음)
+        missing = []
+        if failed:
+            print(f"🔁 '{query or target}' 실패 페이지 재조회: {sorted(failed)}")
+        for page in sorted(failed):
+            data = await self.search(target, query, display=display, page=page, **params)
+            if data is None:
+                missing.append(page)
+                continue
+            for item in parse_search_response(data, target, item_key)['items']:
+                yield item
+
+        if missing:
+            raise IncompleteSearchError(target, query, missing, total_pages)
+
+    async def search_law(self, query: str, display: int = 20, page: int = 1) -> Optional[Dict]:
+        """법령 검색 → {'total_count', 'laws'} (동기 클라이언트와 같은 형식)"""
+        data = await self.search('law', query, display=display, page=page)
+        if data is None:
+            return None
+        parsed = parse_search_response(data, 'law')
+        return {'total_count': parsed['total_count'], 'laws': parsed['items']}
+
+    async def get_law_detail(self, law_id: str = None, mst: str = None, output_type: str = 'JSON',
+                             jo_num: str = None, lang: str = None, law_info: Dict = None) -> Optional[Any]:
+        """
+        법령 본문 조회
+
+        Args:
+            law_id: 법령 ID (ID 또는 MST 중 하나는 필수)
+            mst: 법령일련번호
+            jo_num: 조번호 6자리 (조번호 4자리 + 가지번호 2자리, 예: 005501 = 제55조의1)
+            lang: 언어 (KO=한글, ORI=원문)
+        """
+        if not law_id and not mst:
+            print("❌ law_id 또는 mst 중 하나는 필수입니다")
+            return None
+        return await self.service('law', output_type, law_info=law_info,
+                                  ID=law_id, MST=mst, JO=jo_num, LANG=lang)
+
+    async def get_articles(self, jo_nums: Iterable[str], law_id: str = None, mst: str = None,
+                           output_type: str = 'JSON', lang: str = None) -> Dict[str, Any]:
+        """
+        여러 조문 동시 조회 → {조번호: 응답 (실패 시 None)}
+
+        호출한 작업이 취소되면 진행 중인 조회도 모두 취소됨
+        """
+        jo_nums = list(dict.fromkeys(jo_nums))
+        results = await asyncio.gather(*(
+            self.get_law_detail(law_id, mst, output_type, jo_num=jo, lang=lang) for jo in jo_nums
+        ))
+        return dict(zip(jo_nums, results))
+
+    async def search_precedents(self, query: str, display: int = 20, page: int = 1, **params) -> Optional[Any]:
+        """판례 목록 (prec)"""
+        return await self.search('prec', query, display=display, page=page, **params)
+
+    async def get_precedent(self, prec_id: str, output_type: str = 'JSON') -> Optional[Any]:
+        """판례 본문 (prec)"""
+        return await self.service('prec', output_type, ID=prec_id)
+
+    async def search_interpretations(self, query: str, display: int = 20, page: int = 1) -> Optional[Any]:
+        """법령해석례 목록 (expc)"""
+        return await self.search('expc', query, display=display, page=page)
+
+    async def get_interpretation(self, expc_id: str, output_type: str = 'JSON') -> Optional[Any]:
+        """법령해석례 본문 (expc)"""
+        return await self.service('expc', output_type, ID=expc_id)
+
+    async def search_admin_appeals(self, query: str, display: int = 20, page: int = 1) -> Optional[Any]:
+        """행정심판례 목록 (admr)"""
+        return await self.search('admr', query, display=display, page=page)
+
+    async def get_admin_appeal(self, admr_id: str, output_type: str = 'JSON') -> Optional[Any]:
+        """행정심판례 본문 (admr)"""
+        return await self.service('admr', output_type, ID=admr_id)
+
+    async def search_terms(self, query: str, display: int = 20, page: int = 1) -> Optional[Any]:
+        """법령용어 목록 (lawterm)"""
+        return await self.search('lawterm', query, display=display, page=page)
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+법령 상세 응답 디스크 캐시
+Version 1.0.0 (2026-10-17)
+- lawService.do 응답을 (target, MST/ID, JO, LANG, type) 키로 저장
+- 본문은 SHA-256 기반 content-addressed blob으로 중복 없이 저장
+- 검색 결과의 시행일자/공포일자로 만료 여부 판단
+- 판례/해석례/재결례처럼 ID가 바뀌지 않는 문서는 만료 없음
+- 인덱스 저장 주기 설정 (save_every, 대량 수집 시 매 저장마다 index.json 전체를 다시 쓰지 않음)
+- 저장 전 응답 검증 (decode_detail: JSON은 파싱, XML은 최상위 태그 확인)
+  → HTTP 200으로 오는 오류 HTML 페이지가 캐시에 남지 않음, 손상된 항목은 remove()로 삭제 후 재조회
+
+디렉토리 구조:
+    _cache/detail_cache/
+    ├── index.json              # 키 → blob 해시 + 메타데이터
+    └── blobs/ab/abcdef...      # 응답 본문 (해시 앞 2자리로 분산)
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, Optional
+
+from law_json_decode import loads
+
+DEFAULT_CACHE_DIR = '_cache/detail_cache'
+
+# ID 조회는 "현행 법령"을 가리키므로 날짜 정보 없이는 이 시간까지만 신뢰
+DEFAULT_ID_MAX_AGE = 24 * 60 * 60
+
+# 만료 판단에 사용하는 검색 결과 필드
+DATE_FIELDS = ('시행일자', '공포일자')
+
+# ID가 한 번 정해지면 내용이 바뀌지 않는 문서 (판례, 법령해석례, 행정심판례)
+IMMUTABLE_TARGETS = frozenset(('prec', 'expc', 'admr'))
+
+# 응답 본문에 포함될 수 있는 인증키(OC) 파라미터
+OC_PARAM_PATTERN = re.compile(rb'([?&])OC=[^&"\'\s<]*&?')
+
+# 대상별 상세 XML 최상위 태그 (없는 대상은 HTML 페이지만 아니면 허용)
+DETAIL_XML_ROOTS = {'law': '법령', 'eflaw': '법령'}
+# 최상위 태그를 찾을 때 한 번에 읽는 크기
+ROOT_PEEK = 4096
+
+
+def make_cache_key(target: str = 'law', mst: str = None, law_id: str = None,
+                   jo: str = None, lang: str = None, output_type: str = 'XML', ef_yd: str = None) -> str:
+    """캐시 키 생성 (요청 파라미터 조합, efYd는 시행일 법령 조회에서만 붙임)"""
+    key = '|'.join([
+        f"target={target}",
+        f"MST={mst or ''}",
+        f"ID={law_id or ''}",
+        f"JO={jo or ''}",
+        f"LANG={lang or ''}",
+        f"type={output_type.upper()}",
+    ])
+    return f"{key}|efYd={ef_yd}" if ef_yd else key
+
+
+def xml_root_tag(content: bytes) -> Optional[str]:
+    """XML 최상위 태그 (문서 앞부분만 읽음, XML이 아니면 ET.ParseError)"""
+    parser = ET.XMLPullParser(events=('start',))
+    for offset in range(0, len(content), ROOT_PEEK):
+        parser.feed(content[offset:offset + ROOT_PEEK])
+        for _, element in parser.read_events():
+            return element.tag
+    return None
+
+
+def decode_detail(content: bytes, output_type: str, target: str = 'law') -> Any:
+    """
+    lawService.do 응답 검증 + 변환 (JSON → dict, XML/HTML → str)
+
+    law.go.kr은 잘못된 요청에도 HTTP 200 HTML 페이지를 돌려주므로 캐시에 저장하기 전과
+    캐시에서 읽은 뒤에 모두 사용
+
+    Raises:
+        ValueError: JSON이 아니거나, XML 최상위 태그가 대상의 상세 응답이 아님, 빈 응답
+    """
+    if not content or not content.strip():
+        raise ValueError("빈 응답")
+    output_type = output_type.upper()
+    if output_type == 'JSON':
+        data = loads(content)
+        if not isinstance(data, dict):
+            raise ValueError(f"JSON 객체가 아님 ({type(data).__name__})")
+        return data
+
+    text = content.decode('utf-8')
+    if output_type == 'XML':
+        try:
+            tag = xml_root_tag(content)
+        except ET.ParseError as e:
+            raise ValueError(f"XML 파싱 오류: {e}") from e
+        expected = DETAIL_XML_ROOTS.get(target)
+        if tag is None or tag.lower() == 'html' or (expected and tag != expected):
+            raise ValueError(f"XML 최상위 태그 <{tag}> (기대: <{expected or '상세 응답'}>)")
+    return text
+
+
+def is_valid_detail(content: bytes, output_type: str, target: str = 'law') -> bool:
+    """캐시에 저장해도 되는 응답인지 (decode_detail 참고)"""
+    try:
+        decode_detail(content, output_type, target)
+        return True
+    except ValueError:
+        return False
+
+
+class LawDetailCache:
+    """lawService.do 응답 캐시 (스레드 안전)"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, id_max_age: int = DEFAULT_ID_MAX_AGE,
+                 save_every: int = 1):
+        """
+        Args:
+            cache_dir: 캐시 폴더
+            id_max_age: MST 없이 ID로 조회한 현행 법령의 유효 시간(초)
+            save_every: put 몇 번마다 index.json을 저장할지 (1보다 크면 끝날 때 flush() 필요)
+        """
+        self.cache_dir = cache_dir
+        self.blob_dir = os.path.join(cache_dir, 'blobs')
+        self.index_file = os.path.join(cache_dir, 'index.json')
+        self.id_max_age = id_max_age
+        self.save_every = max(1, save_every)
+        self._lock = threading.Lock()
+        self._unsaved = 0
+        self.index = self.load_index()
+
+    def load_index(self) -> Dict:
+        """인덱스 파일 로드 (없거나 손상되면 빈 인덱스)"""
+        if not os.path.exists(self.index_file):
+            return {}
+
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️ 캐시 인덱스 읽기 오류 (새로 시작): {e}")
+            return {}
+
+    def save_index(self):
+        """인덱스 저장 (임시 파일 → 교체로 원자적 저장)"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_file = f"{self.index_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, ensure_ascii=False)
+        os.replace(tmp_file, self.index_file)
+
+    def blob_path(self, digest: str) -> str:
+        """blob 해시 → 파일 경로"""
+        return os.path.join(self.blob_dir, digest[:2], digest)
+
+    def is_stale(self, key: str, entry: Dict, law_info: Dict = None) -> bool:
+        """
+        만료 여부 판단
+
+        - 검색 결과의 시행일자/공포일자가 저장 당시와 다르면 만료
+        - MST(법령일련번호)는 특정 버전을 가리키므로 날짜가 같으면 유효
+        - MST 없이 ID로 조회한 현행 법령은 날짜 정보가 없으면 id_max_age까지만 유효
+        - 판례/해석례/재결례(IMMUTABLE_TARGETS)는 만료 없음
+        """
+        if key.split('|', 1)[0][len('target='):] in IMMUTABLE_TARGETS:
+            return False
+
+        dates_checked = False
+        if law_info:
+            for field in DATE_FIELDS:
+                current = law_info.get(field)
+                saved = entry.get(field)
+                if current and saved:
+                    if current != saved:
+                        return True
+                    dates_checked = True
+
+        if 'MST=|' in key and not dates_checked:
+            return time.time() - entry.get('saved_at', 0) > self.id_max_age
+
+        return False
+
+    def get_path(self, key: str, law_info: Dict = None) -> Optional[str]:
+        """캐시된 blob 파일 경로 (없거나 만료되면 None, 스트리밍 읽기용)"""
+        with self._lock:
+            entry = self.index.get(key)
+
+        if not entry or self.is_stale(key, entry, law_info):
+            return None
+
+        path = self.blob_path(entry['blob'])
+        return path if os.path.exists(path) else None
+
+    def get(self, key: str, law_info: Dict = None) -> Optional[bytes]:
+        """캐시 조회 (없거나 만료되면 None)"""
+        path = self.get_path(key, law_info)
+        if not path:
+            return None
+
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def put(self, key: str, content: bytes, law_info: Dict = None) -> str:
+        """
+        캐시 저장
+
+        Returns:
+            blob 해시 (동일 본문은 같은 blob 공유)
+        """
+        content = OC_PARAM_PATTERN.sub(rb'\1', content)
+        digest = hashlib.sha256(content).hexdigest()
+        path = self.blob_path(digest)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+
+        entry = {
+            'blob': digest,
+            'size': len(content),
+            'saved_at': time.time(),
+        }
+        if law_info:
+            for field in DATE_FIELDS:
+                if law_info.get(field):
+                    entry[field] = law_info[field]
+
+        with self._lock:
+            self.index[key] = entry
+            self._unsaved += 1
+            if self._unsaved >= self.save_every:
+                self.save_index()
+                self._unsaved = 0
+
+        return digest
+
+    def remove(self, key: str):
+        """항목 삭제 (손상된 응답, blob은 다른 키와 공유할 수 있어 남김)"""
+        with self._lock:
+            if self.index.pop(key, None) is None:
+                return
+            self._unsaved += 1
+            if self._unsaved >= self.save_every:
+                self.save_index()
+                self._unsaved = 0
+
+    def flush(self):
+        """저장하지 않은 인덱스 변경 저장 (save_every > 1일 때)"""
+        with self._lock:
+            if self._unsaved:
+                self.save_index()
+                self._unsaved = 0
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+법제처 Open API 대상별 대량 수집기 (판례/해석례/재결례/연혁/위임법령)
+Version 1.0.0 (2026-10-17)
+- 대상(target)마다 작업을 따로 구성: 검색어, 동시 작업 수, 호출 속도, 최대 페이지
+- 대상별 파이프라인: 목록 전체 페이지 순회 → 대기열(크기 제한) → 본문 조회 작업자 N개
+- 모든 대상이 하나의 비동기 클라이언트(연결 풀, 전역 속도 제한, 재시도)를 공유
+- 본문은 법령과 같은 상세 조회 캐시(_cache/detail_cache)에 저장, 목록은 대상별 JSON Lines
+- 다시 실행하면 이미 받은 문서는 건너뜀 (목록 파일 + 캐시 기준)
+  (강제 종료로 캐시 인덱스에 저장되지 못한 문서는 목록에 있어도 다시 수집)
+- 재조회 후에도 받지 못한 목록 페이지는 검색어별로 기록 (통계의 '누락 페이지', 목록 불완전 표시)
+- 형식 검증에 실패한 본문(HTTP 200 오류 페이지 등)은 저장하지 않고 실패로 집계
+
+대상:
+    prec        판례          목록 prec       → 본문 prec (ID)
+    expc        법령해석례    목록 expc       → 본문 expc (ID)
+    admr        행정심판례    목록 admr       → 본문 admr (ID)
+    eflaw       시행일 법령   목록 eflaw      → 본문 eflaw (MST + efYd)
+    lsHistory   법령 연혁     목록 eflaw      → 본문 lsHistory (MST, HTML만 제공)
+                (eflaw 목록 응답은 LawSearch/law 형식 → 항목 키 'law')
+    lsDelegated 위임법령      목록 law        → 본문 lsDelegated (법령ID)
+    lawterm     법령용어      목록 lawterm    (본문 없음, 목록 항목 자체를 저장)
+
+API_law.yaml 예 (없으면 세법 기본 검색어로 수집):
+    corpus_targets:
+      prec: {queries: [법인세, 소득세], workers: 4, rate: 2, max_pages: 50, params: {search: 2}}
+      expc: {workers: 2}
+
+사용법 (process-01-crawler 폴더에서):
+    python law_api_crawler.py prec expc admr
+    python law_api_crawler.py prec --query 법인세 --max-pages 5 --workers 4
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from typing import Dict, List, Optional, Set
+
+import yaml
+
+from law_api_async import AsyncLawAPIClient
+from law_api_cache import LawDetailCache, is_valid_detail, make_cache_key, DEFAULT_CACHE_DIR
+from law_api_ratelimit import EndpointRateLimiter
+from law_api_search import IncompleteSearchError
+from law_api_sanitize import sanitize_data
+
+DEFAULT_OUT_DIR = '_cache/corpus_targets'
+
+# 세법 분야 기본 검색어
+DEFAULT_QUERIES = ('법인세', '소득세', '부가가치세', '상속세', '증여세', '국세기본', '조세특례', '종합부동산세')
+
+# 대상 → 목록/본문 조회 방법
+#   search: 목록 조회 target, id_field: 목록 항목의 식별자, id_param: 본문 조회 파라미터
+#   type: 본문 형식, date_param: (본문 파라미터, 목록 항목 필드) - eflaw의 efYd 등
+#   item_key: 목록 응답의 항목 키가 search와 다를 때 (eflaw 목록은 LawSearch/law 형식)
+TARGETS = {
+    'prec': {'name': '판례', 'search': 'prec', 'id_field': '판례일련번호', 'id_param': 'ID', 'type': 'JSON'},
+    'expc': {'name': '법령해석례', 'search': 'expc', 'id_field': '법령해석례일련번호', 'id_param': 'ID',
+             'type': 'JSON'},
+    'admr': {'name': '행정심판례', 'search': 'admr', 'id_field': '행정심판재결례일련번호', 'id_param': 'ID',
+             'type': 'JSON'},
+    'eflaw': {'name': '시행일 법령', 'search': 'eflaw', 'item_key': 'law', 'id_field': '법령일련번호',
+              'id_param': 'MST', 'type': 'JSON', 'date_param': ('efYd', '시행일자')},
+    'lsHistory': {'name': '법령 연혁', 'search': 'eflaw', 'item_key': 'law', 'id_field': '법령일련번호',
+                  'id_param': 'MST', 'type': 'HTML'},
+    'lsDelegated': {'name': '위임법령', 'search': 'law', 'id_field': '법령ID', 'id_param': 'ID', 'type': 'JSON'},
+    'lawterm': {'name': '법령용어', 'search': 'lawterm', 'id_field': '법령용어ID', 'id_param': None},
+}
+
+
+def item_id(spec: Dict, item: Dict) -> Optional[str]:
+    """목록 항목의 식별자 (없으면 id 필드로 대체)"""
+    value = item.get(spec['id_field']) or item.get('id')
+    return str(value) if value not in (None, '') else None
+
+
+def detail_params(spec: Dict, item: Dict) -> Dict:
+    """목록 항목 → lawService.do 파라미터"""
+    params = {spec['id_param']: item_id(spec, item)}
+    if spec.get('date_param'):
+        param, field = spec['date_param']
+        params[param] = item.get(field)
+    return params
+
+
+def detail_cache_key(target: str, spec: Dict, params: Dict) -> str:
+    return make_cache_key(target, mst=params.get('MST'), law_id=params.get('ID'),
+                          output_type=spec['type'], ef_yd=params.get('efYd'))
+
+
+class TargetJob:
+    """대상 하나의 수집 설정"""
+
+    def __init__(self, target: str, queries: List[str] = None, workers: int = 2,
+                 max_pages: int = None, rate: float = None, params: Dict = None, detail: bool = True):
+        """
+        Args:
+            target: TARGETS의 키
+            queries: 검색어 목록 (없으면 DEFAULT_QUERIES)
+            workers: 본문 조회 동시 작업 수
+            max_pages: 검색어별 최대 페이지 수 (페이지당 100건)
+            rate: 이 대상의 초당 요청 수 (없으면 전역 제한만 적용)
+            params: 목록 조회 추가 파라미터 (예: prec의 search=2, curt=대법원)
+            detail: False이면 목록만 수집
+        """
+        if target not in TARGETS:
+            raise ValueError(f"지원하지 않는 대상: {target} (가능: {', '.join(TARGETS)})")
+        self.target = target
+        self.spec = TARGETS[target]
+        self.queries = list(queries or DEFAULT_QUERIES)
+        self.workers = max(1, workers)
+        self.max_pages = max_pages
+        self.rate = rate
+        self.params = dict(params or {})
+        self.detail = detail and self.spec.get('id_param') is not None
+        self.stats = {'목록': 0, '중복': 0, '조회': 0, '캐시': 0, '실패': 0, '누락 페이지': 0}
+        # 목록을 끝까지 받지 못한 검색어 → 누락 페이지
+        self.incomplete: Dict[str, List[int]] = {}
+
+    @classmethod
+    def from_config(cls, target: str, options: Dict = None, **overrides) -> 'TargetJob':
+        """API_law.yaml의 corpus_targets 항목 + 명령행 옵션(None이 아닌 값만)"""
+        settings = dict(options or {})
+        settings.update({key: value for key, value in overrides.items() if value is not None})
+        return cls(target, **settings)
+
+
+class CorpusCrawler:
+    """여러 대상을 동시에 수집 (대상마다 목록 생산자 1개 + 본문 작업자 N개)"""
+
+    def __init__(self, client: AsyncLawAPIClient, jobs: List[TargetJob], out_dir: str = DEFAULT_OUT_DIR,
+                 queue_size: int = 200):
+        """
+        Args:
+            client: 비동기 클라이언트 (detail_cache 필수, 본문 저장소로 사용)
+            jobs: 대상별 수집 설정
+            out_dir: 대상별 목록 파일(<target>.jsonl) 폴더
+            queue_size: 대상별 대기열 크기 (목록이 본문 조회보다 너무 앞서가지 않게)
+        """
+        if client.detail_cache is None:
+            raise ValueError("수집기는 상세 조회 캐시(detail_cache)에 본문을 저장합니다")
+        self.client = client
+        self.jobs = jobs
+        self.out_dir = out_dir
+        self.queue_size = queue_size
+
+        # 대상별 호출 속도 (목록/본문 모두)
+        limiter = client.rate_limiter
+        for job in jobs:
+            if job.rate and isinstance(limiter, EndpointRateLimiter):
+                limiter.set_endpoint_rate(f"lawSearch.do:{job.spec['search']}", job.rate)
+                if job.detail:
+                    limiter.set_endpoint_rate(f"lawService.do:{job.target}", job.rate)
+
+    def listing_path(self, target: str) -> str:
+        return os.path.join(self.out_dir, f"{target}.jsonl")
+
+    def load_seen(self, target: str) -> Set[str]:
+        """
+        이전 실행에서 저장한 문서 식별자 (쓰다 만 줄은 무시)
+
+        캐시 인덱스는 save_every건마다 저장되므로 강제 종료되면 목록에는 있지만 인덱스에 없는 문서가
+        생길 수 있음 → 본문 캐시 키가 인덱스에 없는 항목은 받지 않은 것으로 보고 다시 수집
+        (같은 문서가 목록에 두 번 기록될 수 있음, 뒤의 줄이 최신)
+        """
+        seen = set()
+        missing = set()
+        index = self.client.detail_cache.index
+        path = self.listing_path(target)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        doc_id = record['_id']
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        continue
+                    if record.get('_cache_key') and record['_cache_key'] not in index:
+                        missing.add(doc_id)
+                    else:
+                        seen.add(doc_id)
+        missing -= seen
+        if missing:
+            print(f"⚠️ {target} 목록에는 있지만 본문 캐시에 없는 문서 {len(missing)}건 → 다시 수집")
+        return seen
+
+    def _ends_with_newline(self, target: str) -> bool:
+        with open(self.listing_path(target), 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+
+    async def run(self) -> Dict[str, Dict]:
+        """모든 대상 수집 → {대상: 통계}"""
+        os.makedirs(self.out_dir, exist_ok=True)
+        try:
+            await asyncio.gather(*(self.run_job(job) for job in self.jobs))
+        finally:
+            await asyncio.to_thread(self.client.detail_cache.flush)
+        return {job.target: job.stats for job in self.jobs}
+
+    async def run_job(self, job: TargetJob):
+        """대상 하나: 목록 생산자 → 대기열 → 본문 작업자"""
+        spec = job.spec
+        seen = self.load_seen(job.target)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        started = time.monotonic()
+        print(f"🚀 {spec['name']}({job.target}) 수집 시작: 검색어 {len(job.queries)}개, "
+              f"작업자 {job.workers}개, 이전 수집 {len(seen)}건")
+
+        with open(self.listing_path(job.target), 'a', encoding='utf-8') as listing:
+            if listing.tell() and not self._ends_with_newline(job.target):
+                # 쓰다 만 마지막 줄 뒤에 이어 쓰지 않도록 줄을 끊어 둠
+                listing.write('\n')
+            workers = [asyncio.ensure_future(self._worker(job, queue, listing)) for _ in range(job.workers)]
+            try:
+                for query in job.queries:
+                    try:
+                        async for item in self.client.iter_search(query, spec['search'], max_pages=job.max_pages,
+                                                                  item_key=spec.get('item_key'), **job.params):
+                            doc_id = item_id(spec, item)
+                            if doc_id is None or doc_id in seen:
+                                job.stats['중복'] += 1
+                                continue
+                            seen.add(doc_id)
+                            job.stats['목록'] += 1
+                            await queue.put((query, doc_id, item))
+                    except IncompleteSearchError as e:
+                        # 받은 항목은 계속 처리하고 누락 페이지는 통계에 남김 (다음 실행에서 다시 순회)
+                        job.incomplete[query] = e.failed_pages
+                        job.stats['누락 페이지'] += len(e.failed_pages)
+                        print(f"⚠️ {job.target} {e}")
+                for _ in workers:
+                    await queue.put(None)
+                await asyncio.gather(*workers)
+            finally:
+                for worker in workers:
+                    worker.cancel()
+
+        elapsed = time.monotonic() - started
+        stats = job.stats
+        print(f"✅ {spec['name']}({job.target}) 완료: 목록 {stats['목록']}건, 조회 {stats['조회']}건, "
+              f"캐시 {stats['캐시']}건, 실패 {stats['실패']}건 ({elapsed:.1f}초)")
+        if job.incomplete:
+            print(f"⚠️ {spec['name']}({job.target}) 목록 불완전: "
+                  + ', '.join(f"'{query}' {pages}" for query, pages in job.incomplete.items()))
+
+    async def _worker(self, job: TargetJob, queue: asyncio.Queue, listing):
+        while True:
+            entry = await queue.get()
+            if entry is None:
+                return
+            query, doc_id, item = entry
+            try:
+                await self._fetch(job, query, doc_id, item, listing)
+            except (OSError, ValueError) as e:
+                # 작업자가 죽으면 대기열이 막히므로 문서 단위로 실패 처리
+                job.stats['실패'] += 1
+                print(f"❌ {job.target} {doc_id} 저장 오류: {e}")
+
+    async def _fetch(self, job: TargetJob, query: str, doc_id: str, item: Dict, listing):
+        cache = self.client.detail_cache
+        record = {'_id': doc_id, '_query': query, **sanitize_data(item, self.client.email_id)}
+
+        if job.detail:
+            params = detail_params(job.spec, item)
+            key = detail_cache_key(job.target, job.spec, params)
+            if await asyncio.to_thread(cache.get_path, key, item):
+                job.stats['캐시'] += 1
+            else:
+                content = await self.client.request(
+                    'lawService.do', {'target': job.target, 'type': job.spec['type'], **params})
+                if content is None:
+                    # 목록에 기록하지 않아야 다음 실행에서 다시 시도
+                    job.stats['실패'] += 1
+                    return
+                if not await asyncio.to_thread(is_valid_detail, content, job.spec['type'], job.target):
+                    # HTTP 200 오류 페이지 등은 캐시/목록에 남기지 않음 (다음 실행에서 다시 시도)
+                    job.stats['실패'] += 1
+                    print(f"❌ {job.target} {doc_id} 응답 형식 오류")
+                    return
+                await asyncio.to_thread(cache.put, key, content, item)
+                job.stats['조회'] += 1
+            record['_cache_key'] = key
+
+        # 본문 저장이 끝난 문서만 목록에 기록 (줄 단위라 중간에 죽어도 앞부분은 유효)
+        listing.write(json.dumps(record, ensure_ascii=False) + '\n')
+        listing.flush()
+
+
+def load_config(config_file: str = 'API_law.yaml') -> Dict:
+    """API_law.yaml 로드 (없거나 읽을 수 없으면 빈 설정)"""
+    if not os.path.exists(config_file):
+        return {}
+    try:
+        with open(config_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+        if content.startswith('---'):
+            parts = content.split('---')
+            if len(parts) >= 3:
+                content = parts[2].strip()
+        return yaml.safe_load(content) or {}
+    except Exception as e:
+        print(f"❌ YAML 파일 읽기 오류: {e}")
+        return {}
+
+
+async def crawl(config: Dict, jobs: List[TargetJob], out_dir: str = DEFAULT_OUT_DIR) -> Dict[str, Dict]:
+    """설정으로 클라이언트를 만들어 수집 (캐시는 끄는 설정이 있어도 항상 사용)"""
+    cache = LawDetailCache(config.get('cache_dir', DEFAULT_CACHE_DIR), save_every=100)
+    async with AsyncLawAPIClient.from_config(config, detail_cache=cache) as client:
+        return await CorpusCrawler(client, jobs, out_dir).run()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="법제처 Open API 대상별 대량 수집")
+    parser.add_argument('targets', nargs='*', help=f"수집 대상 (기본: API_law.yaml의 corpus_targets 또는 "
+                                                   f"prec expc admr, 가능: {' '.join(TARGETS)})")
+    parser.add_argument('--query', action='append', help="검색어 (여러 번 지정 가능, 기본: 세법 검색어)")
+    parser.add_argument('--workers', type=int, help="대상별 본문 조회 동시 작업 수")
+    parser.add_argument('--max-pages', type=int, help="검색어별 최대 페이지 수 (페이지당 100건)")
+    parser.add_argument('--rate', type=float, help="대상별 초당 요청 수")
+    parser.add_argument('--list-only', action='store_true', help="본문 없이 목록만 수집")
+    parser.add_argument('--out', default=DEFAULT_OUT_DIR, help="목록 파일 폴더")
+    args = parser.parse_args()
+
+    config = load_config()
+    if not config.get('email_id') or config.get('email_id') == 'YOUR_EMAIL_ID_HERE':
+        print("⚠️ API_law.yaml 파일에 이메일 ID를 입력해주세요!")
+        return
+
+    target_options = config.get('corpus_targets') or {}
+    targets = args.targets or list(target_options) or ['prec', 'expc', 'admr']
+    jobs = [
+        TargetJob.from_config(target, target_options.get(target), queries=args.query, workers=args.workers,
+                              max_pages=args.max_pages, rate=args.rate,
+                              detail=False if args.list_only else None)
+        for target in targets
+    ]
+
+    summary = asyncio.run(crawl(config, jobs, args.out))
+
+    print("\n" + "=" * 60)
+    for target, stats in summary.items():
+        print(f"📊 {TARGETS[target]['name']}({target}): " + ', '.join(f"{k} {v}" for k, v in stats.items()))
+    print(f"📁 목록: {args.out}/<대상>.jsonl, 본문: {config.get('cache_dir', DEFAULT_CACHE_DIR)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+법령 가족(법률 + 시행령 + 시행규칙) 찾기
+Version 1.0.0 (2026-10-17)
+- 법령명 패턴: '법인세법' 검색 결과에 같이 나오는 '법인세법 시행령', '법인세법 시행규칙' (추가 요청 없음)
+- 위임법령(lsDelegated): 법률 조문이 위임한 하위법령의 법령일련번호 (이름이 다른 하위법령까지)
+- 찾은 항목은 검색 결과 항목과 같은 형식 ({'법령일련번호', '법령명한글', ...})
+
+사용 예 (client는 session/base_url/email_id/rate_limiter/retry_policy/timeout을 가진 클라이언트):
+    members = family_from_search('법인세법', search_result['laws'])
+    members += delegated_laws(fetch_delegated(client, parent['법령ID']))
+"""
+
+import re
+from typing import Any, Dict, Iterator, List, Optional
+
+from law_api_session import request_with_retry
+from law_json_decode import loads
+
+# 법률 이름 뒤에 붙는 하위법령 이름
+FAMILY_SUFFIXES = ('시행령', '시행규칙')
+
+
+def family_pattern(law_name: str) -> 're.Pattern':
+    """'법인세법' → '법인세법 시행령' / '법인세법 시행규칙' (띄어쓰기 유무 무관)"""
+    return re.compile(rf"^{re.escape(law_name)}\s*(?:{'|'.join(FAMILY_SUFFIXES)})$")
+
+
+def family_from_search(law_name: str, items: List[Dict]) -> List[Dict]:
+    """검색 결과 중 법령명 패턴에 맞는 시행령/시행규칙 (법령일련번호 중복 제거)"""
+    pattern = family_pattern(law_name)
+    members = {}
+    for item in items:
+        mst = item.get('법령일련번호')
+        if mst and mst not in members and pattern.match(item.get('법령명한글', '').strip()):
+            members[mst] = item
+    return list(members.values())
+
+
+def fetch_delegated(client, law_id: str) -> Optional[Dict]:
+    """
+    위임법령 조회 (lawService.do?target=lsDelegated, JSON)
+
+    Returns:
+        응답 JSON, 실패하면 None
+    """
+    params = {'OC': client.email_id, 'target': 'lsDelegated', 'type': 'JSON', 'ID': law_id}
+    try:
+        response = request_with_retry(client.session, f"{client.base_url}/lawService.do", params,
+                                      client.rate_limiter, client.retry_policy, client.timeout)
+        if response.status_code != 200:
+            print(f"❌ 위임법령 조회 실패 (ID: {law_id}): HTTP {response.status_code}")
+            return None
+        return loads(response.content)
+    except ValueError as e:
+        print(f"❌ 위임법령 JSON 파싱 오류 (ID: {law_id}): {e}")
+        return None
+    except Exception as e:
+        print(f"❌ 위임법령 요청 오류 (ID: {law_id}): {e}")
+        return None
+
+
+def _walk(value: Any) -> Iterator[Dict]:
+    """중첩된 dict/list 안의 모든 dict (응답 구조가 조문별로 깊게 중첩됨)"""
+    if isinstance(value, dict):
+        yield value
+        for child in value.values():
+            yield from _walk(child)
+    elif isinstance(value, list):
+        for child in value:
+            yield from _walk(child)
+
+
+def delegated_laws(data: Optional[Dict]) -> List[Dict]:
+    """
+    위임법령 응답 → 하위법령 목록 (검색 결과 항목 형식, 법령일련번호 중복 제거)
+
+    조문마다 반복되는 위임법령일련번호/위임법령제목만 모음 (위임행정규칙/위임자치법규는 제외)
+    """
+    members = {}
+    for node in _walk(data):
+        mst = node.get('위임법령일련번호')
+        if mst and str(mst) not in members:
+            members[str(mst)] = {
+                '법령일련번호': str(mst),
+                '법령명한글': str(node.get('위임법령제목', '')).strip(),
+                '위임구분': node.get('위임구분', ''),
+            }
+    return list(members.values())
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+대량 다운로드 작업 저널 (write-ahead log)
+Version 1.0.0 (2026-10-17)
+- (법령명, 형식, MST) 작업 단위의 시작/완료/실패를 JSON Lines로 기록
+- 한 줄 쓸 때마다 flush + fsync (프로세스가 죽어도 기록된 줄은 유지)
+- 다시 실행하면 완료된 단위는 건너뛰고, 시작만 기록된 단위는 다시 받음
+- 실행이 끝까지 완료되면 finish 기록 → 다음 실행은 새 저널로 시작
+
+기록 형식 (한 줄에 하나):
+    {"event": "start",    "law": "법인세법", "format": "JSON", "mst": "268611", "at": ...}
+    {"event": "done",     "law": "법인세법", "format": "JSON", "mst": "268611", "file": "...", "at": ...}
+    {"event": "fail",     "law": "법인세법", "format": "XML",  "mst": "268611", "error": "...", "at": ...}
+    {"event": "finish",   "at": ...}
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+DEFAULT_JOURNAL_FILE = '_cache/crawl_journal.jsonl'
+
+
+def unit_key(law_name: str, fmt: str, mst: str) -> str:
+    """작업 단위 키"""
+    return f"{law_name}|{fmt.upper()}|{mst}"
+
+
+class CrawlJournal:
+    """대량 다운로드 작업 저널 (스레드 안전)"""
+
+    def __init__(self, journal_file: str = DEFAULT_JOURNAL_FILE, fresh: bool = False):
+        """
+        Args:
+            journal_file: 저널 파일 경로
+            fresh: True이면 이전 기록을 무시하고 새로 시작
+        """
+        self.journal_file = journal_file
+        self._lock = threading.Lock()
+        self.done: Dict[str, Dict] = {}
+        self.in_flight: Dict[str, Dict] = {}
+        self.failed: Dict[str, Dict] = {}
+        self.resumed = False
+
+        finished = self.load()
+        if fresh or finished:
+            self.rotate()
+        else:
+            self.resumed = bool(self.done or self.in_flight or self.failed)
+
+        os.makedirs(os.path.dirname(journal_file) or '.', exist_ok=True)
+        self._file = open(journal_file, 'a', encoding='utf-8')
+        if self._ends_mid_line():
+            # 쓰다 만 마지막 줄 뒤에 이어 쓰지 않도록 줄을 끊어 둠
+            self._file.write('\n')
+            self._file.flush()
+
+    def _ends_mid_line(self) -> bool:
+        with open(self.journal_file, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return False
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b'\n'
+
+    def load(self) -> bool:
+        """
+        저널 재생 (마지막 줄이 쓰다 만 상태여도 무시하고 진행)
+
+        Returns:
+            이전 실행이 finish까지 기록됐는지 여부
+        """
+        if not os.path.exists(self.journal_file):
+            return False
+
+        finished = False
+        with open(self.journal_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+                event = record.get('event')
+                if event == 'finish':
+                    finished = True
+                    continue
+                finished = False
+
+                key = unit_key(record.get('law', ''), record.get('format', ''), record.get('mst', ''))
+                if event == 'start':
+                    self.in_flight[key] = record
+                elif event == 'done':
+                    self.in_flight.pop(key, None)
+                    self.failed.pop(key, None)
+                    self.done[key] = record
+                elif event == 'fail':
+                    self.in_flight.pop(key, None)
+                    self.failed[key] = record
+
+        return finished
+
+    def rotate(self):
+        """이전 저널을 .prev로 옮기고 빈 상태로 시작"""
+        if os.path.exists(self.journal_file):
+            os.replace(self.journal_file, f"{self.journal_file}.prev")
+        self.done.clear()
+        self.in_flight.clear()
+        self.failed.clear()
+
+    def _append(self, record: Dict):
+        record['at'] = time.time()
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def is_done(self, law_name: str, fmt: str, mst: str) -> bool:
+        with self._lock:
+            return unit_key(law_name, fmt, mst) in self.done
+
+    def completed_mst(self, law_name: str, formats: List[str]) -> Optional[str]:
+        """모든 형식이 완료된 MST (있으면 검색도 생략 가능)"""
+        with self._lock:
+            msts = {record['mst'] for key, record in self.done.items() if record.get('law') == law_name}
+            for mst in msts:
+                if all(unit_key(law_name, fmt, mst) in self.done for fmt in formats):
+                    return mst
+        return None
+
+    def start(self, law_name: str, fmt: str, mst: str):
+        record = {'event': 'start', 'law': law_name, 'format': fmt.upper(), 'mst': mst}
+        self._append(dict(record))
+        with self._lock:
+            self.in_flight[unit_key(law_name, fmt, mst)] = record
+
+    def complete(self, law_name: str, fmt: str, mst: str, file: str = None):
+        record = {'event': 'done', 'law': law_name, 'format': fmt.upper(), 'mst': mst}
+        if file:
+            record['file'] = file
+        self._append(dict(record))
+        key = unit_key(law_name, fmt, mst)
+        with self._lock:
+            self.in_flight.pop(key, None)
+            self.failed.pop(key, None)
+            self.done[key] = record
+
+    def fail(self, law_name: str, fmt: str, mst: str, error: str = ''):
+        record = {'event': 'fail', 'law': law_name, 'format': fmt.upper(), 'mst': mst, 'error': error}
+        self._append(dict(record))
+        key = unit_key(law_name, fmt, mst)
+        with self._lock:
+            self.in_flight.pop(key, None)
+            self.failed[key] = record
+
+    def finish(self):
+        """실행 완료 기록 (다음 실행은 새 저널로 시작)"""
+        self._append({'event': 'finish'})
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+법제처 Open API 호출 속도 제한
+Version 1.2.0 (2026-10-17)
+- 여러 스레드가 함께 쓰는 전역 호출 간격 제한
+- main()의 고정 time.sleep(1) 대체
+- asyncio 대기 지원 (acquire_async, 이벤트 루프를 막지 않음)
+- 토큰 버킷 (burst만큼 연속 호출 허용, 평균 속도는 rate 유지)
+- 엔드포인트별 속도 설정 (API_law.yaml의 endpoint_rates)
+- 429/5xx/시간 초과 재시도 정책 (지수 백오프 + 지터, Retry-After 존중)
+
+API_law.yaml 예:
+    requests_per_second: 3     # 전체 호출 속도 (모든 엔드포인트 합산)
+    rate_burst: 3              # 연속으로 허용할 호출 수
+    endpoint_rates:            # 엔드포인트(또는 '엔드포인트:target')별 추가 제한
+      lawService.do: 2
+      lawSearch.do:prec: 1
+    max_retries: 4
+    retry_base_delay: 1.0
+    retry_max_delay: 30.0
+"""
+
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+# 재시도할 HTTP 상태 코드 (요청 과다, 서버 일시 오류)
+RETRY_STATUS = frozenset((429, 500, 502, 503, 504))
+
+
+class RateLimiter:
+    """토큰 버킷 호출 속도 제한 (스레드 안전)"""
+
+    def __init__(self, rate: float = 3.0, burst: int = 1):
+        """
+        Args:
+            rate: 초당 최대 요청 수 (0 이하이면 제한 없음)
+            burst: 쉬었다가 연속으로 보낼 수 있는 요청 수 (1이면 고정 간격)
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+    def reserve(self, endpoint: str = None, target: str = None) -> float:
+        """
+        토큰 하나 예약 후 대기해야 할 시간(초) 반환
+
+        토큰이 모자라면 음수로 빌려 쓰고, 빌린 만큼 기다림 (단일 버킷은 엔드포인트 구분 없음)
+        """
+        if self.interval <= 0:
+            return 0.0
+
+        # 예약은 락 안에서, 대기는 락 밖에서 (다른 스레드가 다음 토큰 예약 가능)
+        with self._lock:
+            now = time.monotonic()
+            if now > self._updated:
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+            self._tokens -= 1
+            # _updated가 미래이면 pause() 중
+            return (self._updated - now) + max(0.0, -self._tokens) * self.interval
+
+    def pause(self, seconds: float, endpoint: str = None, target: str = None):
+        """서버가 요청 과다(429)를 알리면 모든 호출을 잠시 멈춤"""
+        if self.interval <= 0 or seconds <= 0:
+            return
+        with self._lock:
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = max(self._updated, time.monotonic() + seconds)
+
+    def acquire(self, endpoint: str = None, target: str = None):
+        """다음 호출 슬롯까지 대기"""
+        wait = self.reserve(endpoint, target)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, endpoint: str = None, target: str = None):
+        """다음 호출 슬롯까지 대기 (asyncio, 취소 가능)"""
+        wait = self.reserve(endpoint, target)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class EndpointRateLimiter(RateLimiter):
+    """
+    전체 속도 제한 + 엔드포인트별 속도 제한
+
+    호출마다 전체 버킷과 해당 엔드포인트 버킷에서 토큰을 하나씩 예약하고 더 긴 쪽만큼 대기
+    ('lawSearch.do:prec'처럼 target까지 지정한 설정이 'lawSearch.do'보다 우선)
+    """
+
+    def __init__(self, rate: float = 3.0, burst: int = 1, endpoint_rates: Dict[str, float] = None):
+        super().__init__(rate, burst)
+        self.endpoint_rates = dict(endpoint_rates or {})
+        self._buckets = {
+            name: RateLimiter(endpoint_rate, burst)
+            for name, endpoint_rate in self.endpoint_rates.items()
+        }
+
+    def set_endpoint_rate(self, name: str, rate: float):
+        """엔드포인트(또는 '엔드포인트:target') 속도 추가/변경 (대상별 수집 작업 설정용)"""
+        self.endpoint_rates[name] = rate
+        self._buckets[name] = RateLimiter(rate, self.burst)
+
+    def _bucket_for(self, endpoint: str = None, target: str = None) -> Optional[RateLimiter]:
+        if endpoint and target and f"{endpoint}:{target}" in self._buckets:
+            return self._buckets[f"{endpoint}:{target}"]
+        return self._buckets.get(endpoint) if endpoint else None
+
+    def reserve(self, endpoint: str = None, target: str = None) -> float:
+        wait = super().reserve()
+        bucket = self._bucket_for(endpoint, target)
+        if bucket is not None:
+            wait = max(wait, bucket.reserve())
+        return wait
+
+
+class RetryPolicy:
+    """재시도 정책 (지수 백오프 + full jitter)"""
+
+    def __init__(self, max_retries: int = 4, base_delay: float = 1.0, max_delay: float = 30.0):
+        """
+        Args:
+            max_retries: 첫 요청 이후 최대 재시도 횟수
+            base_delay: 첫 재시도 대기 상한(초), 재시도마다 2배
+            max_delay: 대기 상한(초)
+        """
+        self.max_retries = max(0, max_retries)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int, retry_after: float = None) -> float:
+        """
+        attempt번째 재시도 전 대기 시간
+
+        Retry-After가 있으면 그 값(상한 max_delay), 없으면 0 ~ base * 2^attempt 사이 임의 값
+        (여러 스레드가 동시에 실패해도 재시도 시점이 흩어짐)
+        """
+        if retry_after is not None:
+            return min(self.max_delay, max(0.0, retry_after))
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 (초 또는 HTTP 날짜) → 초"""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(value).timestamp() - time.time()
+    except (TypeError, ValueError):
+        return None
+
+
+def create_rate_limiter(config: Dict, rate: float = None) -> EndpointRateLimiter:
+    """API_law.yaml 설정 → 호출 속도 제한 (rate를 주면 requests_per_second 대신 사용)"""
+    return EndpointRateLimiter(
+        rate if rate is not None else config.get('requests_per_second', 3.0),
+        config.get('rate_burst', 1),
+        config.get('endpoint_rates'),
+    )
+
+
+def create_retry_policy(config: Dict) -> RetryPolicy:
+    """API_law.yaml 설정 → 재시도 정책"""
+    return RetryPolicy(
+        config.get('max_retries', 4),
+        config.get('retry_base_delay', 1.0),
+        config.get('retry_max_delay', 30.0),
+    )
+
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+법제처 Open API 로컬 재생 서버
+Version 1.0.0 (2026-10-17)
+- lawSearch.do / lawService.do와 같은 쿼리 형식으로 저장된 XML/JSON 응답을 돌려줌
+- 지연(latency), 대역폭 제한, 오류 주입(429/5xx/시간 초과) 설정 가능
+- 인터넷 없이 동시성 설정 부하 시험, 파서 처리량 측정, CI 파이프라인 실행용
+- gzip 압축 결과 재사용 + Nagle 끔 (측정한 조회 시간에 서버 쪽 처리 시간이 섞이지 않게)
+  (압축 캐시는 본문 SHA-256 키, 최근 사용 순으로 GZIP_CACHE_SIZE개까지만 보관)
+
+픽스처 폴더 형식:
+    index.json, blobs/     상세 응답 (law_api_cache.LawDetailCache와 같은 형식,
+                           _cache/detail_cache를 그대로 사용 가능)
+    search/<target>.json   목록 항목 배열 (검색어가 포함된 항목을 페이지 단위로 돌려줌)
+                           항목 키가 대상 이름과 다르면 {"item_key": "law", "items": [...]}
+                           (eflaw 목록은 LawSearch/law 형식으로 옴)
+
+사용법 (process-01-crawler 폴더에서):
+    python benchmarks/synthetic_law.py --out _fixtures/synthetic
+    python law_api_replay.py _fixtures/synthetic --port 8080 --latency-ms 80 --error-rate 0.05
+
+    # API_law.yaml
+    base_url: http://127.0.0.1:8080/DRF
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+from xml.sax.saxutils import escape
+
+from law_api_cache import LawDetailCache, make_cache_key
+
+DEFAULT_PORT = 8080
+# 대역폭 제한 시 한 번에 보내는 크기
+SEND_CHUNK = 16 * 1024
+# 압축 결과를 보관하는 응답 수 (목록 페이지/검색어 조합이 많아도 메모리 상한)
+GZIP_CACHE_SIZE = 256
+
+
+class FixtureStore:
+    """재생 서버 픽스처 (상세 응답 + 목록 항목)"""
+
+    def __init__(self, fixtures_dir: str):
+        self.fixtures_dir = fixtures_dir
+        self.detail = LawDetailCache(fixtures_dir)
+        self.search_dir = os.path.join(fixtures_dir, 'search')
+        self._search: Dict[str, List[Dict]] = {}
+        self._item_keys: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def add_detail(self, target: str, mst: str, content: bytes, output_type: str,
+                   law_id: str = None, jo: str = None, lang: str = None):
+        """상세 응답 추가 (요청 파라미터 조합별)"""
+        key = make_cache_key(target, mst=mst, law_id=law_id, jo=jo, lang=lang, output_type=output_type)
+        self.detail.put(key, content)
+
+    def find_detail(self, params: Dict) -> Optional[bytes]:
+        """
+        lawService.do 요청 파라미터 → 저장된 응답
+
+        JO/LANG까지 맞는 응답이 없으면 전체 조문 응답으로 대체 (조문 단위 조회 부하 시험용)
+        """
+        target = params.get('target', 'law')
+        output_type = params.get('type', 'XML')
+        candidates = [
+            make_cache_key(target, params.get('MST'), params.get('ID'),
+                           params.get('JO'), params.get('LANG'), output_type, params.get('efYd')),
+            make_cache_key(target, params.get('MST'), params.get('ID'),
+                           params.get('JO'), params.get('LANG'), output_type),
+            make_cache_key(target, params.get('MST'), params.get('ID'), output_type=output_type),
+        ]
+        for key in candidates:
+            entry = self.detail.index.get(key)
+            if entry:
+                try:
+                    with open(self.detail.blob_path(entry['blob']), 'rb') as f:
+                        return f.read()
+                except OSError:
+                    return None
+        return None
+
+    def search_items(self, target: str) -> List[Dict]:
+        with self._lock:
+            if target not in self._search:
+                path = os.path.join(self.search_dir, f"{target}.json")
+                items, item_key = [], target
+                if os.path.exists(path):
+                    with open(path, 'r', encoding='utf-8') as f:
+                        items = json.load(f)
+                if isinstance(items, dict):
+                    item_key = items.get('item_key') or target
+                    items = items.get('items', [])
+                self._search[target] = items
+                self._item_keys[target] = item_key
+            return self._search[target]
+
+    def search_item_key(self, target: str) -> str:
+        """목록 응답에서 항목을 담는 키 (기본은 대상 이름)"""
+        self.search_items(target)
+        return self._item_keys.get(target, target)
+
+    def set_search_items(self, target: str, items: List[Dict], item_key: str = None):
+        os.makedirs(self.search_dir, exist_ok=True)
+        data = {'item_key': item_key, 'items': items} if item_key and item_key != target else items
+        with open(os.path.join(self.search_dir, f"{target}.json"), 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        with self._lock:
+            self._search[target] = list(items)
+            self._item_keys[target] = item_key or target
+
+    def search(self, target: str, query: Optional[str], page: int, display: int) -> Tuple[int, List[Dict]]:
+        """검색어가 값에 포함된 항목 → (전체 건수, 해당 페이지 항목)"""
+        items = self.search_items(target)
+        if query:
+            items = [item for item in items
+                     if any(query in value for value in item.values() if isinstance(value, str))]
+        start = (page - 1) * display
+        return len(items), items[start:start + display]
+
+
+def render_search(target: str, query: Optional[str], total: int, page: int,
+                  items: List[Dict], output_type: str, offset: int = 0,
+                  item_key: str = None) -> Tuple[bytes, str]:
+    """
+    목록 응답 본문 (DRF처럼 JSON은 항목이 하나면 dict)
+
+    최상위 태그와 항목 키는 item_key를 따름 (eflaw → LawSearch/law, 나머지는 대상 이름)
+    """
+    item_key = item_key or target
+    root_tag = f"{item_key[:1].upper()}{item_key[1:]}Search"
+
+    if output_type.upper() == 'JSON':
+        data = {root_tag: {
+            'target': target,
+            '키워드': query or '',
+            'totalCnt': str(total),
+            'page': str(page),
+            item_key: items[0] if len(items) == 1 else items,
+        }}
+        return json.dumps(data, ensure_ascii=False).encode('utf-8'), 'application/json;charset=UTF-8'
+
+    parts = [f'<?xml version="1.0" encoding="UTF-8"?><{root_tag}>',
+             f"<target>{escape(target)}</target><키워드>{escape(query or '')}</키워드>",
+             f"<totalCnt>{total}</totalCnt><page>{page}</page>"]
+    for i, item in enumerate(items, offset + 1):
+        parts.append(f'<{item_key} id="{i}">')
+        parts += [f"<{key}>{escape(str(value))}</{key}>" for key, value in item.items()]
+        parts.append(f'</{item_key}>')
+    parts.append(f'</{root_tag}>')
+    return ''.join(parts).encode('utf-8'), 'application/xml;charset=UTF-8'
+
+
+class ReplayOptions:
+    """지연/대역폭/오류 주입 설정"""
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, bandwidth_kbps: float = 0.0,
+                 error_rate: float = 0.0, throttle_rate: float = 0.0, timeout_rate: float = 0.0,
+                 hang_seconds: float = 60.0, retry_after: float = 1.0, gzip: bool = True, seed: int = None):
+        """
+        Args:
+            latency_ms: 응답 전 고정 지연
+            jitter_ms: 지연에 더할 임의 값 상한
+            bandwidth_kbps: 전송 속도 상한 (KB/s, 0이면 제한 없음)
+            error_rate: 500/502/503 응답 비율
+            throttle_rate: 429 응답 비율 (Retry-After 포함)
+            timeout_rate: 응답 없이 hang_seconds 동안 멈추는 비율 (클라이언트 시간 초과 시험)
+            gzip: 클라이언트가 허용하면 gzip으로 압축해 전송
+            seed: 오류 주입 난수 시드 (같은 시드면 같은 순서로 오류 발생)
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.bandwidth_kbps = bandwidth_kbps
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.timeout_rate = timeout_rate
+        self.hang_seconds = hang_seconds
+        self.retry_after = retry_after
+        self.gzip = gzip
+        self.seed = seed
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """픽스처 재생 HTTP 서버 (요청마다 스레드)"""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], store: FixtureStore, options: ReplayOptions = None):
+        super().__init__(address, ReplayHandler)
+        self.store = store
+        self.options = options or ReplayOptions()
+        self.rng = random.Random(self.options.seed)
+        self.stats = {'requests': 0, 'bytes': 0, '429': 0, '5xx': 0, 'timeout': 0, '404': 0}
+        self._lock = threading.Lock()
+        # 픽스처는 바뀌지 않으므로 압축 결과를 재사용 (측정값에 서버 압축 시간이 섞이지 않게)
+        self._gzip_cache: 'OrderedDict[bytes, bytes]' = OrderedDict()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/DRF"
+
+    def count(self, name: str, value: int = 1):
+        with self._lock:
+            self.stats[name] += value
+
+    def handle_error(self, request, client_address):
+        # 클라이언트가 먼저 연결을 끊은 경우(작업 취소, 시간 초과)는 정상 상황
+        if isinstance(sys.exc_info()[1], (ConnectionResetError, BrokenPipeError)):
+            return
+        super().handle_error(request, client_address)
+
+    def compress(self, body: bytes) -> bytes:
+        """gzip 압축 (본문 SHA-256으로 재사용, 오래 쓰지 않은 결과부터 버림)"""
+        key = hashlib.sha256(body).digest()
+        with self._lock:
+            compressed = self._gzip_cache.get(key)
+            if compressed is not None:
+                self._gzip_cache.move_to_end(key)
+                return compressed
+
+        compressed = gzip.compress(body, compresslevel=5)
+        with self._lock:
+            self._gzip_cache[key] = compressed
+            while len(self._gzip_cache) > GZIP_CACHE_SIZE:
+                self._gzip_cache.popitem(last=False)
+        return compressed
+
+    def pick_fault(self) -> Tuple[Optional[str], float]:
+        """이번 요청의 (오류 종류, 지연 초) - 난수는 락 안에서 뽑아 시드 재현성 유지"""
+        opts = self.options
+        with self._lock:
+            roll = self.rng.random()
+            delay = (opts.latency_ms + self.rng.uniform(0, opts.jitter_ms)) / 1000.0
+            status = self.rng.choice((500, 502, 503))
+
+        if roll < opts.timeout_rate:
+            return 'timeout', delay
+        roll -= opts.timeout_rate
+        if roll < opts.throttle_rate:
+            return '429', delay
+        roll -= opts.throttle_rate
+        if roll < opts.error_rate:
+            return str(status), delay
+        return None, delay
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    server: ReplayServer
+    protocol_version = 'HTTP/1.1'
+    # 헤더와 본문을 따로 쓰므로 Nagle 지연(~40ms)이 응답 시간에 섞이지 않게 끔
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        endpoint = url.path.rsplit('/', 1)[-1]
+        self.server.count('requests')
+
+        fault, delay = self.server.pick_fault()
+        if delay > 0:
+            time.sleep(delay)
+
+        if fault == 'timeout':
+            self.server.count('timeout')
+            time.sleep(self.server.options.hang_seconds)
+            self.close_connection = True
+            return
+        if fault == '429':
+            self.server.count('429')
+            self._send(429, b'Too Many Requests', 'text/plain',
+                       {'Retry-After': str(self.server.options.retry_after)})
+            return
+        if fault:
+            self.server.count('5xx')
+            self._send(int(fault), b'Server Error', 'text/plain')
+            return
+
+        output_type = params.get('type', 'XML').upper()
+        if endpoint == 'lawSearch.do':
+            page = max(1, int(params.get('page', 1) or 1))
+            display = max(1, min(100, int(params.get('display', 20) or 20)))
+            target = params.get('target', 'law')
+            total, items = self.server.store.search(target, params.get('query'), page, display)
+            body, content_type = render_search(target, params.get('query'), total, page, items,
+                                               output_type, (page - 1) * display,
+                                               self.server.store.search_item_key(target))
+            self._send(200, body, content_type)
+        elif endpoint == 'lawService.do':
+            body = self.server.store.find_detail(params)
+            if body is None:
+                self.server.count('404')
+                self._send(404, b'fixture not found', 'text/plain')
+                return
+            content_type = {'JSON': 'application/json', 'XML': 'application/xml'}.get(output_type, 'text/html')
+            self._send(200, body, f"{content_type};charset=UTF-8")
+        else:
+            self.server.count('404')
+            self._send(404, b'unknown endpoint', 'text/plain')
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Dict[str, str] = None):
+        if self.server.options.gzip and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = self.server.compress(body)
+            headers = dict(headers or {}, **{'Content-Encoding': 'gzip'})
+
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+
+        bandwidth = self.server.options.bandwidth_kbps * 1024
+        if bandwidth <= 0:
+            self.wfile.write(body)
+        else:
+            for start in range(0, len(body), SEND_CHUNK):
+                chunk = body[start:start + SEND_CHUNK]
+                self.wfile.write(chunk)
+                time.sleep(len(chunk) / bandwidth)
+        self.server.count('bytes', len(body))
+
+    def log_message(self, format, *args):
+        # 요청마다 출력하지 않음 (부하 시험 시 출력이 병목)
+        pass
+
+
+def start_replay_server(fixtures_dir: str, host: str = '127.0.0.1', port: int = 0,
+                        options: ReplayOptions = None) -> ReplayServer:
+    """
+    백그라운드 스레드로 재생 서버 시작 (벤치마크/테스트용, port=0이면 빈 포트 자동 선택)
+
+    사용 후 server.shutdown() 호출
+    """
+    server = ReplayServer((host, port), FixtureStore(fixtures_dir), options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="법제처 Open API 로컬 재생 서버")
+    parser.add_argument('fixtures', help="픽스처 폴더 (예: _fixtures/synthetic, _cache/detail_cache)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--latency-ms', type=float, default=0.0, help="응답 지연 (ms)")
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help="지연에 더할 임의 값 상한 (ms)")
+    parser.add_argument('--bandwidth-kbps', type=float, default=0.0, help="전송 속도 상한 (KB/s)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="500/502/503 비율 (0~1)")
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help="429 비율 (0~1)")
+    parser.add_argument('--timeout-rate', type=float, default=0.0, help="응답 없이 멈추는 비율 (0~1)")
+    parser.add_argument('--no-gzip', action='store_true', help="gzip 압축 끄기")
+    parser.add_argument('--seed', type=int, help="오류 주입 난수 시드")
+    args = parser.parse_args()
+
+    options = ReplayOptions(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, bandwidth_kbps=args.bandwidth_kbps,
+        error_rate=args.error_rate, throttle_rate=args.throttle_rate, timeout_rate=args.timeout_rate,
+        gzip=not args.no_gzip, seed=args.seed,
+    )
+    server = ReplayServer((args.host, args.port), FixtureStore(args.fixtures), options)
+    print(f"🔁 재생 서버 시작: {server.base_url} (상세 {len(server.store.detail.index)}건)")
+    print(f"   API_law.yaml에 base_url: {server.base_url} 설정 후 클라이언트 실행")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\n📊 요청 {server.stats['requests']}건, 전송 {server.stats['bytes']:,} bytes, "
+              f"429 {server.stats['429']} / 5xx {server.stats['5xx']} / "
+              f"시간 초과 {server.stats['timeout']} / 없음 {server.stats['404']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+저장 전 민감정보 제거
+Version 1.0.0 (2026-10-17)
+- 네 클라이언트에 같은 내용으로 있던 sanitize_data를 한 곳으로 모음
+- 벤치마크(benchmarks/bench_pipeline.py)에서 클라이언트 없이 호출 가능
+- 이메일 정규식은 모듈 로드 시 한 번만 컴파일
+"""
+
+import re
+from typing import Any, Optional
+
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+EMAIL_MASK = '***@***.***'
+ID_MASK = '***MASKED***'
+
+
+def sanitize_data(data: Any, email_id: Optional[str] = None) -> Any:
+    """
+    민감정보 제거 (재귀적)
+    - OC 파라미터 제거
+    - 이메일 ID 마스킹 (email_id가 있으면 그 값, 없으면 이메일 패턴)
+    """
+    if isinstance(data, dict):
+        cleaned = {}
+        for key, value in data.items():
+            # OC 관련 필드 제거
+            if key.upper() == 'OC' or key == 'email_id':
+                continue
+            # 값에서도 재귀적으로 제거
+            cleaned[key] = sanitize_data(value, email_id)
+        return cleaned
+    elif isinstance(data, list):
+        return [sanitize_data(item, email_id) for item in data]
+    elif isinstance(data, str):
+        # 문자열 내 이메일 ID 마스킹
+        if email_id and email_id in data:
+            return data.replace(email_id, ID_MASK)
+        # 이메일 패턴 마스킹
+        return EMAIL_PATTERN.sub(EMAIL_MASK, data)
+    else:
+        return data
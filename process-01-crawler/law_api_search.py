@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+법제처 Open API 목록 조회 페이지 순회
+Version 1.0.0 (2026-10-17)
+- 첫 페이지의 totalCnt로 전체 페이지 수를 알아낸 뒤 나머지 페이지를 동시에 조회
+- 도착하는 순서대로 항목을 하나씩 yield (전체 결과를 메모리에 모으지 않음)
+- 동시에 진행하는 페이지 수만큼만 미리 요청 (넓은 검색어도 메모리 일정)
+- 실패한 페이지는 순회 끝에 한 번 더 조회, 그래도 못 받으면 IncompleteSearchError
+  (받은 항목은 이미 yield됨 → 호출한 쪽이 목록이 일부만 왔는지 구분 가능)
+- 목록 항목 키를 item_key로 지정 가능 (eflaw 목록은 LawSearch/law 형식 → item_key='law')
+
+사용 예 (client는 session/base_url/email_id/rate_limiter/retry_policy/timeout을 가진 클라이언트):
+    for law in iter_search(client, '조세', target='law'):
+        print(law['법령명한글'])
+"""
+
+import math
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+from typing import Dict, Iterator, List, Optional
+
+from law_api_session import request_with_retry
+from law_json_decode import loads
+
+# lawSearch.do 한 페이지 최대 건수
+MAX_DISPLAY = 100
+
+
+class IncompleteSearchError(Exception):
+    """재시도 후에도 받지 못한 목록 페이지가 있음 (나머지 페이지 항목은 이미 yield됨)"""
+
+    def __init__(self, target: str, query: Optional[str], failed_pages: List[int], total_pages: int = 0):
+        self.target = target
+        self.query = query
+        self.failed_pages = sorted(failed_pages)
+        self.total_pages = total_pages
+        total = f"/{total_pages}" if total_pages else ''
+        super().__init__(f"'{query or target}' 목록 일부 누락: {len(self.failed_pages)}{total}페이지 "
+                         f"{self.failed_pages}")
+
+
+def parse_search_response(data: Dict, target: str, item_key: str = None) -> Dict:
+    """
+    lawSearch.do JSON 응답 → {'total_count', 'page', 'items'}
+
+    최상위 키(LawSearch, PrecSearch 등)는 대상마다 달라서 첫 번째 dict 값을 사용하고,
+    목록은 item_key(없으면 target 이름) 키에 있음 (결과가 하나면 dict로 옴)
+    - eflaw처럼 대상 이름과 항목 키가 다른 목록은 item_key를 지정 (eflaw → 'law')
+    """
+    root = next((value for value in data.values() if isinstance(value, dict)), {}) if data else {}
+    items = root.get(item_key or target, [])
+    if isinstance(items, dict):
+        items = [items]
+
+    return {
+        'total_count': int(root.get('totalCnt', 0) or 0),
+        'page': int(root.get('page', 1) or 1),
+        'items': items,
+    }
+
+
+def page_count(total_count: int, display: int, max_pages: int = None) -> int:
+    """전체 페이지 수 (max_pages로 상한)"""
+    pages = math.ceil(total_count / display) if display > 0 else 0
+    return min(pages, max_pages) if max_pages else pages
+
+
+def fetch_search_page(client, target: str, query: Optional[str], page: int,
+                      display: int = MAX_DISPLAY, item_key: str = None, **params) -> Optional[Dict]:
+    """
+    목록 한 페이지 조회 (JSON)
+
+    Returns:
+        parse_search_response() 결과, 실패하면 None
+    """
+    request_params = {
+        'OC': client.email_id,
+        'target': target,
+        'type': 'JSON',
+        'display': display,
+        'page': page,
+    }
+    if query:
+        request_params['query'] = query
+    request_params.update({k: v for k, v in params.items() if v not in (None, '')})
+
+    try:
+        response = request_with_retry(client.session, f"{client.base_url}/lawSearch.do", request_params,
+                                      client.rate_limiter, client.retry_policy, client.timeout)
+        if response.status_code != 200:
+            print(f"❌ {target} 목록 {page}페이지 조회 실패: HTTP {response.status_code}")
+            return None
+        return parse_search_response(loads(response.content), target, item_key)
+    except ValueError as e:
+        print(f"❌ {target} 목록 {page}페이지 JSON 파싱 오류: {e}")
+        return None
+    except Exception as e:
+        print(f"❌ {target} 목록 {page}페이지 요청 오류: {e}")
+        return None
+
+
+def iter_search(client, query: Optional[str], target: str = 'law', display: int = MAX_DISPLAY,
+                max_workers: int = 4, max_pages: int = None, item_key: str = None,
+                **params) -> Iterator[Dict]:
+    """
+    목록 조회 전체 페이지 순회
+
+    Args:
+        client: API 클라이언트 (session, base_url, email_id, rate_limiter, retry_policy, timeout)
+        query: 검색어 (없으면 대상 전체)
+        target: 검색 대상 (law, prec, expc, admr ...)
+        display: 페이지당 건수 (최대 100)
+        max_workers: 동시에 조회할 페이지 수
+        max_pages: 최대 페이지 수 (없으면 전체)
+        item_key: 응답에서 목록 항목을 담는 키 (없으면 target, eflaw는 'law')
+        params: 대상별 추가 파라미터 (예: prec의 curt)
+
+    Yields:
+        목록 항목 (dict), 페이지 도착 순서대로 (페이지 간 순서는 보장하지 않음)
+
+    Raises:
+        IncompleteSearchError: 실패 페이지를 한 번 더 조회해도 받지 못함 (첫 페이지 실패 포함)
+    """
+    display = max(1, min(display, MAX_DISPLAY))
+    first = fetch_search_page(client, target, query, 1, display, item_key, **params)
+    if first is None:
+        first = fetch_search_page(client, target, query, 1, display, item_key, **params)
+    if first is None:
+        raise IncompleteSearchError(target, query, [1])
+
+    total_pages = page_count(first['total_count'], display, max_pages)
+    print(f"✅ '{query or target}' 총 {first['total_count']}건 ({total_pages}페이지)")
+    yield from first['items']
+
+    remaining = iter(range(2, total_pages + 1))
+    failed = []
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        # 동시에 max_workers 페이지만 진행 (끝난 만큼 다음 페이지 요청)
+        pending = {
+            executor.submit(fetch_search_page, client, target, query, page, display, item_key,
+                            **params): page
+            for page in islice(remaining, max_workers)
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                page = pending.pop(future)
+                result = future.result()
+                for next_page in islice(remaining, 1):
+                    future_next = executor.submit(fetch_search_page, client, target, query,
+                                                  next_page, display, item_key, **params)
+                    pending[future_next] = next_page
+
+                if result is None:
+                    failed.append(page)
+                    continue
+                yield from result['items']
+    finally:
+        # 호출한 쪽이 순회를 중단해도 남은 페이지 요청은 취소
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    # 실패 페이지는 마지막에 한 번 더 (일시적인 장애가 지나갔을 수 있음)
+    missing = []
+    if failed:
+        print(f"🔁 '{query or target}' 실패 페이지 재조회: {sorted(failed)}")
+    for page in sorted(failed):
+        result = fetch_search_page(client, target, query, page, display, item_key, **params)
+        if result is None:
+            missing.append(page)
+            continue
+        yield from result['items']
+
+    if missing:
+        raise IncompleteSearchError(target, query, missing, total_pages)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+법제처 Open API 공용 HTTP 세션
+Version 1.1.0 (2026-10-17)
+- 모든 API 클라이언트가 하나의 requests.Session 공유
+- 연결 풀 + keep-alive (요청마다 새 TCP 연결을 열지 않음)
+- gzip 압축 응답 요청 (~900KB 상세 응답 전송량 절감)
+- 속도 제한 + 재시도 요청 (request_with_retry, 429/5xx/시간 초과)
+- API 주소 기본값 (API_law.yaml의 base_url로 로컬 재생 서버 등 지정 가능)
+"""
+
+import threading
+import time
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from law_api_ratelimit import RETRY_STATUS, RateLimiter, RetryPolicy, parse_retry_after
+
+DEFAULT_BASE_URL = "http://www.law.go.kr/DRF"
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 30.0
+USER_AGENT = "korean-tax-law-crawler/1.0 (+https://open.law.go.kr)"
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def create_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """
+    연결 풀이 설정된 새 세션 생성
+
+    Args:
+        pool_size: 호스트당 유지할 최대 연결 수 (동시 작업 수 이상 권장)
+    """
+    session = requests.Session()
+
+    # 풀이 가득 차면 연결을 버리지 않고 반납될 때까지 대기
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, pool_block=True)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    session.headers.update({
+        'User-Agent': USER_AGENT,
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+    })
+    return session
+
+
+def get_session(pool_size: int = None) -> requests.Session:
+    """
+    프로세스 전체에서 공유하는 세션 반환 (최초 호출 시 생성)
+
+    Args:
+        pool_size: 최초 생성 시 적용할 연결 풀 크기 (이후 호출에서는 무시)
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = create_session(pool_size or DEFAULT_POOL_SIZE)
+        return _session
+
+
+def request_with_retry(session: requests.Session, url: str, params: Dict,
+                       rate_limiter: RateLimiter = None, retry: RetryPolicy = None,
+                       timeout: float = DEFAULT_TIMEOUT, **kwargs) -> requests.Response:
+    """
+    GET 요청 (호출 속도 제한 + 429/5xx/시간 초과 재시도)
+
+    Args:
+        rate_limiter: 호출 속도 제한 (엔드포인트와 target별 제한 적용)
+        retry: 재시도 정책 (없으면 재시도 안 함)
+        kwargs: session.get에 그대로 전달 (stream 등)
+
+    Returns:
+        마지막 응답 (재시도 후에도 실패하면 오류 상태 코드 그대로, 호출한 쪽에서 처리)
+
+    Raises:
+        requests.RequestException: 재시도 후에도 연결 오류/시간 초과
+    """
+    endpoint = url.rsplit('/', 1)[-1]
+    target = params.get('target')
+    max_retries = retry.max_retries if retry else 0
+
+    for attempt in range(max_retries + 1):
+        if rate_limiter:
+            rate_limiter.acquire(endpoint, target)
+
+        try:
+            response = session.get(url, params=params, timeout=timeout, **kwargs)
+        except (requests.Timeout, requests.ConnectionError) as e:
+            if attempt >= max_retries:
+                raise
+            wait = retry.delay(attempt)
+            print(f"🔁 {endpoint} ({target}) 연결 오류: {type(e).__name__} "
+                  f"→ {wait:.1f}초 후 재시도 ({attempt + 1}/{max_retries})")
+            time.sleep(wait)
+            continue
+
+        if response.status_code not in RETRY_STATUS or attempt >= max_retries:
+            return response
+
+        wait = retry.delay(attempt, parse_retry_after(response.headers.get('Retry-After')))
+        response.close()
+        if response.status_code == 429 and rate_limiter:
+            # 요청 과다: 다른 스레드도 함께 멈춤
+            rate_limiter.pause(wait, endpoint, target)
+        print(f"🔁 {endpoint} ({target}) HTTP {response.status_code} "
+              f"→ {wait:.1f}초 후 재시도 ({attempt + 1}/{max_retries})")
+        time.sleep(wait)
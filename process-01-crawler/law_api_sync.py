@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+법령 증분 동기화 매니페스트
+Version 1.0.0 (2026-10-17)
+- 법령ID별 마지막으로 받은 법령일련번호(MST) 기록
+- 검색 결과와 비교하여 새 MST가 나온 법령만 골라냄
+- lawService.do 상세 조회는 변경된 법령에만 수행
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+DEFAULT_MANIFEST_FILE = '_cache/sync_manifest.json'
+
+# 매니페스트에 기록하는 검색 결과 필드
+MANIFEST_FIELDS = ('법령일련번호', '법령명한글', '공포일자', '시행일자')
+
+
+def pick_search_hit(search_result: Optional[Dict], law_name: str) -> Optional[Dict]:
+    """
+    검색 결과에서 법령 선택
+
+    법령명이 정확히 일치하는 항목 우선, 없으면 첫 번째 결과
+    ('법인세법' 검색 시 '법인세법 시행령'이 먼저 나오는 경우 방지)
+    """
+    if not search_result or not search_result.get('laws'):
+        return None
+
+    for law in search_result['laws']:
+        if law.get('법령명한글') == law_name:
+            return law
+    return search_result['laws'][0]
+
+
+class LawSyncManifest:
+    """법령ID → 마지막 동기화 정보 (스레드 안전)"""
+
+    def __init__(self, manifest_file: str = DEFAULT_MANIFEST_FILE):
+        self.manifest_file = manifest_file
+        self._lock = threading.Lock()
+        self.entries = self.load()
+
+    def load(self) -> Dict:
+        """매니페스트 로드 (없으면 빈 매니페스트 → 전체가 신규)"""
+        if not os.path.exists(self.manifest_file):
+            return {}
+
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️ 매니페스트 읽기 오류 (전체 재동기화): {e}")
+            return {}
+
+    def save(self):
+        """매니페스트 저장 (임시 파일 → 교체)"""
+        os.makedirs(os.path.dirname(self.manifest_file) or '.', exist_ok=True)
+        tmp_file = f"{self.manifest_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, self.manifest_file)
+
+    def diff(self, law_infos: List[Dict]) -> Dict[str, List[Dict]]:
+        """
+        검색 결과와 매니페스트 비교
+
+        Returns:
+            {'신규': [...], '변경': [...], '유지': [...]}
+        """
+        result = {'신규': [], '변경': [], '유지': []}
+
+        with self._lock:
+            for law_info in law_infos:
+                law_id = law_info.get('법령ID')
+                entry = self.entries.get(law_id)
+
+                if entry is None:
+                    result['신규'].append(law_info)
+                elif entry.get('법령일련번호') != law_info.get('법령일련번호'):
+                    result['변경'].append(law_info)
+                else:
+                    result['유지'].append(law_info)
+
+        return result
+
+    def update(self, law_info: Dict):
+        """다운로드 완료한 법령 기록 (즉시 저장, 중단되어도 완료분 유지)"""
+        entry = {field: law_info.get(field, '') for field in MANIFEST_FIELDS}
+        entry['synced_at'] = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+        with self._lock:
+            self.entries[law_info['법령ID']] = entry
+            self.save()
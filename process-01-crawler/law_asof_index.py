@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+시점 기준 조문 조회 ("2021-03-15에 시행 중이던 법인세법 제55조")
+Version 1.0.0 (2026-10-17)
+- 법령 버전 저장소(law_version_store)의 버전들 → 조문별 시행 구간 [시작일, 종료일) 목록
+- 구간 시작일은 버전 시행일자와 조문시행일자 중 늦은 날 (공포 후 나중에 시행되는 조문 반영)
+- 유예된 개정이 시행되기 전에 조문이 삭제되면 그 개정은 버리고 삭제 버전 시행일에 구간 종료
+- 조회는 시작일 배열 이진 탐색 (네트워크 호출 없이 조문 하나 수 μs)
+- 구간 인덱스는 _versions/asof/<법령ID>.json에 저장, 버전이 추가되면 다시 생성
+
+사용법 (process-01-crawler 폴더에서):
+    python law_asof_index.py build
+    python law_asof_index.py query 법인세법 제55조 2021-03-15
+    python law_asof_index.py history 001563 제55조
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from array import array
+from bisect import bisect_right
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from law_model import Article, _article_from_json, normalize_label
+from law_version_store import VersionedLawStore, DEFAULT_STORE_DIR
+
+# 종료일이 없는 구간 (현재까지 시행 중)
+OPEN_END = 99991231
+
+DATE_PATTERN = re.compile(r'^(\d{4})[-.]?(\d{2})[-.]?(\d{2})$')
+
+
+def parse_date(value) -> int:
+    """'2021-03-15', '2021.03.15', '20210315', 20210315 → 20210315"""
+    if isinstance(value, int):
+        return value
+    match = DATE_PATTERN.match(str(value).strip())
+    if not match:
+        raise ValueError(f"날짜 형식이 아닙니다 (YYYYMMDD 또는 YYYY-MM-DD): {value}")
+    return int(''.join(match.groups()))
+
+
+def article_label(unit: Dict) -> str:
+    """조문 단위 → '제55조' / '제10조의2' (편/장/절 제목 행은 '')"""
+    if unit.get('조문여부') == '전문' or not unit.get('조문번호'):
+        return ''
+    branch = str(unit.get('조문가지번호', '') or '')
+    if branch and branch != '0':
+        return f"제{unit['조문번호']}조의{branch}"
+    return f"제{unit['조문번호']}조"
+
+
+class ArticleTimeline:
+    """조문 하나의 시행 구간 (시작일 순, 겹치지 않음)"""
+
+    __slots__ = ('starts', 'ends', 'hashes')
+
+    def __init__(self):
+        self.starts = array('I')
+        self.ends = array('I')
+        self.hashes: List[str] = []
+
+    def append(self, start: int, end: int, digest: str):
+        self.starts.append(start)
+        self.ends.append(end)
+        self.hashes.append(digest)
+
+    def at(self, date: int) -> Optional[str]:
+        """date에 시행 중인 조문 해시 (없으면 None)"""
+        i = bisect_right(self.starts, date) - 1
+        if i >= 0 and date < self.ends[i]:
+            return self.hashes[i]
+        return None
+
+    def overlapping(self, start: int, end: int) -> List[str]:
+        """[start, end) 기간과 겹치는 구간의 조문 해시 (시작일 순)"""
+        first = max(0, bisect_right(self.starts, start) - 1)
+        last = bisect_right(self.starts, end - 1)
+        return [self.hashes[i] for i in range(first, last) if self.ends[i] > start]
+
+    def __iter__(self) -> Iterator[Tuple[int, int, str]]:
+        return zip(self.starts, self.ends, self.hashes)
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+
+def build_timelines(store: VersionedLawStore, law_id: str) -> Dict[str, ArticleTimeline]:
+    """
+    법령 버전들 → {조문 라벨: 시행 구간}
+
+    버전 i의 조문은 [max(버전 시행일자, 조문시행일자), 다음 버전에서 바뀐 날) 동안 시행
+    (조문시행일자가 더 늦으면 그때까지는 이전 조문이 계속 시행)
+    조문이 빠진 버전은 그 시행일부터 삭제 (아직 시작하지 않은 유예 개정도 함께 취소)
+    """
+    # 라벨 → [(시작일, 해시 또는 None(삭제))]
+    events: Dict[str, List[Tuple[int, Optional[str]]]] = {}
+    # 조문 해시 → (라벨, 조문시행일자 또는 0) (같은 조문은 한 번만 읽음)
+    units: Dict[str, Tuple[str, int]] = {}
+
+    for record in store.versions(law_id):
+        version_date = parse_date(record['effective_date'])
+        current = {}
+        for digest in store.article_hashes(law_id, record['id']).values():
+            if digest not in units:
+                unit = store.get_unit(digest)
+                article_date = unit.get('조문시행일자', '')
+                units[digest] = (article_label(unit),
+                                 parse_date(article_date) if DATE_PATTERN.match(article_date) else 0)
+            label = units[digest][0]
+            if label:
+                current[label] = digest
+
+        for label, digest in current.items():
+            history = events.setdefault(label, [])
+            if history and history[-1][1] == digest:
+                continue
+            start = max(version_date, units[digest][1])
+            # 나중에 시행되는 조문이 이전 항목보다 먼저 시작할 수는 없음
+            while history and history[-1][0] >= start:
+                history.pop()
+            history.append((start, digest))
+
+        for label, history in events.items():
+            if label in current or not history or history[-1][1] is None:
+                continue
+            # 삭제 버전 시행일 이후에 시작하려던 개정(조문시행일자 유예)은 시행되지 못함
+            while history and history[-1][0] >= version_date:
+                history.pop()
+            if history and history[-1][1] is not None:
+                history.append((version_date, None))
+
+    timelines = {}
+    for label, history in events.items():
+        timeline = ArticleTimeline()
+        for i, (start, digest) in enumerate(history):
+            end = history[i + 1][0] if i + 1 < len(history) else OPEN_END
+            if digest is not None and end > start:
+                timeline.append(start, end, digest)
+        if len(timeline):
+            timelines[label] = timeline
+    return timelines
+
+
+class AsOfIndex:
+    """시점 기준 조문 조회 인덱스 (법령별로 처음 조회할 때 로드/생성)"""
+
+    def __init__(self, store: VersionedLawStore = None, index_dir: str = None):
+        """
+        Args:
+            store: 법령 버전 저장소 (없으면 기본 폴더)
+            index_dir: 구간 인덱스 저장 폴더 (기본: <저장소>/asof)
+        """
+        self.store = store or VersionedLawStore(DEFAULT_STORE_DIR)
+        self.index_dir = index_dir or os.path.join(self.store.store_dir, 'asof')
+        self._timelines: Dict[str, Dict[str, ArticleTimeline]] = {}
+        self._articles: Dict[str, Article] = {}
+        self._law_ids: Dict[str, str] = {}
+
+    def index_path(self, law_id: str) -> str:
+        return os.path.join(self.index_dir, f"{law_id}.json")
+
+    def fingerprint(self, law_id: str) -> List[str]:
+        """저장소의 버전 ID 목록 (바뀌면 인덱스 다시 생성)"""
+        return [record['id'] for record in self.store.versions(law_id)]
+
+    def resolve_law(self, law: str) -> str:
+        """법령ID 또는 법령명 → 법령ID (매 조회마다 폴더를 읽지 않도록 기억)"""
+        if law not in self._law_ids:
+            law_ids = self.store.law_ids()
+            if law in law_ids:
+                self._law_ids[law] = law
+            else:
+                self._law_ids[law] = next(
+                    (law_id for law_id in law_ids if self.store.manifest(law_id)['name'] == law), None)
+        if self._law_ids[law] is None:
+            del self._law_ids[law]
+            raise KeyError(f"버전 저장소에 없는 법령입니다: {law}")
+        return self._law_ids[law]
+
+    def build(self, law_id: str) -> Dict[str, ArticleTimeline]:
+        """구간 인덱스 생성 후 저장"""
+        timelines = build_timelines(self.store, law_id)
+        os.makedirs(self.index_dir, exist_ok=True)
+        path = self.index_path(law_id)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'fingerprint': self.fingerprint(law_id),
+                'articles': {label: [list(interval) for interval in timeline]
+                             for label, timeline in timelines.items()},
+            }, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        self._timelines[law_id] = timelines
+        return timelines
+
+    def load(self, law_id: str) -> Optional[Dict[str, ArticleTimeline]]:
+        """저장된 구간 인덱스 (없거나 버전 목록이 바뀌었으면 None)"""
+        try:
+            with open(self.index_path(law_id), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if data.get('fingerprint') != self.fingerprint(law_id):
+            return None
+
+        timelines = {}
+        for label, intervals in data['articles'].items():
+            timeline = ArticleTimeline()
+            for start, end, digest in intervals:
+                timeline.append(start, end, digest)
+            timelines[label] = timeline
+        return timelines
+
+    def timelines(self, law: str) -> Dict[str, ArticleTimeline]:
+        """법령의 {조문 라벨: 시행 구간}"""
+        law_id = self.resolve_law(law)
+        if law_id not in self._timelines:
+            self._timelines[law_id] = self.load(law_id) or self.build(law_id)
+        return self._timelines[law_id]
+
+    def hash_at(self, law: str, label: str, date) -> Optional[str]:
+        """date에 시행 중인 조문의 해시 (없으면 None)"""
+        timeline = self.timelines(law).get(normalize_label(label))
+        return timeline.at(parse_date(date)) if timeline else None
+
+    def article(self, digest: str) -> Article:
+        """조문 해시 → Article (한 번 읽은 조문은 재사용)"""
+        if digest not in self._articles:
+            self._articles[digest] = _article_from_json(self.store.get_unit(digest))
+        return self._articles[digest]
+
+    def article_at(self, law: str, label: str, date) -> Optional[Article]:
+        """
+        date에 시행 중인 조문
+
+        Args:
+            law: 법령ID 또는 법령명 ('법인세법')
+            label: '제55조', '55', '제10조의2'
+            date: '2021-03-15', '20210315' 또는 20210315
+        """
+        digest = self.hash_at(law, label, date)
+        return self.article(digest) if digest else None
+
+    def articles_at(self, law: str, date) -> Dict[str, str]:
+        """date에 시행 중인 모든 조문 {라벨: 해시} (검색 결과를 과세연도로 거를 때)"""
+        day = parse_date(date)
+        result = {}
+        for label, timeline in self.timelines(law).items():
+            digest = timeline.at(day)
+            if digest:
+                result[label] = digest
+        return result
+
+    def is_effective(self, law: str, label: str, digest: str, start, end=None) -> bool:
+        """
+        조문 해시가 [start, end) 기간 중 하루라도 시행됐는지
+        (end가 없으면 start 하루, 과세연도는 start=YYYY0101, end=(YYYY+1)0101)
+        """
+        timeline = self.timelines(law).get(normalize_label(label))
+        if not timeline:
+            return False
+        first = parse_date(start)
+        last = parse_date(end) if end else first + 1
+        return digest in timeline.overlapping(first, last)
+
+    def history(self, law: str, label: str) -> List[Tuple[int, int, str]]:
+        """조문의 시행 구간 목록 [(시작일, 종료일, 해시)]"""
+        timeline = self.timelines(law).get(normalize_label(label))
+        return list(timeline) if timeline else []
+
+
+def _format_date(day: int) -> str:
+    return '현재' if day == OPEN_END else f"{day // 10000}-{day // 100 % 100:02d}-{day % 100:02d}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시점 기준 조문 조회")
+    parser.add_argument('--store-dir', default=DEFAULT_STORE_DIR)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    build = sub.add_parser('build', help="구간 인덱스 생성")
+    build.add_argument('laws', nargs='*', help="법령ID 또는 법령명 (없으면 전체)")
+
+    query = sub.add_parser('query', help="시점 기준 조문 본문")
+    query.add_argument('law', help="법령ID 또는 법령명")
+    query.add_argument('article', help="조문 (예: 제55조, 55, 제10조의2)")
+    query.add_argument('date', help="날짜 (YYYY-MM-DD 또는 YYYYMMDD)")
+
+    history = sub.add_parser('history', help="조문의 시행 구간 목록")
+    history.add_argument('law')
+    history.add_argument('article')
+
+    args = parser.parse_args()
+    index = AsOfIndex(VersionedLawStore(args.store_dir))
+
+    try:
+        if args.command == 'build':
+            for law in args.laws or index.store.law_ids():
+                law_id = index.resolve_law(law)
+                timelines = index.build(law_id)
+                intervals = sum(len(timeline) for timeline in timelines.values())
+                print(f"💾 {index.store.manifest(law_id)['name']} ({law_id}): 조문 {len(timelines)}개, 구간 {intervals}개")
+
+        elif args.command == 'query':
+            article = index.article_at(args.law, args.article, args.date)
+            if article is None:
+                print(f"❌ {args.date}에 시행 중인 {normalize_label(args.article)}가 없습니다.")
+                sys.exit(1)
+            print(article.text)
+            for para in article.paragraphs:
+                print(para.text)
+                for item in para.items:
+                    print(f"  {item.text}")
+                    for sub_item in item.subitems:
+                        print(f"    {sub_item.text}")
+
+        else:
+            for start, end, digest in index.history(args.law, args.article):
+                print(f"  {_format_date(start)} ~ {_format_date(end)}  {digest[:12]}")
+    except (KeyError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+조문 간 인용 추출 + 인용 그래프 인덱스
+Version 1.0.0 (2026-10-17)
+- 조문 본문(항/호/목 포함)을 미리 컴파일한 정규식 하나로 한 번만 훑어 인용 추출
+  (「조세특례제한법」 제10조, 같은 법 시행령 제3조, 이 법 제5조, 법 제55조, 영 제2조, 제5조제1항, 제3조부터 제7조까지)
+- '같은 법'은 조문 안에서 바로 앞에 나온 「법령명」, '법'/'영'은 시행령·시행규칙의 상위 법령/시행령으로 해석
+- '「소득세법」 제5조 및 제6조'처럼 및/또는/쉼표로 이어진 조문은 앞 법령을 그대로 사용
+- 법령 간 전체 그래프를 조문 단위 정방향/역방향 인접 배열(CSR, array('I'))로 저장
+  → '법인세법 제55조를 인용하는 조문'은 오프셋 두 개 사이를 자르는 조회 (본문 재검색 없음)
+
+파일 형식 (.lawcite):
+    b'LAWCITE1\\n' | 헤더 길이(uint32 LE) | 헤더 JSON (법령명, 조문 표기, 배열 길이) | uint32 배열...
+
+사용법 (process-01-crawler 폴더에서):
+    python law_citations.py build                                     # 상세 조회 캐시 → _corpus/citations.lawcite
+    python law_citations.py build --corpus _corpus/tax_laws.lawcol     # 컬럼형 코퍼스에서
+    python law_citations.py cited-by 법인세법 제55조
+    python law_citations.py cites "조세특례제한법 시행령" 제10조
+"""
+
+import argparse
+import json
+import os
+import re
+import struct
+import sys
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from law_api_cache import DEFAULT_CACHE_DIR
+from law_corpus_store import CorpusReader, load_cached_laws
+from law_model import Law, normalize_label
+
+MAGIC = b'LAWCITE1\n'
+DEFAULT_GRAPH_FILE = os.path.join('_corpus', 'citations.lawcite')
+
+DECREE_SUFFIXES = ('시행령', '시행규칙')
+
+# 인용 하나: [법령 지정] 제N조[의M][제N항][제N호][부터 제M조까지]
+CITATION_PATTERN = re.compile(r"""
+    (?:
+        「(?P<name>[^」]{1,80})」\s*
+      | (?P<same>같은\s*법|동법)(?:\s*(?P<same_sub>시행령|시행규칙))?\s*
+      | 이\s*(?P<this>법|영|규칙)(?:\s*(?P<this_sub>시행령|시행규칙))?\s*
+      | (?<![가-힣])(?P<short>법|영)\s+
+    )?
+    제\s*(?P<article>\d+)\s*조(?:\s*의\s*(?P<branch>\d+))?
+    (?:\s*제\s*(?P<paragraph>\d+)\s*항)?
+    (?:\s*제\s*(?P<item>\d+)\s*호)?
+    (?:\s*(?:부터|∼|~)\s*제\s*(?P<end>\d+)\s*조(?:\s*의\s*(?P<end_branch>\d+))?
+       (?:\s*제\s*\d+\s*항)?(?:\s*제\s*\d+\s*호)?\s*까지)?
+""", re.X)
+# 앞 인용의 법령을 이어받는 연결 ('「소득세법」 제5조 및 제6조')
+CONTINUATION = re.compile(r'\s*(?:및|또는|,|ㆍ|·|、|와|과)\s*')
+
+
+def law_key(name: str) -> str:
+    """법령명 비교용 키 (공백 제거: '법인세법 시행령' == '법인세법시행령')"""
+    return re.sub(r'\s+', '', name)
+
+
+def parent_law(name: str) -> str:
+    """'법인세법 시행령' → '법인세법' (법률이면 그대로)"""
+    for suffix in DECREE_SUFFIXES:
+        if name.endswith(suffix):
+            return name[:-len(suffix)].strip()
+    return name
+
+
+def _label(number: str, branch: Optional[str]) -> str:
+    return f"제{number}조의{branch}" if branch else f"제{number}조"
+
+
+@dataclass(slots=True)
+class Reference:
+    """조문 안의 인용 하나"""
+    law: str
+    label: str
+    paragraph: str = ''
+    item: str = ''
+    end_label: str = ''
+    text: str = ''
+
+    def __str__(self) -> str:
+        cite = self.label
+        if self.paragraph:
+            cite += f"제{self.paragraph}항"
+        if self.item:
+            cite += f"제{self.item}호"
+        return f"「{self.law}」 {cite}"
+
+
+def extract_references(text: str, law_name: str) -> List[Reference]:
+    """
+    조문 본문 → 인용 목록 (정규식 한 번 순회)
+
+    Args:
+        text: 조문 본문 (항/호/목 본문을 이어 붙인 문자열)
+        law_name: 본문이 속한 법령 (이 법/법/영/법령명 없는 제N조 해석 기준)
+    """
+    references = []
+    parent = parent_law(law_name)
+    named = None        # 가장 최근의 「법령명」 ('같은 법' 대상)
+    previous = None     # 바로 앞 인용의 법령과 끝 위치 ('및 제6조' 이어받기)
+
+    for match in CITATION_PATTERN.finditer(text):
+        groups = match.groupdict()
+        if groups['name']:
+            law = named = groups['name'].strip()
+        elif groups['same']:
+            base = named or law_name
+            law = f"{parent_law(base)} {groups['same_sub']}" if groups['same_sub'] else base
+        elif groups['this_sub']:
+            law = f"{parent} {groups['this_sub']}"
+        elif groups['this']:
+            law = {'법': parent, '영': f"{parent} 시행령"}.get(groups['this'], law_name)
+        elif groups['short']:
+            law = parent if groups['short'] == '법' else f"{parent} 시행령"
+        elif previous and CONTINUATION.fullmatch(text, previous[1], match.start()):
+            law = previous[0]
+        else:
+            law = law_name
+
+        references.append(Reference(
+            law=law,
+            label=_label(groups['article'], groups['branch']),
+            paragraph=groups['paragraph'] or '',
+            item=groups['item'] or '',
+            end_label=_label(groups['end'], groups['end_branch']) if groups['end'] else '',
+            text=match.group(0).strip(),
+        ))
+        previous = (law, match.end())
+
+    return references
+
+
+# ---------------------------------------------------------------------------
+# 코퍼스 → 조문 본문 스트림
+# ---------------------------------------------------------------------------
+
+def iter_law_texts(laws: Iterable[Law]) -> Iterator[Tuple[str, str, str]]:
+    """Law 목록 → (법령명, 조문 표기, 본문) - 편/장/절 제목 행 제외"""
+    for law in laws:
+        for article in law.iter_articles():
+            parts = [article.text]
+            for para in article.paragraphs:
+                parts.append(para.text)
+                for item in para.items:
+                    parts.append(item.text)
+                    parts += [sub.text for sub in item.subitems]
+            yield law.name, article.label, '\n'.join(part for part in parts if part)
+
+
+def iter_corpus_texts(reader: CorpusReader) -> Iterator[Tuple[str, str, str]]:
+    """컬럼형 코퍼스 → (법령명, 조문 표기, 본문) (조/항/호/목 행은 조문키별로 이어져 있음)"""
+    current = None
+    parts: List[str] = []
+    for law_name, article_key, number, branch, text in reader.rows(
+            ['law_name', 'article_key', 'article_no', 'branch_no', 'text']):
+        key = (law_name, article_key)
+        if key != current:
+            if current is not None:
+                yield current_name, current_label, '\n'.join(parts)
+            current, parts = key, []
+            current_name = law_name
+            current_label = _label(number, branch if branch and branch != '0' else None)
+        if text:
+            parts.append(text)
+    if current is not None:
+        yield current_name, current_label, '\n'.join(parts)
+
+
+# ---------------------------------------------------------------------------
+# 인용 그래프
+# ---------------------------------------------------------------------------
+
+def _csr(edges: List[Tuple[int, int]], num_nodes: int) -> Tuple[array, array]:
+    """정렬된 (출발, 도착) 간선 → (오프셋, 도착 노드) 배열"""
+    offsets = array('I', bytes(4 * (num_nodes + 1)))
+    targets = array('I', (dst for _, dst in edges))
+    for src, _ in edges:
+        offsets[src + 1] += 1
+    for node in range(num_nodes):
+        offsets[node + 1] += offsets[node]
+    return offsets, targets
+
+
+class CitationGraph:
+    """
+    조문 단위 인용 그래프 (정방향: 이 조문이 인용하는 조문, 역방향: 이 조문을 인용하는 조문)
+
+    노드 = (법령, 조문 표기). 코퍼스에 없는 법령/조문도 인용되면 노드가 됨 (in_corpus = 0)
+    간선은 노드 번호 순으로 정렬해 오프셋 배열로 묶음:
+        forward_targets[forward_offsets[n]:forward_offsets[n + 1]]
+    """
+
+    ARRAYS = ('node_laws', 'in_corpus', 'forward_offsets', 'forward_targets',
+              'reverse_offsets', 'reverse_targets')
+
+    def __init__(self, laws: List[str], labels: List[str], node_laws: array, in_corpus: array,
+                 forward: Tuple[array, array], reverse: Tuple[array, array]):
+        self.laws = laws
+        self.labels = labels
+        self.node_laws = node_laws
+        self.in_corpus = in_corpus
+        self.forward_offsets, self.forward_targets = forward
+        self.reverse_offsets, self.reverse_targets = reverse
+        self._law_index = {law_key(name): index for index, name in enumerate(laws)}
+        self._nodes = {(law, label): node for node, (law, label) in enumerate(zip(node_laws, labels))}
+
+    # -- 조회 ---------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.forward_targets)
+
+    def node(self, law: str, label: str) -> int:
+        """
+        (법령명, 조문) → 노드 번호
+
+        Raises:
+            KeyError: 그래프에 없는 법령/조문
+        """
+        return self._nodes[(self._law_index[law_key(law)], normalize_label(label))]
+
+    def describe(self, node: int) -> Tuple[str, str]:
+        return self.laws[self.node_laws[node]], self.labels[node]
+
+    def _neighbors(self, offsets: array, targets: array, law: str, label: str) -> List[Tuple[str, str]]:
+        try:
+            node = self.node(law, label)
+        except KeyError:
+            return []
+        return [self.describe(target) for target in targets[offsets[node]:offsets[node + 1]]]
+
+    def cites(self, law: str, label: str) -> List[Tuple[str, str]]:
+        """조문이 인용하는 조문 목록"""
+        return self._neighbors(self.forward_offsets, self.forward_targets, law, label)
+
+    def cited_by(self, law: str, label: str) -> List[Tuple[str, str]]:
+        """조문을 인용하는 조문 목록"""
+        return self._neighbors(self.reverse_offsets, self.reverse_targets, law, label)
+
+    def references_of(self, law: str, label: str) -> List[str]:
+        """조문 메타데이터의 references 형식 (같은 법령은 '제5조', 다른 법령은 '「소득세법」 제5조')"""
+        own = law_key(law)
+        return [cited if law_key(name) == own else f"「{name}」 {cited}" for name, cited in self.cites(law, label)]
+
+    # -- 저장 ---------------------------------------------------------------
+
+    def save(self, path: str) -> int:
+        """바이너리 파일로 저장 (기록한 바이트 수 반환)"""
+        arrays = [getattr(self, name) for name in self.ARRAYS]
+        header = json.dumps({
+            'laws': self.laws,
+            'labels': self.labels,
+            'arrays': {name: len(arr) for name, arr in zip(self.ARRAYS, arrays)},
+        }, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(struct.pack('<I', len(header)))
+            f.write(header)
+            for arr in arrays:
+                if sys.byteorder == 'big':
+                    arr = array(arr.typecode, arr)
+                    arr.byteswap()
+                arr.tofile(f)
+        os.replace(tmp_path, path)
+        return os.path.getsize(path)
+
+    @classmethod
+    def load(cls, path: str) -> 'CitationGraph':
+        """
+        Raises:
+            ValueError: 인용 그래프 파일이 아님
+        """
+        with open(path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"인용 그래프 파일 형식이 아닙니다: {path}")
+            header_len = struct.unpack('<I', f.read(4))[0]
+            header = json.loads(f.read(header_len))
+            arrays = []
+            for name in cls.ARRAYS:
+                arr = array('I')
+                arr.fromfile(f, header['arrays'][name])
+                if sys.byteorder == 'big':
+                    arr.byteswap()
+                arrays.append(arr)
+
+        node_laws, in_corpus, forward_offsets, forward_targets, reverse_offsets, reverse_targets = arrays
+        return cls(header['laws'], header['labels'], node_laws, in_corpus,
+                   (forward_offsets, forward_targets), (reverse_offsets, reverse_targets))
+
+
+def build_citation_graph(articles: Iterable[Tuple[str, str, str]]) -> CitationGraph:
+    """
+    (법령명, 조문 표기, 본문) 스트림 → 인용 그래프
+
+    조문마다 extract_references 한 번, 자기 자신 인용(조문 제목의 '제55조' 등)은 제외.
+    '제3조부터 제7조까지'는 대상 법령이 코퍼스에 있으면 그 조문 순서대로 펼치고, 없으면 양 끝 조문만 연결
+    """
+    laws: List[str] = []
+    law_index: Dict[str, int] = {}
+    labels: List[str] = []
+    node_laws = array('I')
+    nodes: Dict[Tuple[int, str], int] = {}
+    corpus_nodes: Set[int] = set()
+    # 법령별 코퍼스 조문 순서 (범위 인용 펼치기용)
+    order: Dict[int, List[int]] = {}
+
+    def node_of(law: str, label: str) -> int:
+        key = law_key(law)
+        index = law_index.get(key)
+        if index is None:
+            index = law_index[key] = len(laws)
+            laws.append(law)
+        node = nodes.get((index, label))
+        if node is None:
+            node = nodes[(index, label)] = len(labels)
+            labels.append(label)
+            node_laws.append(index)
+        return node
+
+    edges: Set[Tuple[int, int]] = set()
+    ranges: List[Tuple[int, int, int]] = []
+
+    for law_name, label, text in articles:
+        source = node_of(law_name, label)
+        if source not in corpus_nodes:
+            corpus_nodes.add(source)
+            order.setdefault(node_laws[source], []).append(source)
+            # 코퍼스 법령명 표기를 우선 (인용문의 「」 표기보다 정확)
+            laws[node_laws[source]] = law_name
+
+        for ref in extract_references(text, law_name):
+            target = node_of(ref.law, ref.label)
+            if target != source:
+                edges.add((source, target))
+            if ref.end_label:
+                ranges.append((source, target, node_of(ref.law, ref.end_label)))
+
+    positions: Dict[int, Dict[int, int]] = {}
+    for source, start, end in ranges:
+        members = order.get(node_laws[start], [])
+        if node_laws[start] not in positions:
+            positions[node_laws[start]] = {node: position for position, node in enumerate(members)}
+        position = positions[node_laws[start]]
+        if start in position and end in position and position[start] <= position[end]:
+            span = members[position[start]:position[end] + 1]
+        else:
+            span = [start, end]
+        edges.update((source, target) for target in span if target != source)
+
+    forward = sorted(edges)
+    reverse = sorted((dst, src) for src, dst in edges)
+    in_corpus = array('I', (1 if node in corpus_nodes else 0 for node in range(len(labels))))
+    return CitationGraph(laws, labels, node_laws, in_corpus,
+                         _csr(forward, len(labels)), _csr(reverse, len(labels)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="조문 인용 추출 + 인용 그래프")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    build = sub.add_parser('build', help="코퍼스 전체 → 인용 그래프 파일")
+    build.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="상세 조회 캐시 (기본)")
+    build.add_argument('--corpus', help="컬럼형 코퍼스 파일 (.lawcol)")
+    build.add_argument('--out', default=DEFAULT_GRAPH_FILE)
+
+    for command, help_text in (('cites', "조문이 인용하는 조문"), ('cited-by', "조문을 인용하는 조문")):
+        query = sub.add_parser(command, help=help_text)
+        query.add_argument('law', help="법령명 (예: 법인세법, '법인세법 시행령')")
+        query.add_argument('article', help="조문 (예: 제55조, 10의2)")
+        query.add_argument('--graph', default=DEFAULT_GRAPH_FILE)
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == 'build':
+            start = time.perf_counter()
+            if args.corpus:
+                with CorpusReader(args.corpus) as reader:
+                    graph = build_citation_graph(iter_corpus_texts(reader))
+            else:
+                graph = build_citation_graph(iter_law_texts(load_cached_laws(args.cache_dir)))
+            elapsed = time.perf_counter() - start
+            size = graph.save(args.out)
+            external = len(graph) - sum(graph.in_corpus)
+            print(f"💾 인용 그래프 저장: {args.out} ({size:,} bytes, {elapsed:.2f}s)")
+            print(f"   조문 {len(graph):,}개 (코퍼스 밖 {external:,}개), 인용 {graph.num_edges:,}건, 법령 {len(graph.laws)}개")
+            return
+
+        graph = CitationGraph.load(args.graph)
+        start = time.perf_counter()
+        found = graph.cites(args.law, args.article) if args.command == 'cites' \
+            else graph.cited_by(args.law, args.article)
+        elapsed = (time.perf_counter() - start) * 1e6
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    verb = '인용하는' if args.command == 'cites' else '인용받는'
+    print(f"🔗 {args.law} {normalize_label(args.article)}: {verb} 조문 {len(found)}개 ({elapsed:.0f}µs)")
+    for name, label in found:
+        print(f"  - {name} {label}")
+
+
+if __name__ == "__main__":
+    main()
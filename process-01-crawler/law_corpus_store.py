@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+법령 코퍼스 컬럼형 저장소
+Version 1.0.0 (2026-10-17)
+- 파싱된 법령 전체를 파일 하나(.lawcol)에 컬럼 단위로 저장
+- 조/항/호/목 한 단위가 한 행 (법령ID, 조문번호, 가지번호, 시행일자, 본문 ...)
+- 읽을 때는 mmap으로 열어 필요한 컬럼만 접근 (전체 구조를 파싱하지 않음)
+- 조건 조회(rows(where=...))는 cat 컬럼 코드끼리 비교 (행마다 문자열을 디코딩하지 않음)
+
+파일 형식:
+    b'LAWCOL1\\n' | 헤더 길이(uint32 LE) | 헤더 JSON | 컬럼 블록...
+
+    - str 컬럼: 오프셋 배열(uint32 × (행 수 + 1)) + UTF-8 본문
+    - cat 컬럼: 코드 배열(uint32 × 행 수), 값 목록은 헤더에 저장 (법령ID처럼 반복이 많은 값)
+
+사용법 (process-01-crawler 폴더에서):
+    python law_corpus_store.py export --out _corpus/tax_laws.lawcol
+    python law_corpus_store.py show _corpus/tax_laws.lawcol --columns law_id,article_no,text --limit 5
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from law_api_cache import LawDetailCache, DEFAULT_CACHE_DIR
+from law_json_decode import loads
+from law_model import Law, law_from_json
+
+MAGIC = b'LAWCOL1\n'
+
+# 컬럼명 → 형식 (cat: 값 사전 + 코드, str: 가변 길이 문자열)
+COLUMNS = (
+    ('law_id', 'cat'),
+    ('law_name', 'cat'),
+    ('effective_date', 'cat'),
+    ('level', 'cat'),
+    ('article_key', 'str'),
+    ('article_no', 'cat'),
+    ('branch_no', 'cat'),
+    ('paragraph_no', 'cat'),
+    ('item_no', 'cat'),
+    ('subitem_no', 'cat'),
+    ('title', 'str'),
+    ('text', 'str'),
+)
+COLUMN_NAMES = tuple(name for name, _ in COLUMNS)
+
+
+def _uint32_array(values: Iterable[int]) -> array:
+    arr = array('I', values)
+    if arr.itemsize != 4:
+        raise RuntimeError("uint32 배열을 만들 수 없는 플랫폼입니다")
+    if sys.byteorder == 'big':
+        arr.byteswap()
+    return arr
+
+
+def iter_law_rows(law: Law) -> Iterator[Tuple[str, ...]]:
+    """Law → 행 (COLUMN_NAMES 순서), 편/장/절 제목 행은 제외"""
+    for article in law.iter_articles():
+        date = article.effective_date or law.effective_date
+        base = (law.law_id, law.name, date)
+        yield base + ('조', article.key, article.number, article.branch, '', '', '', article.title, article.text)
+
+        for para in article.paragraphs:
+            yield base + ('항', article.key, article.number, article.branch, para.number, '', '', '', para.text)
+
+            for item in para.items:
+                yield base + ('호', article.key, article.number, article.branch, para.number, item.number, '', '', item.text)
+
+                for sub in item.subitems:
+                    yield base + ('목', article.key, article.number, article.branch,
+                                  para.number, item.number, sub.number, '', sub.text)
+
+
+def write_corpus(path: str, laws: Iterable[Law]) -> int:
+    """
+    법령 목록 → 컬럼형 파일 (임시 파일에 쓰고 교체)
+
+    Returns:
+        저장한 행 수
+    """
+    columns: Dict[str, list] = {name: [] for name in COLUMN_NAMES}
+    cat_values: Dict[str, Dict[str, int]] = {name: {} for name, kind in COLUMNS if kind == 'cat'}
+    rows = 0
+
+    for law in laws:
+        for row in iter_law_rows(law):
+            for name, value in zip(COLUMN_NAMES, row):
+                codes = cat_values.get(name)
+                if codes is not None:
+                    code = codes.get(value)
+                    if code is None:
+                        code = codes[value] = len(codes)
+                    columns[name].append(code)
+                else:
+                    columns[name].append(value)
+            rows += 1
+
+    blocks = []
+    header = {'rows': rows, 'columns': []}
+    offset = 0
+    for name, kind in COLUMNS:
+        if kind == 'cat':
+            data = _uint32_array(columns[name]).tobytes()
+            meta = {'name': name, 'type': 'cat', 'values': list(cat_values[name])}
+        else:
+            encoded = [value.encode('utf-8') for value in columns[name]]
+            offsets = [0]
+            for value in encoded:
+                offsets.append(offsets[-1] + len(value))
+            data = _uint32_array(offsets).tobytes() + b''.join(encoded)
+            meta = {'name': name, 'type': 'str'}
+        meta.update({'offset': offset, 'length': len(data)})
+        header['columns'].append(meta)
+        blocks.append(data)
+        offset += len(data)
+
+    header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack('<I', len(header_bytes)))
+        f.write(header_bytes)
+        for data in blocks:
+            f.write(data)
+    os.replace(tmp_path, path)
+
+    return rows
+
+
+class CorpusColumn:
+    """mmap 위의 컬럼 하나 (접근한 행만 디코딩)"""
+
+    def __init__(self, buf: memoryview, meta: Dict, rows: int):
+        self.name = meta['name']
+        self.rows = rows
+        block = buf[meta['offset']:meta['offset'] + meta['length']]
+
+        if meta['type'] == 'cat':
+            self.values = meta['values']
+            self.codes = block.cast('I')
+            self.offsets = None
+            self._code_of: Optional[Dict[str, int]] = None
+        else:
+            self.values = None
+            self.offsets = block[:(rows + 1) * 4].cast('I')
+            self.data = block[(rows + 1) * 4:]
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += self.rows
+        if self.values is not None:
+            return self.values[self.codes[index]]
+        return str(self.data[self.offsets[index]:self.offsets[index + 1]], 'utf-8')
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self.rows):
+            yield self[index]
+
+    def code_of(self, value: str) -> Optional[int]:
+        """cat 컬럼 값 → 코드 (값 목록에 없으면 None, 값 사전은 처음 호출 때 한 번 만듦)"""
+        if self._code_of is None:
+            self._code_of = {v: code for code, v in enumerate(self.values)}
+        return self._code_of.get(value)
+
+    def equals(self, index: int, encoded: bytes) -> bool:
+        """str 컬럼 행이 UTF-8 바이트 값과 같은지 (길이부터 비교, 디코딩 없음)"""
+        start = self.offsets[index]
+        end = self.offsets[index + 1]
+        return end - start == len(encoded) and self.data[start:end] == encoded
+
+    def release(self):
+        for view in (getattr(self, 'codes', None), self.offsets, getattr(self, 'data', None)):
+            if view is not None:
+                view.release()
+
+
+class CorpusReader:
+    """
+    컬럼형 코퍼스 읽기 (mmap)
+
+    사용 예:
+        with CorpusReader('_corpus/tax_laws.lawcol') as corpus:
+            for law_id, text in corpus.rows(['law_id', 'text']):
+                ...
+    """
+
+    def __init__(self, path: str):
+        if sys.byteorder == 'big':
+            raise RuntimeError("빅엔디언 플랫폼에서는 mmap 읽기를 지원하지 않습니다")
+
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buf = memoryview(self._mmap)
+
+        if bytes(self._buf[:len(MAGIC)]) != MAGIC:
+            self.close()
+            raise ValueError(f"코퍼스 파일 형식이 아닙니다: {path}")
+
+        header_len = struct.unpack_from('<I', self._buf, len(MAGIC))[0]
+        header_start = len(MAGIC) + 4
+        self.header = json.loads(bytes(self._buf[header_start:header_start + header_len]))
+        self.num_rows = self.header['rows']
+        self._data_start = header_start + header_len
+        self._meta = {meta['name']: meta for meta in self.header['columns']}
+        self._columns: Dict[str, CorpusColumn] = {}
+
+    @property
+    def column_names(self) -> List[str]:
+        return [meta['name'] for meta in self.header['columns']]
+
+    def column(self, name: str) -> CorpusColumn:
+        """컬럼 하나 (처음 접근할 때 뷰 생성)"""
+        if name not in self._columns:
+            if name not in self._meta:
+                raise KeyError(f"없는 컬럼입니다: {name}")
+            self._columns[name] = CorpusColumn(self._buf[self._data_start:], self._meta[name], self.num_rows)
+        return self._columns[name]
+
+    def rows(self, columns: Optional[Sequence[str]] = None,
+             where: Optional[Dict[str, str]] = None) -> Iterator[Tuple[str, ...]]:
+        """
+        필요한 컬럼만 행 단위로 읽기
+
+        Args:
+            columns: 읽을 컬럼 (없으면 전체)
+            where: 컬럼 = 값 조건 (예: {'law_id': '001563', 'level': '조'})
+                   cat 컬럼은 값을 코드로 한 번 바꿔 코드끼리, str 컬럼은 UTF-8 바이트끼리 비교
+                   (조건 비교에 행 문자열을 디코딩하지 않음, 일치한 행의 선택 컬럼만 디코딩)
+        """
+        selected = [self.column(name) for name in (columns or self.column_names)]
+        code_filters = []
+        text_filters = []
+        for name, value in (where or {}).items():
+            column = self.column(name)
+            if column.values is not None:
+                code = column.code_of(value)
+                if code is None:
+                    # 값 목록에 없는 값 → 일치하는 행 없음
+                    return
+                code_filters.append((column.codes, code))
+            else:
+                text_filters.append((column, value.encode('utf-8')))
+
+        if code_filters:
+            # 첫 cat 조건의 코드 배열을 훑어 후보 행만 나머지 조건으로 확인
+            first_codes, first_code = code_filters.pop(0)
+            candidates = (index for index, code in enumerate(first_codes) if code == first_code)
+        else:
+            candidates = range(self.num_rows)
+
+        for index in candidates:
+            if code_filters and not all(codes[index] == code for codes, code in code_filters):
+                continue
+            if text_filters and not all(column.equals(index, value) for column, value in text_filters):
+                continue
+            yield tuple(col[index] for col in selected)
+
+    def close(self):
+        for column in self._columns.values():
+            column.release()
+        self._columns.clear()
+        if getattr(self, '_buf', None) is not None:
+            self._buf.release()
+            self._buf = None
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_cached_laws(cache_dir: str) -> List[Law]:
+    """
+    상세 조회 캐시(law_api_cache)의 JSON 전체 조문 응답 → Law 목록
+
+    같은 법령ID가 여러 번 있으면 가장 최근에 저장한 것 사용
+    (만료 여부와 무관하게 저장된 응답을 그대로 사용)
+    """
+    cache = LawDetailCache(cache_dir)
+    latest: Dict[str, Tuple[float, Law]] = {}
+
+    for key, entry in cache.index.items():
+        # 조문(JO) 단위 조회나 JSON이 아닌 응답은 제외
+        if 'target=law|' not in key or '|JO=|' not in key or not key.endswith('type=JSON'):
+            continue
+
+        try:
+            with open(cache.blob_path(entry['blob']), 'rb') as f:
+                law = law_from_json(loads(f.read()))
+        except (OSError, KeyError, json.JSONDecodeError):
+            continue
+        if not law.law_id:
+            continue
+
+        saved_at = entry.get('saved_at', 0)
+        if law.law_id not in latest or latest[law.law_id][0] < saved_at:
+            latest[law.law_id] = (saved_at, law)
+
+    return [law for _, law in latest.values()]
+
+
+def export_corpus(path: str, cache_dir: str = DEFAULT_CACHE_DIR) -> int:
+    """상세 조회 캐시 → 컬럼형 파일 (저장한 행 수 반환)"""
+    laws = load_cached_laws(cache_dir)
+    rows = write_corpus(path, laws)
+    print(f"💾 코퍼스 저장: {path} (법령 {len(laws)}개, {rows:,}행, {os.path.getsize(path):,} bytes)")
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="법령 코퍼스 컬럼형 저장소")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    export = sub.add_parser('export', help="상세 조회 캐시 → 컬럼형 파일")
+    export.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR)
+    export.add_argument('--out', default='_corpus/tax_laws.lawcol')
+
+    show = sub.add_parser('show', help="컬럼형 파일 내용 보기")
+    show.add_argument('path')
+    show.add_argument('--columns', help="쉼표로 구분한 컬럼 (기본: 전체)")
+    show.add_argument('--law-id', help="법령ID 조건")
+    show.add_argument('--limit', type=int, default=20)
+
+    args = parser.parse_args()
+
+    if args.command == 'export':
+        export_corpus(args.out, args.cache_dir)
+    else:
+        columns = args.columns.split(',') if args.columns else None
+        where = {'law_id': args.law_id} if args.law_id else None
+        with CorpusReader(args.path) as corpus:
+            print(f"📊 {corpus.num_rows:,}행 / 컬럼: {', '.join(corpus.column_names)}")
+            for i, row in enumerate(corpus.rows(columns, where)):
+                if i >= args.limit:
+                    break
+                print(' | '.join(value[:60] for value in row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+법령 두 버전의 구조 비교 (조/항/호/목 단위)
+Version 1.0.0 (2026-10-17)
+- 조문은 조문키로 짝지음 (편/장/절 제목 행처럼 키가 겹치면 등장 순서로 구분)
+- 조문/항/호/목마다 내용 해시를 만들어 같은 하위 트리는 내려가지 않음
+- 결과: 추가/삭제/변경 조문, 변경된 항/호/목의 단어 단위 차이 (difflib)
+- 입력: lawService.do JSON/XML 파일 두 개, 또는 법령 버전 저장소(law_version_store)의 두 버전
+
+사용법 (process-01-crawler 폴더에서):
+    python law_diff.py old.json new.json
+    python law_diff.py --law 001584 --old 20200101 --new 20210101      # 시행일자 또는 버전 ID
+    python law_diff.py --law 001584 --old 20200101 --new 20210101 --json diff.json
+"""
+
+import argparse
+import difflib
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from law_json_decode import loads
+from law_model import Law, Article, Paragraph, Item, SubItem, law_from_json
+from law_version_store import VersionedLawStore, DEFAULT_STORE_DIR
+from law_xml_stream import parse_law_detail
+
+# 단어 단위 비교용 토큰 (공백 묶음도 토큰으로 남겨 원문 그대로 다시 이을 수 있게 함)
+TOKEN_PATTERN = re.compile(r'\s+|[^\s]+')
+
+
+# ---------------------------------------------------------------------------
+# 결과
+# ---------------------------------------------------------------------------
+
+@dataclass(slots=True)
+class TextChange:
+    """조문/항/호/목 한 곳의 변경 (kind: added/removed/modified)"""
+    path: str
+    kind: str
+    old: str = ''
+    new: str = ''
+    # (difflib 태그, 이전 토큰들, 새 토큰들), kind가 modified일 때만
+    ops: List[Tuple[str, str, str]] = field(default_factory=list)
+
+    def inline(self) -> str:
+        """'[-이전-]{+새로운+}' 표시를 넣은 본문"""
+        if self.kind == 'added':
+            return f"{{+{self.new}+}}"
+        if self.kind == 'removed':
+            return f"[-{self.old}-]"
+        parts = []
+        for tag, old, new in self.ops:
+            if tag == 'equal':
+                parts.append(old)
+                continue
+            if old:
+                parts.append(f"[-{old}-]")
+            if new:
+                parts.append(f"{{+{new}+}}")
+        return ''.join(parts)
+
+    def to_dict(self) -> Dict:
+        info = {'path': self.path, 'kind': self.kind, 'old': self.old, 'new': self.new}
+        if self.ops:
+            info['ops'] = [list(op) for op in self.ops if op[0] != 'equal']
+        return info
+
+
+@dataclass(slots=True)
+class ArticleChange:
+    """조문 하나의 변경 (kind: added/removed/modified)"""
+    key: str
+    label: str
+    kind: str
+    changes: List[TextChange] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        return {'key': self.key, 'label': self.label, 'kind': self.kind,
+                'changes': [change.to_dict() for change in self.changes]}
+
+
+@dataclass(slots=True)
+class LawDiff:
+    """법령 두 버전의 비교 결과"""
+    old_name: str = ''
+    new_name: str = ''
+    added: List[ArticleChange] = field(default_factory=list)
+    removed: List[ArticleChange] = field(default_factory=list)
+    modified: List[ArticleChange] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
+    def to_dict(self) -> Dict:
+        return {
+            'old': self.old_name,
+            'new': self.new_name,
+            'summary': {'added': len(self.added), 'removed': len(self.removed),
+                        'modified': len(self.modified), 'unchanged': self.unchanged},
+            'added': [change.to_dict() for change in self.added],
+            'removed': [change.to_dict() for change in self.removed],
+            'modified': [change.to_dict() for change in self.modified],
+        }
+
+
+# ---------------------------------------------------------------------------
+# 노드 해시
+# ---------------------------------------------------------------------------
+
+def _digest(*parts) -> bytes:
+    """문자열/하위 해시 → 16바이트 해시 (구분자로 경계 보존)"""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part if isinstance(part, bytes) else part.encode('utf-8'))
+        h.update(b'\x1f')
+    return h.digest()
+
+
+def subitem_hash(sub: SubItem) -> bytes:
+    return _digest(sub.number, sub.text)
+
+
+def item_hash(item: Item) -> bytes:
+    return _digest(item.number, item.text, *(subitem_hash(sub) for sub in item.subitems))
+
+
+def paragraph_hash(para: Paragraph) -> bytes:
+    return _digest(para.number, para.text, *(item_hash(item) for item in para.items))
+
+
+def article_hash(article: Article) -> bytes:
+    """
+    조문 내용 해시 (항/호/목까지 한 번에, 구분자로 단계 구분)
+
+    조문제개정유형/조문변경여부는 개정 표시일 뿐 본문이 아니므로 제외
+    (본문이 같은데 표시만 바뀐 조문을 변경으로 보지 않음)
+    항/호/목 해시는 조문 해시가 다를 때만 계산
+    """
+    parts = [article.kind, article.title, article.text, article.effective_date]
+    for para in article.paragraphs:
+        parts += ('\x1e', para.number, para.text)
+        for item in para.items:
+            parts += ('\x1d', item.number, item.text)
+            for sub in item.subitems:
+                parts += ('\x1c', sub.number, sub.text)
+    return hashlib.blake2b('\x1f'.join(parts).encode('utf-8'), digest_size=16).digest()
+
+
+# ---------------------------------------------------------------------------
+# 비교
+# ---------------------------------------------------------------------------
+
+def token_ops(old: str, new: str) -> List[Tuple[str, str, str]]:
+    """단어 단위 차이 [(태그, 이전, 새)] (equal 포함, 이으면 원문이 됨)"""
+    a = TOKEN_PATTERN.findall(old)
+    b = TOKEN_PATTERN.findall(new)
+    matcher = difflib.SequenceMatcher(None, a, b, autojunk=False)
+    return [(tag, ''.join(a[i1:i2]), ''.join(b[j1:j2])) for tag, i1, i2, j1, j2 in matcher.get_opcodes()]
+
+
+def _text_change(path: str, old: str, new: str, changes: List[TextChange]):
+    if old == new:
+        return
+    if not old:
+        changes.append(TextChange(path, 'added', new=new))
+    elif not new:
+        changes.append(TextChange(path, 'removed', old=old))
+    else:
+        changes.append(TextChange(path, 'modified', old, new, token_ops(old, new)))
+
+
+def keyed(nodes: Sequence, key_func: Callable) -> Dict[str, object]:
+    """노드 목록 → {키: 노드} (키가 비었거나 겹치면 '키#순번')"""
+    result = {}
+    seen: Dict[str, int] = {}
+    for index, node in enumerate(nodes):
+        key = key_func(node) or f"#{index}"
+        count = seen.get(key, 0)
+        seen[key] = count + 1
+        result[f"{key}#{count}" if count else key] = node
+    return result
+
+
+def _diff_children(path: str, old_nodes: Sequence, new_nodes: Sequence, hash_func: Callable,
+                   diff_func: Callable, changes: List[TextChange]):
+    """번호로 짝지은 하위 노드 비교 (해시가 같으면 건너뜀)"""
+    old_map = keyed(old_nodes, lambda node: node.number.strip())
+    new_map = keyed(new_nodes, lambda node: node.number.strip())
+
+    for key, new in new_map.items():
+        old = old_map.get(key)
+        child_path = f"{path} {new.number.strip() or key}".strip()
+        if old is None:
+            changes.append(TextChange(child_path, 'added', new=_node_text(new)))
+        elif hash_func(old) != hash_func(new):
+            diff_func(child_path, old, new, changes)
+
+    for key, old in old_map.items():
+        if key not in new_map:
+            changes.append(TextChange(f"{path} {old.number.strip() or key}".strip(), 'removed', old=_node_text(old)))
+
+
+def _node_text(node) -> str:
+    """항/호/목과 하위 본문 전체 (추가/삭제된 노드 표시용)"""
+    lines = [node.text]
+    for child in getattr(node, 'items', None) or getattr(node, 'subitems', None) or []:
+        lines.append(_node_text(child))
+    return '\n'.join(line for line in lines if line)
+
+
+def _diff_subitem(path: str, old: SubItem, new: SubItem, changes: List[TextChange]):
+    _text_change(path, old.text, new.text, changes)
+
+
+def _diff_item(path: str, old: Item, new: Item, changes: List[TextChange]):
+    _text_change(path, old.text, new.text, changes)
+    _diff_children(path, old.subitems, new.subitems, subitem_hash, _diff_subitem, changes)
+
+
+def _diff_paragraph(path: str, old: Paragraph, new: Paragraph, changes: List[TextChange]):
+    _text_change(path, old.text, new.text, changes)
+    _diff_children(path, old.items, new.items, item_hash, _diff_item, changes)
+
+
+def diff_article(old: Article, new: Article) -> List[TextChange]:
+    """조문 하나의 항/호/목 단위 변경"""
+    label = new.label or new.text.strip()
+    changes: List[TextChange] = []
+    _text_change(f"{label} 제목", old.title, new.title, changes)
+    _text_change(f"{label} 본문", old.text, new.text, changes)
+    _text_change(f"{label} 시행일자", old.effective_date, new.effective_date, changes)
+    _diff_children(label, old.paragraphs, new.paragraphs, paragraph_hash, _diff_paragraph, changes)
+    return changes
+
+
+def diff_laws(old: Law, new: Law, old_hashes: Sequence = None, new_hashes: Sequence = None) -> LawDiff:
+    """
+    법령 두 버전 비교
+
+    Args:
+        old_hashes, new_hashes: 조문 순서대로의 내용 해시 (버전 저장소처럼 이미 있으면 다시 계산하지 않음,
+            양쪽이 같은 방식의 해시여야 함)
+
+    Returns:
+        LawDiff (변경 조문은 새 버전 순서, 삭제 조문은 이전 버전 순서)
+    """
+    result = LawDiff(old_name=_version_name(old), new_name=_version_name(new))
+    if old_hashes is None or new_hashes is None:
+        old_hashes = [article_hash(article) for article in old.articles]
+        new_hashes = [article_hash(article) for article in new.articles]
+    old_map = keyed(list(zip(old.articles, old_hashes)), lambda pair: pair[0].key)
+    new_map = keyed(list(zip(new.articles, new_hashes)), lambda pair: pair[0].key)
+
+    for key, (article, digest) in new_map.items():
+        label = article.label or article.text.strip()
+        previous, previous_digest = old_map.get(key, (None, None))
+        if previous is None:
+            result.added.append(ArticleChange(key, label, 'added'))
+        elif previous_digest == digest:
+            result.unchanged += 1
+        else:
+            # 저장소 해시는 개정 표시까지 포함하므로 본문 차이가 없으면 동일로 봄
+            changes = diff_article(previous, article)
+            if changes:
+                result.modified.append(ArticleChange(key, label, 'modified', changes))
+            else:
+                result.unchanged += 1
+
+    for key, (article, _) in old_map.items():
+        if key not in new_map:
+            result.removed.append(ArticleChange(key, article.label or article.text.strip(), 'removed'))
+
+    return result
+
+
+def _version_name(law: Law) -> str:
+    return f"{law.name} (시행 {law.effective_date})" if law.effective_date else law.name
+
+
+# ---------------------------------------------------------------------------
+# 입력/출력
+# ---------------------------------------------------------------------------
+
+def load_law_file(path: str) -> Law:
+    """lawService.do JSON/XML 응답 파일 → Law"""
+    with open(path, 'rb') as f:
+        content = f.read()
+    if content.lstrip()[:1] == b'<':
+        return parse_law_detail(content)
+    return law_from_json(loads(content))
+
+
+def load_store_version(store: VersionedLawStore, law_id: str, selector: str) -> Tuple[Law, List[str]]:
+    """
+    버전 저장소의 버전 (버전 ID 또는 그 날짜에 시행 중인 버전)
+
+    Returns:
+        (Law, 조문 순서대로의 저장소 단위 해시) - 해시는 diff_laws에 그대로 넘김
+    """
+    record = store.find_version(law_id, selector) or store.version_at(law_id, selector.replace('-', ''))
+    if record is None:
+        raise KeyError(f"버전 저장소에 없는 버전입니다: {law_id} {selector}")
+    keys, hashes = store.tables(law_id, record['id'])['조문']
+    return store.load(law_id, record['id']), [hashes[key] for key in keys]
+
+
+def print_diff(diff: LawDiff, limit: Optional[int] = None):
+    """비교 결과 출력 (변경 조문은 단어 단위 차이 표시)"""
+    print(f"📋 {diff.old_name} → {diff.new_name}")
+    print(f"   추가 {len(diff.added)} / 삭제 {len(diff.removed)} / 변경 {len(diff.modified)} / "
+          f"동일 {diff.unchanged}")
+
+    for change in diff.added:
+        print(f"\n➕ {change.label}")
+    for change in diff.removed:
+        print(f"\n➖ {change.label}")
+    for change in diff.modified[:limit]:
+        print(f"\n✏️ {change.label}")
+        for text_change in change.changes:
+            print(f"   [{text_change.path}] {text_change.inline()}")
+    if limit is not None and len(diff.modified) > limit:
+        print(f"\n... 변경 조문 {len(diff.modified) - limit}개 더 있음 (--json으로 전체 저장)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="법령 두 버전의 구조 비교")
+    parser.add_argument('files', nargs='*', help="이전/새 lawService.do JSON 또는 XML 파일")
+    parser.add_argument('--law', help="버전 저장소의 법령ID")
+    parser.add_argument('--old', help="이전 버전 (버전 ID 또는 시행일자)")
+    parser.add_argument('--new', help="새 버전 (버전 ID 또는 시행일자)")
+    parser.add_argument('--store-dir', default=DEFAULT_STORE_DIR)
+    parser.add_argument('--json', help="비교 결과 JSON 저장 경로")
+    parser.add_argument('--limit', type=int, default=30, help="화면에 표시할 변경 조문 수")
+    args = parser.parse_args()
+
+    old_hashes = new_hashes = None
+    try:
+        if args.law and args.old and args.new:
+            store = VersionedLawStore(args.store_dir)
+            old, old_hashes = load_store_version(store, args.law, args.old)
+            new, new_hashes = load_store_version(store, args.law, args.new)
+        elif len(args.files) == 2 and all(os.path.exists(path) for path in args.files):
+            old, new = (load_law_file(path) for path in args.files)
+        else:
+            parser.error("파일 두 개 또는 --law/--old/--new를 지정하세요")
+    except (OSError, KeyError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    diff = diff_laws(old, new, old_hashes, new_hashes)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print_diff(diff, args.limit)
+    print(f"\n⏱️ 비교 {elapsed:.1f} ms")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(diff.to_dict(), f, ensure_ascii=False, indent=2)
+        print(f"💾 {args.json} 저장 완료")
+
+
+if __name__ == "__main__":
+    main()
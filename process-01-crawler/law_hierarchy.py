@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+법령 편/장/절/관/목 계층 인덱스
+Version 1.0.0 (2026-10-17)
+- 조문단위 목록(조문과 '전문' 제목 행이 섞인 순서)을 한 번 훑어 편→장→절→관→목 트리 생성
+- 노드마다 상위 노드(parent)와 소속 조문 범위 [start, end)를 보관 (조문 순번 기준, 하위 노드 포함)
+- 조문마다 가장 안쪽 노드를 기록 → '제55조의 장/절 경로'는 상위 노드만 따라 올라감 (깊이 ≤ 5)
+- '제2장 제1절의 모든 조문'은 노드 찾기(번호 색인) + 범위 자르기 (조문 전체를 훑지 않음)
+- 노드/조문 값은 열 단위 배열(array)로 저장, JSON 파일로 법령 옆에 보관 (<법령>_계층_*.json)
+
+사용법 (process-01-crawler 폴더에서):
+    python law_hierarchy.py build 법인세법_전체조문.json          # 법인세법_전체조문.hierarchy.json
+    python law_hierarchy.py show 법인세법_전체조문.hierarchy.json
+    python law_hierarchy.py path 법인세법_전체조문.hierarchy.json 제55조
+    python law_hierarchy.py articles 법인세법_전체조문.hierarchy.json "제2장 제1절"
+
+사용 예:
+    hierarchy = LawHierarchy.from_law(law)
+    hierarchy.hierarchy_of('제55조')      # {'편': None, '장': '제2장 ...', '절': '제1절 통칙', ...}
+    hierarchy.articles_in('제2장 제1절')  # ['제13조', '제14조', ...]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import xml.etree.ElementTree as ET
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from law_json_decode import loads
+from law_model import Law, Article, law_from_json, normalize_label
+from law_xml_stream import parse_law_detail
+
+# 제목 행 종류 → 계층 (작을수록 상위)
+HEADING_RANKS = {'편': 0, '장': 1, '절': 2, '관': 3, '목': 4}
+RANK_NAMES = tuple(HEADING_RANKS)
+# '제1장 총칙', '제2장의2 이월결손금', '  제3절 세액공제 <개정 2018.12.24>'
+HEADING_PATTERN = re.compile(r'^\s*제\s*(\d+)\s*(편|장|절|관|목)(?:\s*의\s*(\d+))?\s*(.*)$', re.S)
+# 경로 질의의 구분 하나 ('제2장', '제1절의2')
+PATH_TOKEN = re.compile(r'제\s*(\d+)\s*(편|장|절|관|목)(?:\s*의\s*(\d+))?')
+# 제목 뒤 개정 표시 (<개정 2018.12.24>, [본관신설 2019.12.31])
+REVISION_NOTE = re.compile(r'\s*[<\[][^>\]]*[>\]]\s*$')
+
+HIERARCHY_FORMAT = 1
+ROOT = -1
+
+
+def parse_heading(text: str) -> Optional[Tuple[int, str, str]]:
+    """제목 행 내용 → (계층, 번호, 제목) ('제2장의2 이월결손금' → (1, '2의2', '이월결손금')), 형식이 다르면 None"""
+    match = HEADING_PATTERN.match(text)
+    if not match:
+        return None
+    number, kind, branch, title = match.groups()
+    title = title.strip()
+    while True:
+        stripped = REVISION_NOTE.sub('', title)
+        if stripped == title:
+            break
+        title = stripped
+    return HEADING_RANKS[kind], f"{number}의{branch}" if branch else number, title
+
+
+def heading_rank(text: str) -> Optional[int]:
+    """제목 행 내용 → 계층 (편/장/절/관/목이 아니면 None)"""
+    parsed = parse_heading(text)
+    return parsed[0] if parsed else None
+
+
+class LawHierarchy:
+    """
+    법령 하나의 편/장/절/관/목 트리
+
+    노드는 문서 순서(전위 순회)로 번호가 붙고, 열 단위 배열에 저장:
+        ranks[n]   계층 (0=편 … 4=목)
+        parents[n] 상위 노드 (최상위는 -1)
+        starts[n], ends[n]  소속 조문 순번 범위 [start, end)
+    조문은 실제 조문만 순번을 매기고 (제목 행 제외), article_nodes[i]에 가장 안쪽 노드를 기록
+    """
+
+    def __init__(self, law_id: str = '', name: str = ''):
+        self.law_id = law_id
+        self.name = name
+        self.ranks = array('b')
+        self.parents = array('i')
+        self.starts = array('I')
+        self.ends = array('I')
+        self.numbers: List[str] = []
+        self.titles: List[str] = []
+        self.labels: List[str] = []
+        self.article_nodes = array('i')
+        self._by_label: Dict[str, int] = {}
+        self._by_number: Dict[Tuple[int, str], List[int]] = {}
+
+    # -- 생성 ---------------------------------------------------------------
+
+    @classmethod
+    def from_articles(cls, articles: Iterable[Article], law_id: str = '', name: str = '') -> 'LawHierarchy':
+        """
+        조문 스트림 한 번 순회로 생성 (law_xml_stream.iter_law_articles와 바로 연결 가능)
+
+        편/장/절/관/목 형식이 아닌 제목 행은 바로 앞 제목과 같은 계층으로 취급
+        """
+        hierarchy = cls(law_id, name)
+        stack: List[int] = []
+        for article in articles:
+            if article.is_heading:
+                text = article.text.strip()
+                parsed = parse_heading(text)
+                if parsed is None:
+                    rank = hierarchy.ranks[stack[-1]] if stack else HEADING_RANKS['장']
+                    parsed = (rank, '', text)
+                rank = parsed[0]
+                while stack and hierarchy.ranks[stack[-1]] >= rank:
+                    hierarchy.ends[stack.pop()] = len(hierarchy.labels)
+                stack.append(hierarchy._add_node(*parsed, stack[-1] if stack else ROOT))
+                continue
+
+            hierarchy.article_nodes.append(stack[-1] if stack else ROOT)
+            hierarchy.labels.append(article.label or article.key)
+
+        for node in stack:
+            hierarchy.ends[node] = len(hierarchy.labels)
+        hierarchy._build_lookups()
+        return hierarchy
+
+    @classmethod
+    def from_law(cls, law: Law) -> 'LawHierarchy':
+        return cls.from_articles(law.articles, law.law_id, law.name)
+
+    def _add_node(self, rank: int, number: str, title: str, parent: int) -> int:
+        self.ranks.append(rank)
+        self.parents.append(parent)
+        self.starts.append(len(self.labels))
+        self.ends.append(len(self.labels))
+        self.numbers.append(number)
+        self.titles.append(title)
+        return len(self.ranks) - 1
+
+    def _build_lookups(self):
+        self._by_label = {}
+        for ordinal, label in enumerate(self.labels):
+            self._by_label.setdefault(label, ordinal)
+        self._by_number = {}
+        for node, (rank, number) in enumerate(zip(self.ranks, self.numbers)):
+            self._by_number.setdefault((rank, number), []).append(node)
+
+    # -- 노드 ---------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.ranks)
+
+    @property
+    def depth(self) -> int:
+        """사용하는 계층 수 (장/절만 있으면 2)"""
+        return len(set(self.ranks))
+
+    def heading(self, node: int) -> str:
+        """노드 표시 문자열 ('제2장의2 이월결손금')"""
+        kind, title = RANK_NAMES[self.ranks[node]], self.titles[node]
+        if not self.numbers[node]:
+            return title
+        number, _, branch = self.numbers[node].partition('의')
+        label = f"제{number}{kind}의{branch}" if branch else f"제{number}{kind}"
+        return f"{label} {title}".strip()
+
+    def ancestors(self, node: int) -> List[int]:
+        """최상위 → node 순서의 노드 경로"""
+        path = []
+        while node != ROOT:
+            path.append(node)
+            node = self.parents[node]
+        path.reverse()
+        return path
+
+    def walk(self) -> Iterator[Tuple[int, int]]:
+        """(들여쓰기 깊이, 노드) 문서 순서"""
+        depths: List[int] = []
+        for node, parent in enumerate(self.parents):
+            depth = depths[parent] + 1 if parent != ROOT else 0
+            depths.append(depth)
+            yield depth, node
+
+    def find(self, path: str) -> List[int]:
+        """
+        경로 → 노드 ('제2장 제1절', '제2편 제1장', 중간 계층 생략 가능)
+
+        마지막 구분과 번호가 같은 노드 중 앞 구분들을 모두 상위에 가진 노드를 반환
+        (번호 색인으로 후보만 확인, 보통 후보는 장 수 이하)
+        """
+        tokens = [(HEADING_RANKS[kind], f"{number}의{branch}" if branch else number)
+                  for number, kind, branch in PATH_TOKEN.findall(path)]
+        if not tokens:
+            raise ValueError(f"편/장/절/관/목 경로가 아닙니다: {path}")
+
+        matches = []
+        for node in self._by_number.get(tokens[-1], []):
+            ancestors = {(self.ranks[a], self.numbers[a]) for a in self.ancestors(node)}
+            if all(token in ancestors for token in tokens[:-1]):
+                matches.append(node)
+        return matches
+
+    # -- 조문 ---------------------------------------------------------------
+
+    def ordinal(self, label: str) -> int:
+        """
+        조문 표기 → 조문 순번
+
+        Raises:
+            KeyError: 없는 조문
+        """
+        return self._by_label[normalize_label(label)]
+
+    def article_range(self, node: int) -> Tuple[int, int]:
+        return self.starts[node], self.ends[node]
+
+    def articles_in(self, path: str) -> List[str]:
+        """경로에 속한 조문 표기 (하위 계층 포함, 같은 경로가 여러 곳이면 모두)"""
+        labels = []
+        for node in self.find(path):
+            labels += self.labels[self.starts[node]:self.ends[node]]
+        return labels
+
+    def path_of(self, label: str) -> List[int]:
+        """조문이 속한 노드 경로 (최상위 → 가장 안쪽)"""
+        return self.ancestors(self.article_nodes[self.ordinal(label)])
+
+    def hierarchy_of(self, label: str) -> Dict[str, Optional[str]]:
+        """조문의 계층 정보 ({'편': None, '장': '제1장 총칙', '절': None, '관': None, '목': None})"""
+        info: Dict[str, Optional[str]] = dict.fromkeys(RANK_NAMES)
+        for node in self.path_of(label):
+            info[RANK_NAMES[self.ranks[node]]] = self.heading(node)
+        return info
+
+    # -- 저장 ---------------------------------------------------------------
+
+    def to_dict(self) -> Dict:
+        return {
+            'format': HIERARCHY_FORMAT,
+            'law_id': self.law_id,
+            'name': self.name,
+            'nodes': {
+                'rank': list(self.ranks),
+                'parent': list(self.parents),
+                'start': list(self.starts),
+                'end': list(self.ends),
+                'number': self.numbers,
+                'title': self.titles,
+            },
+            'articles': {
+                'label': self.labels,
+                'node': list(self.article_nodes),
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'LawHierarchy':
+        """
+        Raises:
+            ValueError: 다른 형식 버전으로 저장된 파일
+        """
+        if data.get('format') != HIERARCHY_FORMAT:
+            raise ValueError(f"계층 인덱스 형식이 다릅니다: {data.get('format')}")
+        hierarchy = cls(data.get('law_id', ''), data.get('name', ''))
+        nodes, articles = data['nodes'], data['articles']
+        hierarchy.ranks = array('b', nodes['rank'])
+        hierarchy.parents = array('i', nodes['parent'])
+        hierarchy.starts = array('I', nodes['start'])
+        hierarchy.ends = array('I', nodes['end'])
+        hierarchy.numbers = list(nodes['number'])
+        hierarchy.titles = list(nodes['title'])
+        hierarchy.labels = list(articles['label'])
+        hierarchy.article_nodes = array('i', articles['node'])
+        hierarchy._build_lookups()
+        return hierarchy
+
+    def save(self, path: str):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'LawHierarchy':
+        with open(path, 'rb') as f:
+            return cls.from_dict(loads(f.read()))
+
+
+def load_hierarchy(path: str) -> LawHierarchy:
+    """계층 인덱스 파일 또는 lawService.do JSON/XML 파일 → LawHierarchy"""
+    with open(path, 'rb') as f:
+        content = f.read()
+    if path.lower().endswith('.xml'):
+        return LawHierarchy.from_law(parse_law_detail(content))
+    data = loads(content)
+    if 'nodes' in data:
+        return LawHierarchy.from_dict(data)
+    return LawHierarchy.from_law(law_from_json(data))
+
+
+def print_outline(hierarchy: LawHierarchy, max_depth: int = 5):
+    for depth, node in hierarchy.walk():
+        if depth < max_depth:
+            start, end = hierarchy.article_range(node)
+            span = f"{hierarchy.labels[start]}~{hierarchy.labels[end - 1]}" if end > start else '조문 없음'
+            print(f"{'  ' * depth}{hierarchy.heading(node)} ({span})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="법령 편/장/절/관/목 계층 인덱스")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    build = sub.add_parser('build', help="lawService.do JSON/XML → 계층 인덱스 파일")
+    build.add_argument('input')
+    build.add_argument('-o', '--output', help="저장 경로 (기본: 입력 파일명.hierarchy.json)")
+
+    show = sub.add_parser('show', help="계층 트리 출력")
+    show.add_argument('input', help="계층 인덱스 또는 lawService.do JSON/XML 파일")
+    show.add_argument('--depth', type=int, default=5)
+
+    path = sub.add_parser('path', help="조문의 편/장/절/관/목 경로")
+    path.add_argument('input')
+    path.add_argument('article', help="조문 (예: 제55조, 10의2)")
+
+    articles = sub.add_parser('articles', help="경로에 속한 조문 목록")
+    articles.add_argument('input')
+    articles.add_argument('path', help="경로 (예: '제2장 제1절')")
+
+    args = parser.parse_args()
+    try:
+        hierarchy = load_hierarchy(args.input)
+        if args.command == 'build':
+            output = args.output or f"{os.path.splitext(args.input)[0]}.hierarchy.json"
+            hierarchy.save(output)
+            print(f"✅ {output} (노드 {len(hierarchy)}개, 조문 {len(hierarchy.labels)}개, 계층 {hierarchy.depth}단계)")
+        elif args.command == 'show':
+            print(f"📋 {hierarchy.name or hierarchy.law_id}")
+            print_outline(hierarchy, args.depth)
+        elif args.command == 'path':
+            for rank, heading in hierarchy.hierarchy_of(args.article).items():
+                if heading:
+                    print(f"  {rank}: {heading}")
+        else:
+            labels = hierarchy.articles_in(args.path)
+            if not labels:
+                print(f"⚠️ '{args.path}'에 해당하는 조문이 없습니다")
+            print(' '.join(labels))
+    except KeyError as e:
+        print(f"❌ 없는 조문: {e}")
+        sys.exit(1)
+    except (OSError, ValueError, ET.ParseError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
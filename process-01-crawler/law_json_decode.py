@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+JSON 응답 바이트 직접 파싱
+Version 1.0.0 (2026-10-17)
+- 응답 본문(UTF-8 바이트)을 str로 바꾸지 않고 바로 파싱
+  (response.text/response.json()은 문자셋 추정 후 ~900KB 문자열을 한 번 더 만듦)
+- orjson이 설치되어 있으면 사용, 없으면 표준 json (bytes 입력 그대로)
+- 환경 변수 LAW_JSON_BACKEND=json으로 표준 json 강제 (비교 측정용)
+- 파싱 실패는 두 경우 모두 json.JSONDecodeError (orjson의 예외도 그 하위 클래스)
+
+사용 예:
+    response = request_with_retry(...)
+    data = loads(response.content)
+"""
+
+import json
+import os
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # 없으면 표준 json 사용
+    orjson = None
+
+UTF8_BOM = b'\xef\xbb\xbf'
+
+BACKEND = 'orjson' if orjson is not None and os.environ.get('LAW_JSON_BACKEND', '') != 'json' else 'json'
+
+
+def loads_stdlib(content: Union[bytes, str]) -> Any:
+    """표준 json (bytes는 json이 인코딩을 판별해 한 번만 디코딩)"""
+    return json.loads(content)
+
+
+def loads(content: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    JSON 응답 파싱 (바이트 그대로)
+
+    Raises:
+        json.JSONDecodeError: 올바른 JSON이 아님
+    """
+    if isinstance(content, (bytes, bytearray, memoryview)) and content[:3] == UTF8_BOM:
+        content = content[3:]
+    if BACKEND == 'orjson':
+        return orjson.loads(content)
+    if isinstance(content, memoryview):
+        content = content.tobytes()
+    return json.loads(content)
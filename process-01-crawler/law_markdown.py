@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+법령 모델 → Markdown 스트리밍 출력
+Version 1.0.0 (2026-10-17)
+- 조문 하나씩 Markdown 조각을 만들어 바로 파일에 씀 (법령 전체 문자열을 만들지 않음)
+- 입력: Law 모델, 또는 law_xml_stream.iter_law_units 스트림 (캐시 XML을 조각 단위로 읽으며 변환)
+- 편/장/절/관 제목 행은 계층에 맞춰 제목 수준을 정함 (제목 행 해석은 law_hierarchy와 같음)
+  (편이 있는 법령: 편 ## / 장 ### / 절 ####, 편이 없으면 장부터 ##), 조문은 그 아래 수준
+- 조문마다 앵커 (<a id="jo-55"></a>, 제10조의2 → jo-10-2) → 다른 문서에서 조문으로 바로 링크
+- 메모리는 조문 하나 + 현재 편/장/절/관 위치만 사용 (법령 크기와 무관)
+
+사용법 (process-01-crawler 폴더에서):
+    python law_markdown.py law_detail.xml                 # law_detail.md 생성
+    python law_markdown.py law_detail.json -o 법인세법.md
+
+사용 예:
+    write_markdown('법인세법.md', iter_unit_markdown(iter_law_units(iter_file_chunks(path))))
+"""
+
+import argparse
+import os
+import sys
+import time
+import xml.etree.ElementTree as ET
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from law_hierarchy import HEADING_RANKS, heading_rank
+from law_json_decode import loads
+from law_model import Law, Article, Addendum, law_from_json
+from law_xml_stream import apply_basic_info, iter_file_chunks, iter_law_units
+
+MAX_LEVEL = 6
+
+
+def article_anchor(article: Article) -> str:
+    """조문 앵커 ID ('jo-55', 제10조의2 → 'jo-10-2')"""
+    if not article.number:
+        return f"jo-key-{article.key}" if article.key else ''
+    if article.branch and article.branch != '0':
+        return f"jo-{article.number}-{article.branch}"
+    return f"jo-{article.number}"
+
+
+def article_heading(article: Article) -> str:
+    """'제55조(세율)' 형식"""
+    return f"{article.label}({article.title})" if article.title else article.label
+
+
+def article_body(article: Article) -> str:
+    """조문내용에서 '제55조(세율)' 머리말을 뺀 본문"""
+    text = article.text.strip()
+    heading = article_heading(article)
+    if heading and text.startswith(heading):
+        text = text[len(heading):].strip()
+    return text
+
+
+class MarkdownOutline:
+    """
+    현재 편/장/절/관 위치 (열린 제목의 계층만 보관)
+
+    제목 수준은 위에 열려 있는 상위 제목 수로 정해짐
+    → 편이 없는 법령은 장이 ##, 절 아래 관이 없으면 조문이 #### 식으로 빈 수준 없이 이어짐
+    """
+
+    def __init__(self, base_level: int = 2):
+        self.base_level = base_level
+        self.stack: List[int] = []
+
+    def heading_level(self, text: str) -> int:
+        """제목 행을 열고 그 수준 반환 (같은 계층 이하의 열린 제목은 닫음)"""
+        rank = heading_rank(text)
+        if rank is None:
+            # 편/장/절/관/목 형식이 아닌 제목: 바로 앞 제목과 같은 계층으로 취급
+            rank = self.stack[-1] if self.stack else HEADING_RANKS['장']
+        while self.stack and self.stack[-1] >= rank:
+            self.stack.pop()
+        self.stack.append(rank)
+        return min(self.base_level + len(self.stack) - 1, MAX_LEVEL)
+
+    @property
+    def article_level(self) -> int:
+        return min(self.base_level + len(self.stack), MAX_LEVEL)
+
+
+# ---------------------------------------------------------------------------
+# Markdown 조각 (각 조각은 빈 줄로 시작, 줄바꿈으로 끝남 → 이어 붙이면 문서)
+# ---------------------------------------------------------------------------
+
+def _block(lines: List[str]) -> str:
+    return '\n' + '\n'.join(lines).rstrip('\n') + '\n'
+
+
+def header_markdown(law: Law) -> str:
+    """법령명 제목 + 기본정보 목록 (문서 첫 조각)"""
+    lines = [f"# {law.name or law.law_id}", '']
+    meta = [
+        ('법령ID', law.law_id), ('공포일자', law.promulgation_date), ('공포번호', law.promulgation_number),
+        ('시행일자', law.effective_date), ('소관부처', law.ministry), ('제개정구분', law.revision_kind),
+    ]
+    lines += [f"- {label}: {value}" for label, value in meta if value]
+    return '\n'.join(lines).rstrip('\n') + '\n'
+
+
+def article_markdown(article: Article, outline: MarkdownOutline) -> str:
+    """조문 하나 (제목 행이면 편/장/절/관 제목) → Markdown 조각"""
+    if article.is_heading:
+        text = article.text.strip()
+        return _block([f"{'#' * outline.heading_level(text)} {text}"])
+
+    lines = []
+    anchor = article_anchor(article)
+    if anchor:
+        lines.append(f'<a id="{anchor}"></a>')
+    lines += [f"{'#' * outline.article_level} {article_heading(article)}", '']
+    body = article_body(article)
+    if body:
+        lines += [body, '']
+    for para in article.paragraphs:
+        if para.text:
+            lines += [para.text.strip(), '']
+        for item in para.items:
+            # 호/목은 줄바꿈만 유지 (번호가 본문에 있어 목록 기호는 붙이지 않음)
+            lines.append(f"{item.text.strip()}  ")
+            lines += [f"&nbsp;&nbsp;{sub.text.strip()}  " for sub in item.subitems]
+        if para.items:
+            lines.append('')
+    return _block(lines)
+
+
+def addendum_markdown(addendum: Addendum) -> str:
+    return _block([addendum.text.strip()])
+
+
+def iter_article_markdown(articles: Iterable[Article],
+                          outline: Optional[MarkdownOutline] = None) -> Iterator[str]:
+    """조문 스트림 → Markdown 조각 (law_xml_stream.iter_law_articles와 바로 연결 가능)"""
+    outline = outline or MarkdownOutline()
+    for article in articles:
+        yield article_markdown(article, outline)
+
+
+def iter_law_markdown(law: Law) -> Iterator[str]:
+    """Law → Markdown 조각 (머리말, 조문, 부칙 순)"""
+    yield header_markdown(law)
+    yield from iter_article_markdown(law.articles)
+    if law.addenda:
+        yield _block(['## 부칙'])
+        for addendum in law.addenda:
+            yield addendum_markdown(addendum)
+
+
+def iter_unit_markdown(units: Iterable[Tuple[str, object]]) -> Iterator[str]:
+    """
+    iter_law_units 스트림 → Markdown 조각
+
+    기본정보가 조문보다 먼저 오는 lawService.do 순서를 그대로 따름
+    (별표/개정문/제개정이유는 Markdown에 넣지 않음 - law_to_markdown과 같은 범위)
+    """
+    outline = MarkdownOutline()
+    in_addenda = False
+    for kind, data in units:
+        if kind == '기본정보':
+            yield header_markdown(apply_basic_info(Law(), data))
+        elif kind == '조문':
+            yield article_markdown(data, outline)
+        elif kind == '부칙':
+            if not in_addenda:
+                in_addenda = True
+                yield _block(['## 부칙'])
+            yield addendum_markdown(data)
+
+
+def write_markdown(path: str, chunks: Iterable[str]) -> int:
+    """
+    Markdown 조각을 받는 대로 파일에 씀 (임시 파일에 쓴 뒤 교체 → 중간에 실패해도 기존 파일 유지)
+
+    Returns:
+        기록한 바이트 수
+    """
+    tmp_path = f"{path}.tmp"
+    written = 0
+    try:
+        with open(tmp_path, 'wb') as f:
+            for chunk in chunks:
+                data = chunk.encode('utf-8')
+                f.write(data)
+                written += len(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return written
+
+
+def file_markdown(path: str) -> Iterator[str]:
+    """
+    저장된 lawService.do 응답 파일 → Markdown 조각
+
+    XML은 조각 단위로 읽으며 스트리밍, JSON은 통째로 파싱한 뒤 모델에서 생성
+    """
+    if path.lower().endswith('.json'):
+        with open(path, 'rb') as f:
+            data = loads(f.read())
+        return iter_law_markdown(law_from_json(data))
+    return iter_unit_markdown(iter_law_units(iter_file_chunks(path)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="법령 상세 응답 → Markdown (스트리밍)")
+    parser.add_argument('input', help="lawService.do XML 또는 JSON 파일")
+    parser.add_argument('-o', '--output', help="Markdown 저장 경로 (기본: 입력 파일명.md)")
+    args = parser.parse_args()
+
+    output = args.output or f"{os.path.splitext(args.input)[0]}.md"
+    start = time.perf_counter()
+    try:
+        written = write_markdown(output, file_markdown(args.input))
+    except (OSError, ValueError, KeyError, ET.ParseError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"✅ {output} ({written:,} bytes, {elapsed:.1f}ms)")
+
+
+if __name__ == "__main__":
+    main()
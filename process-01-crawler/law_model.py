@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+법령 데이터 모델
+Version 1.0.0 (2026-10-17)
+- 법령/조문/항/호/목/부칙/별표를 __slots__ 데이터클래스로 표현
+- JSON 파서(law_from_json)와 XML 파서(law_xml_stream)가 같은 모델을 생성
+- 노드마다 dict를 두지 않아 세법 전체를 메모리에 올려도 부담이 적음
+- to_dict()로 기존 구조화 JSON(한글 키) 형식 유지
+- 조문 번호 표기 정규화(normalize_label)를 조회 모듈들이 함께 사용
+
+계층:
+    Law ─┬─ Article (조문, 조문여부 '전문'이면 편/장/절/관 제목 행)
+         │    └─ Paragraph (항)
+         │         └─ Item (호)
+         │              └─ SubItem (목)
+         ├─ Addendum (부칙)
+         └─ Table (별표)
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+
+def _text(value: Any) -> str:
+    """응답 값 → 문자열 (부칙내용처럼 리스트로 오는 경우 줄바꿈으로 연결)"""
+    if value is None:
+        return ''
+    if isinstance(value, list):
+        return '\n'.join(text for text in (_text(v) for v in value) if text)
+    if isinstance(value, dict):
+        return _text(value.get('content', ''))
+    return str(value)
+
+
+def normalize_label(label: str) -> str:
+    """'55', '제55조', '55조의2', '제 55 조의 2' → '제55조' / '제55조의2'"""
+    text = re.sub(r'\s+', '', label)
+    match = re.match(r'^제?(\d+)(?:조)?(?:의(\d+))?$', text)
+    if not match:
+        return text
+    number, branch = match.groups()
+    return f"제{number}조의{branch}" if branch else f"제{number}조"
+
+
+def _compact(info: Dict) -> Dict:
+    """빈 값 제거 (저장 파일 크기 절감)"""
+    return {key: value for key, value in info.items() if value not in ('', None)}
+
+
+@dataclass(slots=True)
+class SubItem:
+    """목"""
+    number: str = ''
+    text: str = ''
+
+    def to_dict(self) -> Dict:
+        return _compact({'목번호': self.number, '목내용': self.text})
+
+
+@dataclass(slots=True)
+class Item:
+    """호"""
+    number: str = ''
+    text: str = ''
+    subitems: List[SubItem] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        info = _compact({'호번호': self.number, '호내용': self.text})
+        info['목'] = [sub.to_dict() for sub in self.subitems]
+        return info
+
+
+@dataclass(slots=True)
+class Paragraph:
+    """항"""
+    number: str = ''
+    text: str = ''
+    revision_type: str = ''
+    items: List[Item] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        info = _compact({'항번호': self.number, '항내용': self.text, '항제개정유형': self.revision_type})
+        info['호'] = [item.to_dict() for item in self.items]
+        return info
+
+
+@dataclass(slots=True)
+class Article:
+    """조문 (kind == '전문'이면 편/장/절/관 제목 행)"""
+    key: str = ''
+    number: str = ''
+    branch: str = ''
+    kind: str = ''
+    title: str = ''
+    text: str = ''
+    effective_date: str = ''
+    revision_type: str = ''
+    changed: str = ''
+    paragraphs: List[Paragraph] = field(default_factory=list)
+
+    @property
+    def is_heading(self) -> bool:
+        return self.kind == '전문'
+
+    @property
+    def label(self) -> str:
+        """'제55조', '제10조의2' 형식"""
+        if not self.number:
+            return ''
+        if self.branch and self.branch != '0':
+            return f"제{self.number}조의{self.branch}"
+        return f"제{self.number}조"
+
+    def to_dict(self) -> Dict:
+        info = _compact({
+            '조문키': self.key,
+            '조문번호': self.number,
+            '조문가지번호': self.branch,
+            '조문여부': self.kind,
+            '조문제목': self.title,
+            '조문내용': self.text,
+            '조문시행일자': self.effective_date,
+            '조문제개정유형': self.revision_type,
+            '조문변경여부': self.changed,
+        })
+        info['항'] = [para.to_dict() for para in self.paragraphs]
+        return info
+
+
+@dataclass(slots=True)
+class Addendum:
+    """부칙"""
+    key: str = ''
+    promulgation_date: str = ''
+    promulgation_number: str = ''
+    text: str = ''
+
+    def to_dict(self) -> Dict:
+        return _compact({
+            '부칙키': self.key,
+            '부칙공포일자': self.promulgation_date,
+            '부칙공포번호': self.promulgation_number,
+            '부칙내용': self.text,
+        })
+
+
+@dataclass(slots=True)
+class Table:
+    """별표/서식"""
+    key: str = ''
+    number: str = ''
+    branch: str = ''
+    kind: str = ''
+    title: str = ''
+    text: str = ''
+    hwp_link: str = ''
+    hwp_name: str = ''
+    pdf_link: str = ''
+    pdf_name: str = ''
+
+    def to_dict(self) -> Dict:
+        return _compact({
+            '별표키': self.key,
+            '별표번호': self.number,
+            '별표가지번호': self.branch,
+            '별표구분': self.kind,
+            '별표제목': self.title,
+            '별표내용': self.text,
+            '별표서식파일링크': self.hwp_link,
+            '별표HWP파일명': self.hwp_name,
+            '별표서식PDF파일링크': self.pdf_link,
+            '별표PDF파일명': self.pdf_name,
+        })
+
+
+@dataclass(slots=True)
+class Law:
+    """법령 (기본정보 + 조문/부칙/별표)"""
+    law_key: str = ''
+    law_id: str = ''
+    name: str = ''
+    promulgation_date: str = ''
+    promulgation_number: str = ''
+    effective_date: str = ''
+    ministry: str = ''
+    revision_kind: str = ''
+    articles: List[Article] = field(default_factory=list)
+    addenda: List[Addendum] = field(default_factory=list)
+    tables: List[Table] = field(default_factory=list)
+    revision_text: str = ''
+    reason_text: str = ''
+
+    def iter_articles(self):
+        """제목 행(전문)을 제외한 실제 조문"""
+        return (article for article in self.articles if not article.is_heading)
+
+    def to_dict(self) -> Dict:
+        """기존 구조화 JSON 형식 (한글 키)"""
+        return {
+            '법령키': self.law_key,
+            '기본정보': _compact({
+                '법령ID': self.law_id,
+                '법령명_한글': self.name,
+                '공포일자': self.promulgation_date,
+                '공포번호': self.promulgation_number,
+                '시행일자': self.effective_date,
+                '소관부처': self.ministry,
+                '제개정구분': self.revision_kind,
+            }),
+            '조문': [article.to_dict() for article in self.articles],
+            '부칙': [addendum.to_dict() for addendum in self.addenda],
+            '별표': [table.to_dict() for table in self.tables],
+            '개정문': self.revision_text or None,
+            '제개정이유': self.reason_text or None,
+        }
+
+
+# ---------------------------------------------------------------------------
+# JSON 응답 → 모델
+# ---------------------------------------------------------------------------
+
+def _as_list(value: Any) -> List:
+    """단일 항목이면 dict, 여러 개면 list로 오는 응답 정규화"""
+    if value is None:
+        return []
+    if isinstance(value, dict):
+        return [value]
+    return value
+
+
+def _units(container: Any, unit_name: str) -> List:
+    """{'항단위': [...]} 형태에서 단위 목록 추출 (감싸는 키 없이 바로 오는 경우도 처리)"""
+    if isinstance(container, dict) and unit_name in container:
+        return _as_list(container[unit_name])
+    return _as_list(container)
+
+
+def _section_text(section: Any, content_key: str) -> str:
+    """{'개정문내용': [...]} 형태 또는 바로 본문인 경우 모두 처리"""
+    if isinstance(section, dict):
+        return _text(section.get(content_key))
+    return _text(section)
+
+
+def _article_from_json(unit: Dict) -> Article:
+    paragraphs = []
+    for 항 in _units(unit.get('항'), '항단위'):
+        items = []
+        for 호 in _units(항.get('호'), '호단위'):
+            subitems = [
+                SubItem(_text(목.get('목번호')), _text(목.get('목내용')))
+                for 목 in _units(호.get('목'), '목단위')
+            ]
+            items.append(Item(_text(호.get('호번호')), _text(호.get('호내용')), subitems))
+        paragraphs.append(Paragraph(
+            _text(항.get('항번호')), _text(항.get('항내용')), _text(항.get('항제개정유형')), items
+        ))
+
+    return Article(
+        key=_text(unit.get('조문키')),
+        number=_text(unit.get('조문번호')),
+        branch=_text(unit.get('조문가지번호')),
+        kind=_text(unit.get('조문여부')),
+        title=_text(unit.get('조문제목')),
+        text=_text(unit.get('조문내용')),
+        effective_date=_text(unit.get('조문시행일자')),
+        revision_type=_text(unit.get('조문제개정유형')),
+        changed=_text(unit.get('조문변경여부')),
+        paragraphs=paragraphs,
+    )
+
+
+def law_from_json(json_data: Dict) -> Law:
+    """lawService.do JSON 응답 → Law ('법령' 키가 없으면 빈 Law)"""
+    법령 = json_data.get('법령') if isinstance(json_data, dict) else None
+    if not 법령:
+        return Law()
+
+    기본정보 = 법령.get('기본정보', {}) or {}
+    law = Law(
+        law_key=_text(법령.get('법령키')),
+        law_id=_text(기본정보.get('법령ID')),
+        name=_text(기본정보.get('법령명_한글')),
+        promulgation_date=_text(기본정보.get('공포일자')),
+        promulgation_number=_text(기본정보.get('공포번호')),
+        effective_date=_text(기본정보.get('시행일자')),
+        ministry=_text(기본정보.get('소관부처')),
+        revision_kind=_text(기본정보.get('제개정구분')),
+        revision_text=_section_text(법령.get('개정문'), '개정문내용'),
+        reason_text=_section_text(법령.get('제개정이유'), '제개정이유내용'),
+    )
+
+    law.articles = [_article_from_json(unit) for unit in _units(법령.get('조문'), '조문단위')]
+
+    law.addenda = [
+        Addendum(
+            key=_text(unit.get('부칙키')),
+            promulgation_date=_text(unit.get('부칙공포일자')),
+            promulgation_number=_text(unit.get('부칙공포번호')),
+            text=_text(unit.get('부칙내용')),
+        )
+        for unit in _units(법령.get('부칙'), '부칙단위')
+    ]
+
+    law.tables = [
+        Table(
+            key=_text(unit.get('별표키')),
+            number=_text(unit.get('별표번호')),
+            branch=_text(unit.get('별표가지번호')),
+            kind=_text(unit.get('별표구분')),
+            title=_text(unit.get('별표제목')),
+            text=_text(unit.get('별표내용')),
+            hwp_link=_text(unit.get('별표서식파일링크')),
+            hwp_name=_text(unit.get('별표HWP파일명')),
+            pdf_link=_text(unit.get('별표서식PDF파일링크')),
+            pdf_name=_text(unit.get('별표PDF파일명')),
+        )
+        for unit in _units(법령.get('별표'), '별표단위')
+    ]
+
+    return law
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+법령 모델 → 출력 형식 변환
+Version 1.0.0 (2026-10-17)
+- 상세 조회는 한 형식으로 한 번만 받고, 나머지 형식은 모델(law_model.Law)에서 생성
+  (형식마다 ~900KB 요청을 따로 보내지 않음 → 전송량/호출 횟수 절반 이하)
+- XML/JSON은 lawService.do 응답과 같은 요소 구조 (parse_law_detail / law_from_json으로 다시 읽으면 같은 모델)
+- 구조화 JSON (Law.to_dict, 한글 키), Markdown (편/장/절/관 제목 + 조문)
+- Markdown 생성은 law_markdown으로 이동 (편/장/절/관 계층별 제목 수준, 조문 앵커, 조각 단위 출력)
+
+주의:
+    생성한 XML/JSON에는 모델이 가진 필드만 들어감 (법령명_한자, 조문참고자료 등은 원본 응답에만 있음)
+    HTML은 법제처 화면 형식이라 생성하지 않고 따로 조회
+
+사용 예:
+    law = law_from_json(detail)
+    xml_text = render_law(law, 'XML')
+    markdown = render_law(law, 'MD')
+"""
+
+import json
+from typing import Any, Dict, List
+from xml.sax.saxutils import escape, quoteattr
+
+from law_markdown import iter_law_markdown
+from law_model import Law, Article, _compact
+
+# 모델에서 만들 수 있는 형식 → 파일 확장자
+RENDER_FORMATS = {
+    'JSON': 'json',
+    'XML': 'xml',
+    'STRUCTURED': 'json',
+    'MD': 'md',
+}
+
+
+# ---------------------------------------------------------------------------
+# lawService.do JSON 형식
+# ---------------------------------------------------------------------------
+
+def _article_json(article: Article) -> Dict:
+    unit = _compact({
+        '조문키': article.key,
+        '조문번호': article.number,
+        '조문가지번호': article.branch,
+        '조문여부': article.kind,
+        '조문제목': article.title,
+        '조문내용': article.text,
+        '조문시행일자': article.effective_date,
+        '조문제개정유형': article.revision_type,
+        '조문변경여부': article.changed,
+    })
+    paragraphs = []
+    for para in article.paragraphs:
+        para_unit = _compact({'항번호': para.number, '항내용': para.text, '항제개정유형': para.revision_type})
+        items = []
+        for item in para.items:
+            item_unit = _compact({'호번호': item.number, '호내용': item.text})
+            if item.subitems:
+                item_unit['목'] = [sub.to_dict() for sub in item.subitems]
+            items.append(item_unit)
+        if items:
+            para_unit['호'] = items
+        paragraphs.append(para_unit)
+    if paragraphs:
+        unit['항'] = paragraphs
+    return unit
+
+
+def law_to_drf_json(law: Law) -> Dict:
+    """Law → lawService.do JSON 응답 형식 (목록은 항목이 하나여도 list)"""
+    body: Dict[str, Any] = {
+        '법령키': law.law_key,
+        '기본정보': law.to_dict()['기본정보'],
+        '조문': {'조문단위': [_article_json(article) for article in law.articles]},
+    }
+    if law.addenda:
+        body['부칙'] = {'부칙단위': [addendum.to_dict() for addendum in law.addenda]}
+    if law.tables:
+        body['별표'] = {'별표단위': [table.to_dict() for table in law.tables]}
+    if law.revision_text:
+        body['개정문'] = {'개정문내용': law.revision_text}
+    if law.reason_text:
+        body['제개정이유'] = {'제개정이유내용': law.reason_text}
+    return {'법령': body}
+
+
+# ---------------------------------------------------------------------------
+# lawService.do XML 형식
+# ---------------------------------------------------------------------------
+
+def _fields_xml(parts: List[str], fields: Dict):
+    """{태그: 값} → <태그>값</태그> (키 필드는 속성으로 쓰므로 제외)"""
+    for tag, value in fields.items():
+        if not tag.endswith('키'):
+            parts.append(f"<{tag}>{escape(value)}</{tag}>")
+
+
+def law_to_xml(law: Law) -> str:
+    """Law → lawService.do XML 응답 형식"""
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>', f"<법령 법령키={quoteattr(law.law_key)}>", '<기본정보>']
+    _fields_xml(parts, law.to_dict()['기본정보'])
+    parts.append('</기본정보><조문>')
+
+    for article in law.articles:
+        parts.append(f"<조문단위 조문키={quoteattr(article.key)}>")
+        info = article.to_dict()
+        info.pop('항')
+        _fields_xml(parts, info)
+        for para in article.paragraphs:
+            parts.append('<항>')
+            _fields_xml(parts, _compact({'항번호': para.number, '항내용': para.text,
+                                         '항제개정유형': para.revision_type}))
+            for item in para.items:
+                parts.append('<호>')
+                _fields_xml(parts, _compact({'호번호': item.number, '호내용': item.text}))
+                for sub in item.subitems:
+                    parts.append('<목>')
+                    _fields_xml(parts, sub.to_dict())
+                    parts.append('</목>')
+                parts.append('</호>')
+            parts.append('</항>')
+        parts.append('</조문단위>')
+    parts.append('</조문>')
+
+    if law.addenda:
+        parts.append('<부칙>')
+        for addendum in law.addenda:
+            parts.append(f"<부칙단위 부칙키={quoteattr(addendum.key)}>")
+            _fields_xml(parts, addendum.to_dict())
+            parts.append('</부칙단위>')
+        parts.append('</부칙>')
+
+    if law.tables:
+        parts.append('<별표>')
+        for table in law.tables:
+            parts.append(f"<별표단위 별표키={quoteattr(table.key)}>")
+            _fields_xml(parts, table.to_dict())
+            parts.append('</별표단위>')
+        parts.append('</별표>')
+
+    if law.revision_text:
+        parts.append(f"<개정문><개정문내용>{escape(law.revision_text)}</개정문내용></개정문>")
+    if law.reason_text:
+        parts.append(f"<제개정이유><제개정이유내용>{escape(law.reason_text)}</제개정이유내용></제개정이유>")
+
+    parts.append('</법령>')
+    return ''.join(parts)
+
+
+# ---------------------------------------------------------------------------
+# Markdown
+# ---------------------------------------------------------------------------
+
+def law_to_markdown(law: Law) -> str:
+    """Law → Markdown 문자열 (law_markdown 조각을 이어 붙임, 파일로 쓸 때는 write_markdown 사용)"""
+    return ''.join(iter_law_markdown(law))
+
+
+def render_law(law: Law, fmt: str):
+    """
+    Law → 지정 형식
+
+    Returns:
+        JSON/STRUCTURED는 dict, XML/MD는 str
+
+    Raises:
+        ValueError: 모델에서 만들 수 없는 형식 (HTML 등)
+    """
+    fmt = fmt.upper()
+    if fmt == 'JSON':
+        return law_to_drf_json(law)
+    if fmt == 'XML':
+        return law_to_xml(law)
+    if fmt == 'STRUCTURED':
+        return law.to_dict()
+    if fmt == 'MD':
+        return law_to_markdown(law)
+    raise ValueError(f"모델에서 만들 수 없는 형식: {fmt}")
+
+
+def render_bytes(law: Law, fmt: str) -> bytes:
+    """render_law 결과를 파일/응답용 UTF-8 바이트로"""
+    rendered = render_law(law, fmt)
+    if isinstance(rendered, dict):
+        rendered = json.dumps(rendered, ensure_ascii=False, indent=2)
+    return rendered.encode('utf-8')
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+DRF JSON 스키마 기반 디코더
+Version 1.0.0 (2026-10-17)
+- 대상(target)별 응답 구조를 선언형 스키마(Record/Text/Many)로 정의
+- 스키마를 한 번 컴파일해 전용 디코더 함수 생성 (필드 접근을 코드로 펼쳐 노드마다 규칙을 다시 해석하지 않음)
+- 항목이 하나면 dict, 여러 개면 list로 오는 응답과 {'항단위': [...]} 감싸는 키를 한 곳에서 정규화
+- 법령 상세는 law_model.Law 생성 (law_from_json과 같은 결과), 목록/판례/해석례는 dict 생성
+- 새 대상은 스키마만 추가하면 됨 (판례 prec, 법령해석례 expc 포함)
+
+사용 예:
+    search = decode_search(loads(response.content), 'prec')     # {'total_count', 'page', 'items'}
+    law = decode_law(loads(response.content))                   # Law
+    case = decode_service(loads(response.content), 'prec')      # {'판례정보일련번호': ..., '판시사항': ...}
+    print(compile_record(PREC_DETAIL).source)                   # 생성된 디코더 코드
+"""
+
+from dataclasses import MISSING, dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from law_model import Law, Article, Paragraph, Item, SubItem, Addendum, Table, _text, _units
+
+
+# ---------------------------------------------------------------------------
+# 스키마 선언
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Text:
+    """
+    문자열 필드 (없으면 '', 리스트면 줄바꿈으로 연결)
+
+    path가 여러 단계면 dict를 따라 내려감 ('기본정보' → '법령ID'),
+    중간 값이 dict가 아니면 그 값을 그대로 사용 ({'개정문': '...'}처럼 감싸는 키가 없는 경우)
+    """
+    attr: str
+    path: Tuple[str, ...]
+
+    def __init__(self, attr: str, *path: str):
+        object.__setattr__(self, 'attr', attr)
+        object.__setattr__(self, 'path', path or (attr,))
+
+
+@dataclass(frozen=True)
+class Many:
+    """반복 단위 (key 아래 unit 목록, 단위가 하나면 dict로 오는 경우 포함)"""
+    attr: str
+    key: str
+    unit: str
+    record: 'Record'
+
+
+@dataclass(frozen=True)
+class Record:
+    """레코드 (factory가 dict면 attr을 키로 하는 dict, 아니면 dataclass factory의 인스턴스)"""
+    name: str
+    factory: Any
+    fields: Tuple[Union[Text, Many], ...]
+
+
+def _fields(*names: str) -> Tuple[Text, ...]:
+    """응답 키 그대로 저장하는 문자열 필드"""
+    return tuple(Text(name) for name in names)
+
+
+# ---------------------------------------------------------------------------
+# 컴파일 (스키마 → 파이썬 코드 → 함수)
+# ---------------------------------------------------------------------------
+
+def _path(value: Any, keys: Tuple[str, ...]) -> Any:
+    """여러 단계 키 따라가기 (중간이 dict가 아니면 그 값)"""
+    for key in keys:
+        if not isinstance(value, dict):
+            return value
+        value = value.get(key)
+    return value
+
+
+def _text_expr(field: Text) -> str:
+    """문자열 필드 → 식 (대부분 str이므로 _text 호출 없이 바로 사용)"""
+    if len(field.path) == 1:
+        source = f"get({field.path[0]!r})"
+    else:
+        source = f"_path(unit, {field.path!r})"
+    return f"(v if (v := {source}).__class__ is str else _text(v))"
+
+
+def _emit(record: Record, lines: List[str], names: Dict[str, str], namespace: Dict[str, Any]) -> str:
+    """
+    레코드 디코더 함수 코드 추가 (하위 레코드 먼저), 함수 이름 반환
+
+    반복 단위는 _units 호출 대신 문장으로 펼침 (대부분의 호/목은 키가 없거나 하나뿐이라 호출 비용이 큼),
+    dataclass는 필드 순서대로 위치 인자로 생성
+    """
+    if record.name in names:
+        return names[record.name]
+
+    children = {field.attr: _emit(field.record, lines, names, namespace)
+                for field in record.fields if isinstance(field, Many)}
+
+    func_name = f"decode_{record.name}"
+    names[record.name] = func_name
+    body = ["    get = unit.get"]
+    args = []
+    for index, field in enumerate(record.fields):
+        if isinstance(field, Text):
+            args.append((field.attr, _text_expr(field)))
+            continue
+        var = f"m{index}"
+        body += [
+            f"    c = get({field.key!r})",
+            f"    if c.__class__ is dict and {field.unit!r} in c:",
+            f"        c = c[{field.unit!r}]",
+            "    if c is None:",
+            f"        {var} = []",
+            "    elif c.__class__ is dict:",
+            f"        {var} = [{children[field.attr]}(c)]",
+            "    else:",
+            f"        {var} = [{children[field.attr]}(u) for u in c]",
+        ]
+        args.append((field.attr, var))
+
+    lines.append(f"def {func_name}(unit):")
+    lines += body
+    if record.factory is dict:
+        lines.append("    return {")
+        lines += [f"        {attr!r}: {expr}," for attr, expr in args]
+        lines.append("    }")
+    else:
+        # 위치 인자 순서 = dataclass 필드 순서 (스키마에 없는 필드는 기본값)
+        dataclass_fields = record.factory.__dataclass_fields__
+        exprs = dict(args)
+        unknown = set(exprs) - set(dataclass_fields)
+        if unknown:
+            raise ValueError(f"{record.factory.__name__}에 없는 필드: {', '.join(sorted(unknown))}")
+        factory_name = f"_{record.name}"
+        namespace[factory_name] = record.factory
+        lines.append(f"    return {factory_name}(")
+        for name, spec in dataclass_fields.items():
+            if name not in exprs:
+                if spec.default is MISSING:
+                    raise ValueError(f"스키마에 없고 기본값이 없는 필드: {record.factory.__name__}.{name}")
+                exprs[name] = repr(spec.default)
+            lines.append(f"        {exprs[name]},  # {name}")
+        lines.append("    )")
+    lines.append("")
+    return func_name
+
+
+_compiled: Dict[Record, Callable] = {}
+
+
+def compile_record(record: Record) -> Callable[[Dict], Any]:
+    """
+    스키마 → 디코더 함수 (레코드별로 한 번만 컴파일, 생성 코드는 .source)
+
+    Returns:
+        dict 하나(응답의 단위)를 받아 레코드를 만드는 함수
+    """
+    if record not in _compiled:
+        lines: List[str] = []
+        namespace: Dict[str, Any] = {'_text': _text, '_path': _path}
+        func_name = _emit(record, lines, {}, namespace)
+        source = '\n'.join(lines)
+        exec(compile(source, f"<law_schema {record.name}>", 'exec'), namespace)
+        decoder = namespace[func_name]
+        decoder.source = source
+        _compiled[record] = decoder
+    return _compiled[record]
+
+
+# ---------------------------------------------------------------------------
+# 법령 상세 (lawService.do?target=law) → law_model
+# ---------------------------------------------------------------------------
+
+SUBITEM = Record('subitem', SubItem, (Text('number', '목번호'), Text('text', '목내용')))
+
+ITEM = Record('item', Item, (
+    Text('number', '호번호'), Text('text', '호내용'),
+    Many('subitems', '목', '목단위', SUBITEM),
+))
+
+PARAGRAPH = Record('paragraph', Paragraph, (
+    Text('number', '항번호'), Text('text', '항내용'), Text('revision_type', '항제개정유형'),
+    Many('items', '호', '호단위', ITEM),
+))
+
+ARTICLE = Record('article', Article, (
+    Text('key', '조문키'), Text('number', '조문번호'), Text('branch', '조문가지번호'),
+    Text('kind', '조문여부'), Text('title', '조문제목'), Text('text', '조문내용'),
+    Text('effective_date', '조문시행일자'), Text('revision_type', '조문제개정유형'),
+    Text('changed', '조문변경여부'),
+    Many('paragraphs', '항', '항단위', PARAGRAPH),
+))
+
+ADDENDUM = Record('addendum', Addendum, (
+    Text('key', '부칙키'), Text('promulgation_date', '부칙공포일자'),
+    Text('promulgation_number', '부칙공포번호'), Text('text', '부칙내용'),
+))
+
+TABLE = Record('table', Table, (
+    Text('key', '별표키'), Text('number', '별표번호'), Text('branch', '별표가지번호'),
+    Text('kind', '별표구분'), Text('title', '별표제목'), Text('text', '별표내용'),
+    Text('hwp_link', '별표서식파일링크'), Text('hwp_name', '별표HWP파일명'),
+    Text('pdf_link', '별표서식PDF파일링크'), Text('pdf_name', '별표PDF파일명'),
+))
+
+LAW_DETAIL = Record('law', Law, (
+    Text('law_key', '법령키'),
+    Text('law_id', '기본정보', '법령ID'),
+    Text('name', '기본정보', '법령명_한글'),
+    Text('promulgation_date', '기본정보', '공포일자'),
+    Text('promulgation_number', '기본정보', '공포번호'),
+    Text('effective_date', '기본정보', '시행일자'),
+    Text('ministry', '기본정보', '소관부처'),
+    Text('revision_kind', '기본정보', '제개정구분'),
+    Many('articles', '조문', '조문단위', ARTICLE),
+    Many('addenda', '부칙', '부칙단위', ADDENDUM),
+    Many('tables', '별표', '별표단위', TABLE),
+    Text('revision_text', '개정문', '개정문내용'),
+    Text('reason_text', '제개정이유', '제개정이유내용'),
+))
+
+
+# ---------------------------------------------------------------------------
+# 판례 / 법령해석례 본문 (lawService.do?target=prec|expc) → dict
+# ---------------------------------------------------------------------------
+
+PREC_DETAIL = Record('prec_detail', dict, _fields(
+    '판례정보일련번호', '사건명', '사건번호', '선고일자', '선고', '법원명', '법원종류코드',
+    '사건종류명', '사건종류코드', '판결유형', '판시사항', '판결요지', '참조조문', '참조판례', '판례내용',
+))
+
+EXPC_DETAIL = Record('expc_detail', dict, _fields(
+    '법령해석례일련번호', '안건명', '안건번호', '해석일자', '해석기관코드', '해석기관명',
+    '질의기관코드', '질의기관명', '관리기관코드', '등록일시', '질의요지', '회답', '이유',
+))
+
+# 대상 → (응답 최상위 키, 본문 스키마)
+SERVICE_SCHEMAS = {
+    'law': ('법령', LAW_DETAIL),
+    'prec': ('PrecService', PREC_DETAIL),
+    'expc': ('ExpcService', EXPC_DETAIL),
+}
+
+
+# ---------------------------------------------------------------------------
+# 목록 (lawSearch.do) → dict
+# ---------------------------------------------------------------------------
+
+LAW_ITEM = Record('law_item', dict, _fields(
+    '법령일련번호', '법령명한글', '법령약칭명', '법령ID', '공포일자', '공포번호',
+    '제개정구분명', '시행일자', '소관부처명', '법령상세링크',
+))
+
+PREC_ITEM = Record('prec_item', dict, _fields(
+    '판례일련번호', '사건명', '사건번호', '선고일자', '법원명', '법원종류코드',
+    '사건종류명', '사건종류코드', '판결유형', '선고', '데이터출처명', '판례상세링크',
+))
+
+EXPC_ITEM = Record('expc_item', dict, _fields(
+    '법령해석례일련번호', '안건명', '안건번호', '질의기관코드', '질의기관명',
+    '회신기관코드', '회신기관명', '회신일자', '법령해석례상세링크',
+))
+
+# 대상 → 목록 항목 스키마
+SEARCH_SCHEMAS = {
+    'law': LAW_ITEM,
+    'prec': PREC_ITEM,
+    'expc': EXPC_ITEM,
+}
+
+
+def _root(data: Any, key: Optional[str]) -> Dict:
+    """응답 최상위 dict (key가 없으면 첫 번째 dict 값, 그것도 없으면 {})"""
+    if not isinstance(data, dict):
+        return {}
+    if key and isinstance(data.get(key), dict):
+        return data[key]
+    return next((value for value in data.values() if isinstance(value, dict)), {})
+
+
+def decode_law(data: Any) -> Law:
+    """lawService.do 법령 JSON 응답 → Law ('법령' 키가 없으면 빈 Law)"""
+    body = data.get('법령') if isinstance(data, dict) else None
+    if not body:
+        return Law()
+    return compile_record(LAW_DETAIL)(body)
+
+
+def decode_service(data: Any, target: str) -> Any:
+    """
+    lawService.do JSON 응답 → 대상 스키마 레코드
+
+    Raises:
+        KeyError: 스키마가 없는 대상
+    """
+    if target == 'law':
+        return decode_law(data)
+    root_key, record = SERVICE_SCHEMAS[target]
+    return compile_record(record)(_root(data, root_key))
+
+
+def decode_search(data: Any, target: str, item_key: str = None) -> Dict:
+    """
+    lawSearch.do JSON 응답 → {'total_count', 'page', 'items'}
+
+    스키마가 있는 대상은 선언한 필드만 정규화해서, 없는 대상은 항목을 그대로 담음
+    (항목 키가 대상 이름과 다르면 item_key 지정 - eflaw 목록은 'law')
+    """
+    root = _root(data, None)
+    units = _units(root.get(item_key or target), '')
+    record = SEARCH_SCHEMAS.get(target)
+    if record is not None:
+        decoder = compile_record(record)
+        units = [decoder(unit) for unit in units]
+    return {
+        'total_count': int(root.get('totalCnt', 0) or 0),
+        'page': int(root.get('page', 1) or 1),
+        'items': units,
+    }
+
+
+def compiled_sources(records: Sequence[Record] = None) -> str:
+    """컴파일된 디코더 코드 (디버깅용)"""
+    records = records or [LAW_DETAIL] + [record for _, record in SERVICE_SCHEMAS.values()] + list(SEARCH_SCHEMAS.values())
+    return '\n'.join(compile_record(record).source for record in dict.fromkeys(records))
+
+
+if __name__ == "__main__":
+    print(compiled_sources())
@@ -0,0 +1,463 @@
+#!/usr/bin/env python3
+"""
+법령 버전 저장소 (조문 단위 변경분 저장)
+Version 1.0.0 (2026-10-17)
+- 법령 하나의 과거 버전(시행일 법령 eflaw, 현행 law)을 모두 보관
+- 조문/부칙/별표 단위를 내용 해시(SHA-256) blob으로 한 번만 저장 (바뀌지 않은 조문은 버전 간 공유)
+- 버전마다 기준 버전 대비 바뀐 단위(set), 삭제된 단위(del), 순서가 바뀐 경우의 순서(order)만 기록
+- 기준 버전 사슬이 KEYFRAME_EVERY를 넘으면 전체 목록을 기록 (복원 시 따라가는 버전 수 제한)
+- 버전 복원은 law_render의 lawService.do JSON 형식으로 조립 → law_from_json (저장 전과 같은 Law)
+
+디렉토리 구조:
+    _versions/
+    ├── laws/001563.json        # 법령ID별 버전 목록 (시행일자 순)
+    └── units/ab/abcdef...      # 조문/부칙/별표 단위와 기본정보 (JSON, 해시 앞 2자리로 분산)
+
+사용법 (process-01-crawler 폴더에서):
+    python law_version_store.py ingest                     # 상세 조회 캐시의 law/eflaw JSON 응답 추가
+    python law_version_store.py list 001563
+    python law_version_store.py show 001563 --date 20210315 --format MD
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from law_api_cache import LawDetailCache, DEFAULT_CACHE_DIR
+from law_json_decode import loads
+from law_model import Law, law_from_json
+from law_render import RENDER_FORMATS, law_to_drf_json, render_bytes
+
+DEFAULT_STORE_DIR = '_versions'
+
+# 기준 버전 사슬 최대 길이 (넘으면 전체 목록 기록)
+KEYFRAME_EVERY = 16
+
+# 버전에서 단위로 나눠 저장하는 구획 → (lawService.do JSON 구획 키, 단위 키, 단위 키 필드)
+SECTIONS = (
+    ('조문', '조문단위', '조문키'),
+    ('부칙', '부칙단위', '부칙키'),
+    ('별표', '별표단위', '별표키'),
+)
+
+# 단위로 나누지 않고 기본정보 blob에 같이 저장하는 구획
+HEADER_SECTIONS = ('개정문', '제개정이유')
+
+# 상세 조회 캐시에서 버전으로 가져올 대상
+VERSION_TARGETS = ('law', 'eflaw')
+
+
+def canonical_bytes(data) -> bytes:
+    """해시/저장용 정규화 JSON (키 순서 고정, 공백 없음)"""
+    return json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def unit_keys(units: List[Dict], key_field: str) -> List[str]:
+    """
+    단위 목록 → 버전 안에서 유일한 키
+
+    편/장/절 제목 행처럼 조문키가 겹치거나 비어 있으면 '#순번'을 붙임
+    (같은 위치의 제목 행은 버전이 바뀌어도 같은 키가 되도록 등장 순서 기준)
+    """
+    keys = []
+    seen: Dict[str, int] = {}
+    for unit in units:
+        key = str(unit.get(key_field, ''))
+        count = seen.get(key, 0)
+        seen[key] = count + 1
+        keys.append(f"{key}#{count}" if count or not key else key)
+    return keys
+
+
+def version_id(mst: str, effective_date: str) -> str:
+    """버전 ID (같은 법령일련번호라도 시행일자가 다르면 다른 버전)"""
+    return f"{mst or 'nomst'}@{effective_date or 'nodate'}"
+
+
+class VersionedLawStore:
+    """법령 버전 저장소 (스레드 안전)"""
+
+    def __init__(self, store_dir: str = DEFAULT_STORE_DIR, keyframe_every: int = KEYFRAME_EVERY):
+        """
+        Args:
+            store_dir: 저장소 폴더
+            keyframe_every: 기준 버전 사슬 최대 길이
+        """
+        self.store_dir = store_dir
+        self.law_dir = os.path.join(store_dir, 'laws')
+        self.unit_dir = os.path.join(store_dir, 'units')
+        self.keyframe_every = max(1, keyframe_every)
+        self._lock = threading.RLock()
+        self._manifests: Dict[str, Dict] = {}
+        # 복원한 버전의 {구획: (키 목록, {키: 해시})} (사슬을 매번 다시 따라가지 않음)
+        self._tables: Dict[Tuple[str, str], Dict[str, Tuple[List[str], Dict[str, str]]]] = {}
+
+    # ------------------------------------------------------------------
+    # 단위 blob
+    # ------------------------------------------------------------------
+
+    def unit_path(self, digest: str) -> str:
+        return os.path.join(self.unit_dir, digest[:2], digest)
+
+    def put_unit(self, data) -> str:
+        """단위 저장 (이미 있으면 쓰지 않음), 내용 해시 반환"""
+        content = canonical_bytes(data)
+        digest = hashlib.sha256(content).hexdigest()
+        path = self.unit_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        return digest
+
+    def get_unit(self, digest: str):
+        with open(self.unit_path(digest), 'rb') as f:
+            return loads(f.read())
+
+    # ------------------------------------------------------------------
+    # 법령별 버전 목록
+    # ------------------------------------------------------------------
+
+    def manifest_path(self, law_id: str) -> str:
+        return os.path.join(self.law_dir, f"{law_id}.json")
+
+    def manifest(self, law_id: str) -> Dict:
+        """법령ID의 버전 목록 ({'law_id', 'name', 'versions': [...]}, 없으면 빈 목록)"""
+        with self._lock:
+            if law_id not in self._manifests:
+                path = self.manifest_path(law_id)
+                data = {'law_id': law_id, 'name': '', 'versions': []}
+                if os.path.exists(path):
+                    try:
+                        with open(path, 'r', encoding='utf-8') as f:
+                            data = json.load(f)
+                    except (OSError, json.JSONDecodeError) as e:
+                        print(f"⚠️ 버전 목록 읽기 오류 ({law_id}, 새로 시작): {e}")
+                self._manifests[law_id] = data
+            return self._manifests[law_id]
+
+    def save_manifest(self, law_id: str):
+        """버전 목록 저장 (임시 파일 → 교체로 원자적 저장)"""
+        os.makedirs(self.law_dir, exist_ok=True)
+        path = self.manifest_path(law_id)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._manifests[law_id], f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, path)
+
+    def law_ids(self) -> List[str]:
+        if not os.path.isdir(self.law_dir):
+            return []
+        return sorted(name[:-len('.json')] for name in os.listdir(self.law_dir) if name.endswith('.json'))
+
+    def versions(self, law_id: str) -> List[Dict]:
+        """버전 목록 (시행일자, 공포일자 순)"""
+        return list(self.manifest(law_id)['versions'])
+
+    def find_version(self, law_id: str, vid: str) -> Optional[Dict]:
+        return next((v for v in self.manifest(law_id)['versions'] if v['id'] == vid), None)
+
+    # ------------------------------------------------------------------
+    # 버전 추가
+    # ------------------------------------------------------------------
+
+    def split_law(self, law: Law) -> Tuple[str, Dict[str, Tuple[List[str], Dict[str, str]]]]:
+        """Law → (기본정보 blob 해시, {구획: (키 목록, {키: 단위 해시})})"""
+        body = law_to_drf_json(law)['법령']
+        header = {'법령키': body.get('법령키', ''), '기본정보': body.get('기본정보', {})}
+        for name in HEADER_SECTIONS:
+            if name in body:
+                header[name] = body[name]
+
+        tables = {}
+        for name, unit_name, key_field in SECTIONS:
+            units = body.get(name, {}).get(unit_name, [])
+            keys = unit_keys(units, key_field)
+            tables[name] = (keys, {key: self.put_unit(unit) for key, unit in zip(keys, units)})
+        return self.put_unit(header), tables
+
+    def pick_base(self, versions: List[Dict], effective_date: str) -> Optional[Dict]:
+        """
+        기준 버전 선택: 시행일자가 가장 가까운 이전 버전 (없으면 가장 이른 버전)
+
+        사슬이 keyframe_every에 이르면 None (전체 목록 기록)
+        """
+        earlier = [v for v in versions if v['effective_date'] <= effective_date]
+        base = earlier[-1] if earlier else (versions[0] if versions else None)
+        if base and base['depth'] + 1 >= self.keyframe_every:
+            return None
+        return base
+
+    def add(self, law: Law, mst: str = '', effective_date: str = '') -> Dict:
+        """
+        버전 추가 (같은 버전 ID가 있으면 그대로 반환)
+
+        Args:
+            law: 파싱된 법령
+            mst: 법령일련번호 (캐시 키 등에서 알 때)
+            effective_date: 시행일자 (eflaw의 efYd, 없으면 법령 시행일자)
+
+        Returns:
+            버전 기록 ({'id', 'effective_date', 'changed', 'total', ...})
+        """
+        if not law.law_id:
+            raise ValueError("법령ID가 없는 법령은 저장할 수 없습니다")
+
+        effective_date = effective_date or law.effective_date
+        vid = version_id(mst, effective_date)
+        header, tables = self.split_law(law)
+
+        with self._lock:
+            manifest = self.manifest(law.law_id)
+            existing = self.find_version(law.law_id, vid)
+            if existing:
+                return existing
+
+            versions = manifest['versions']
+            base = self.pick_base(versions, effective_date)
+            base_tables = self.tables(law.law_id, base['id']) if base else {}
+
+            sections = {}
+            changed = total = 0
+            for name, (keys, hashes) in tables.items():
+                base_keys, base_hashes = base_tables.get(name, ([], {}))
+                delta = {}
+                updates = {key: digest for key, digest in hashes.items() if base_hashes.get(key) != digest}
+                if updates:
+                    delta['set'] = updates
+                removed = [key for key in base_keys if key not in hashes]
+                if removed:
+                    delta['del'] = removed
+                if keys != self._merged_order(base_keys, removed, updates):
+                    delta['order'] = keys
+                if delta:
+                    sections[name] = delta
+                changed += len(updates) + len(removed)
+                total += len(keys)
+
+            record = {
+                'id': vid,
+                'mst': mst,
+                'effective_date': effective_date,
+                'promulgation_date': law.promulgation_date,
+                'promulgation_number': law.promulgation_number,
+                'revision_kind': law.revision_kind,
+                'name': law.name,
+                'header': header,
+                'base': base['id'] if base else None,
+                'depth': base['depth'] + 1 if base else 0,
+                'sections': sections,
+                'changed': changed,
+                'total': total,
+            }
+            versions.append(record)
+            versions.sort(key=lambda v: (v['effective_date'], v['promulgation_date'], v['id']))
+            manifest['name'] = versions[-1]['name']
+            self._tables[(law.law_id, vid)] = tables
+            self.save_manifest(law.law_id)
+            return record
+
+    @staticmethod
+    def _merged_order(base_keys: List[str], removed: List[str], updates: Dict[str, str]) -> List[str]:
+        """order를 기록하지 않았을 때 복원되는 순서 (기준 순서 - 삭제 + 새 키는 뒤에)"""
+        removed_set = set(removed)
+        keys = [key for key in base_keys if key not in removed_set]
+        known = set(keys)
+        keys += [key for key in updates if key not in known]
+        return keys
+
+    # ------------------------------------------------------------------
+    # 버전 복원
+    # ------------------------------------------------------------------
+
+    def tables(self, law_id: str, vid: str) -> Dict[str, Tuple[List[str], Dict[str, str]]]:
+        """버전의 {구획: (키 목록, {키: 단위 해시})} (기준 버전 사슬을 따라 변경분 적용)"""
+        with self._lock:
+            cached = self._tables.get((law_id, vid))
+            if cached is not None:
+                return cached
+
+            chain = []
+            record = self.find_version(law_id, vid)
+            if record is None:
+                raise KeyError(f"없는 버전입니다: {law_id} {vid}")
+            while record is not None:
+                chain.append(record)
+                if (law_id, record['id']) in self._tables and len(chain) > 1:
+                    break
+                record = self.find_version(law_id, record['base']) if record['base'] else None
+
+            start = chain.pop()
+            if (law_id, start['id']) in self._tables:
+                tables = {name: (list(keys), dict(hashes))
+                          for name, (keys, hashes) in self._tables[(law_id, start['id'])].items()}
+            else:
+                tables = {name: ([], {}) for name, _, _ in SECTIONS}
+                self._apply(tables, start)
+            for record in reversed(chain):
+                self._apply(tables, record)
+
+            self._tables[(law_id, vid)] = tables
+            return tables
+
+    def _apply(self, tables: Dict, record: Dict):
+        for name, delta in record['sections'].items():
+            keys, hashes = tables.setdefault(name, ([], {}))
+            removed = delta.get('del', [])
+            updates = delta.get('set', {})
+            for key in removed:
+                hashes.pop(key, None)
+            hashes.update(updates)
+            keys[:] = delta['order'] if 'order' in delta else self._merged_order(keys, removed, updates)
+
+    def article_hashes(self, law_id: str, vid: str) -> Dict[str, str]:
+        """버전의 {조문 키: 조문 해시} (해시가 같으면 조문 내용이 같음)"""
+        return dict(self.tables(law_id, vid)['조문'][1])
+
+    def load_drf_json(self, law_id: str, vid: str) -> Dict:
+        """버전 → lawService.do JSON 응답 형식"""
+        record = self.find_version(law_id, vid)
+        if record is None:
+            raise KeyError(f"없는 버전입니다: {law_id} {vid}")
+
+        body = dict(self.get_unit(record['header']))
+        for name, (keys, hashes) in self.tables(law_id, vid).items():
+            unit_name = next(unit for section, unit, _ in SECTIONS if section == name)
+            if keys:
+                body[name] = {unit_name: [self.get_unit(hashes[key]) for key in keys]}
+        return {'법령': body}
+
+    def load(self, law_id: str, vid: str) -> Law:
+        """버전 → Law"""
+        return law_from_json(self.load_drf_json(law_id, vid))
+
+    def version_at(self, law_id: str, date: str) -> Optional[Dict]:
+        """date(YYYYMMDD)에 시행 중인 버전 (시행일자가 date 이하인 마지막 버전)"""
+        current = None
+        for record in self.manifest(law_id)['versions']:
+            if record['effective_date'] > date:
+                break
+            current = record
+        return current
+
+    # ------------------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------------------
+
+    def stats(self, law_id: str) -> Dict:
+        """버전 수, 저장한 단위 수/크기, 버전마다 전체를 저장했을 때의 크기"""
+        unique: Dict[str, int] = {}
+        snapshot_bytes = 0
+        for record in self.manifest(law_id)['versions']:
+            digests = [record['header']]
+            for _, hashes in self.tables(law_id, record['id']).values():
+                digests.extend(hashes.values())
+            for digest in digests:
+                if digest not in unique:
+                    unique[digest] = os.path.getsize(self.unit_path(digest))
+                snapshot_bytes += unique[digest]
+        manifest_bytes = os.path.getsize(self.manifest_path(law_id)) if os.path.exists(
+            self.manifest_path(law_id)) else 0
+        return {
+            'versions': len(self.manifest(law_id)['versions']),
+            'units': len(unique),
+            'stored_bytes': sum(unique.values()) + manifest_bytes,
+            'snapshot_bytes': snapshot_bytes,
+        }
+
+
+def iter_cached_versions(cache_dir: str) -> Iterable[Tuple[str, str, Law]]:
+    """
+    상세 조회 캐시의 전체 조문 JSON 응답 (law/eflaw) → (MST, 시행일자, Law)
+
+    eflaw는 캐시 키의 efYd를 시행일자로 사용
+    """
+    cache = LawDetailCache(cache_dir)
+    for key, entry in cache.index.items():
+        params = dict(part.split('=', 1) for part in key.split('|'))
+        if params.get('target') not in VERSION_TARGETS or params.get('JO') or params.get('type') != 'JSON':
+            continue
+        try:
+            with open(cache.blob_path(entry['blob']), 'rb') as f:
+                law = law_from_json(loads(f.read()))
+        except (OSError, KeyError, json.JSONDecodeError):
+            continue
+        if law.law_id:
+            yield params.get('MST', ''), params.get('efYd', ''), law
+
+
+def ingest_cache(store: VersionedLawStore, cache_dir: str = DEFAULT_CACHE_DIR) -> int:
+    """상세 조회 캐시 → 버전 저장소 (새로 추가한 버전 수 반환)"""
+    added = 0
+    for mst, effective_date, law in iter_cached_versions(cache_dir):
+        before = len(store.manifest(law.law_id)['versions'])
+        record = store.add(law, mst, effective_date)
+        if len(store.manifest(law.law_id)['versions']) > before:
+            added += 1
+            print(f"  ➕ {law.name} {record['id']} (변경 {record['changed']}/{record['total']})")
+    return added
+
+
+def main():
+    parser = argparse.ArgumentParser(description="법령 버전 저장소")
+    parser.add_argument('--store-dir', default=DEFAULT_STORE_DIR)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    ingest = sub.add_parser('ingest', help="상세 조회 캐시의 law/eflaw JSON 응답 추가")
+    ingest.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR)
+
+    listing = sub.add_parser('list', help="버전 목록")
+    listing.add_argument('law_ids', nargs='*', help="법령ID (없으면 전체)")
+
+    show = sub.add_parser('show', help="버전 복원")
+    show.add_argument('law_id')
+    show.add_argument('--version', help="버전 ID (MST@시행일자)")
+    show.add_argument('--date', help="이 날짜(YYYYMMDD)에 시행 중인 버전")
+    show.add_argument('--format', default='MD', type=str.upper, choices=sorted(RENDER_FORMATS))
+    show.add_argument('--out', help="저장 경로 (없으면 화면 출력)")
+
+    args = parser.parse_args()
+    store = VersionedLawStore(args.store_dir)
+
+    if args.command == 'ingest':
+        added = ingest_cache(store, args.cache_dir)
+        print(f"💾 버전 {added}개 추가 ({args.store_dir})")
+
+    elif args.command == 'list':
+        for law_id in args.law_ids or store.law_ids():
+            versions = store.versions(law_id)
+            if not versions:
+                print(f"⚠️ 저장된 버전이 없습니다: {law_id}")
+                continue
+            stats = store.stats(law_id)
+            ratio = stats['stored_bytes'] / stats['snapshot_bytes'] * 100 if stats['snapshot_bytes'] else 0
+            print(f"\n📋 {store.manifest(law_id)['name']} ({law_id}) - 버전 {stats['versions']}개, "
+                  f"저장 {stats['stored_bytes']:,} bytes / 전체 사본 {stats['snapshot_bytes']:,} bytes ({ratio:.1f}%)")
+            for record in versions:
+                print(f"  {record['effective_date']} {record['id']:24s} {record['revision_kind']:8s} "
+                      f"변경 {record['changed']:4d}/{record['total']}")
+
+    else:
+        record = (store.find_version(args.law_id, args.version) if args.version
+                  else store.version_at(args.law_id, args.date) if args.date
+                  else (store.versions(args.law_id) or [None])[-1])
+        if record is None:
+            print("❌ 해당 버전이 없습니다.")
+            sys.exit(1)
+        content = render_bytes(store.load(args.law_id, record['id']), args.format)
+        if args.out:
+            with open(args.out, 'wb') as f:
+                f.write(content)
+            print(f"💾 {args.out} 저장 완료 ({record['id']})")
+        else:
+            sys.stdout.write(content.decode('utf-8'))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+법령 상세 XML 스트리밍 파서
+Version 1.2.0 (2026-10-17)
+- 응답을 조각(chunk) 단위로 받으면서 파싱 (다운로드 완료 전부터 처리 가능)
+- 조문단위 하나가 끝날 때마다 구조화된 조문을 yield
+- 처리한 요소는 트리에서 즉시 제거하여 법령 크기와 무관하게 메모리 일정
+- 전체 XML 한 번 순회 파서 (parse_law_detail, 조문→항→호→목 직접 구성)
+- 결과는 law_model의 Law/Article 등 데이터클래스
+
+사용 예:
+    response = session.get(url, params=params, stream=True)
+    for article in iter_law_articles(response.iter_content(64 * 1024)):
+        print(article.label, article.title)
+"""
+
+import xml.etree.ElementTree as ET
+from typing import Dict, Iterable, Iterator, Tuple
+
+from law_model import Law, Article, Paragraph, Item, SubItem, Addendum, Table
+
+CHUNK_SIZE = 64 * 1024
+
+# 법령 상세 XML의 단위 요소 → 종류
+UNIT_TAGS = {
+    '기본정보': '기본정보',
+    '조문단위': '조문',
+    '부칙단위': '부칙',
+    '별표단위': '별표',
+    '개정문': '개정문',
+    '제개정이유': '제개정이유',
+}
+
+BASIC_FIELDS = frozenset((
+    '법령ID', '법령명_한글', '법령명_한자', '법령명약칭',
+    '공포일자', '공포번호', '시행일자', '소관부처',
+    '제개정구분', '소관부처명', '부서명', '부서연락처',
+))
+
+# XML 태그 → 모델 속성
+ARTICLE_FIELDS = {
+    '조문번호': 'number',
+    '조문가지번호': 'branch',
+    '조문여부': 'kind',
+    '조문제목': 'title',
+    '조문내용': 'text',
+    '조문시행일자': 'effective_date',
+    '조문제개정유형': 'revision_type',
+    '조문변경여부': 'changed',
+}
+ADDENDUM_FIELDS = {
+    '부칙공포일자': 'promulgation_date',
+    '부칙공포번호': 'promulgation_number',
+    '부칙내용': 'text',
+}
+TABLE_FIELDS = {
+    '별표번호': 'number',
+    '별표가지번호': 'branch',
+    '별표구분': 'kind',
+    '별표제목': 'title',
+    '별표내용': 'text',
+    '별표서식파일링크': 'hwp_link',
+    '별표HWP파일명': 'hwp_name',
+    '별표서식PDF파일링크': 'pdf_link',
+    '별표PDF파일명': 'pdf_name',
+}
+
+def _collect_text(elem: ET.Element) -> str:
+    """요소 안의 모든 텍스트 (부칙내용/개정문내용처럼 여러 줄로 나뉜 경우)"""
+    return '\n'.join(text.strip() for text in elem.itertext() if text.strip())
+
+
+def build_basic_info(elem: ET.Element) -> Dict:
+    """기본정보 요소 → 필드 (하위 요소까지 한 번 순회, 같은 필드는 첫 값 사용)"""
+    info = {}
+    for child in elem.iter():
+        if child.tag in BASIC_FIELDS and child.tag not in info and child.text and child.text.strip():
+            info[child.tag] = child.text
+    return info
+
+
+def _build_subitem(elem: ET.Element) -> SubItem:
+    sub = SubItem()
+    for child in elem:
+        if child.tag == '목번호':
+            sub.number = child.text or ''
+        elif child.tag == '목내용':
+            sub.text = child.text or ''
+    return sub
+
+
+def _build_item(elem: ET.Element) -> Item:
+    item = Item()
+    for child in elem:
+        tag = child.tag
+        if tag == '목':
+            item.subitems.append(_build_subitem(child))
+        elif tag == '호번호':
+            item.number = child.text or ''
+        elif tag == '호내용':
+            item.text = child.text or ''
+    return item
+
+
+def _build_paragraph(elem: ET.Element) -> Paragraph:
+    para = Paragraph()
+    for child in elem:
+        tag = child.tag
+        if tag == '호':
+            para.items.append(_build_item(child))
+        elif tag == '항번호':
+            para.number = child.text or ''
+        elif tag == '항내용':
+            para.text = child.text or ''
+        elif tag == '항제개정유형':
+            para.revision_type = child.text or ''
+    return para
+
+
+def build_article(elem: ET.Element) -> Article:
+    """조문단위 요소 → Article (직계 자식만 한 번씩 방문)"""
+    article = Article(key=elem.get('조문키', ''))
+    for child in elem:
+        tag = child.tag
+        if tag == '항':
+            article.paragraphs.append(_build_paragraph(child))
+        elif tag in ARTICLE_FIELDS:
+            setattr(article, ARTICLE_FIELDS[tag], child.text or '')
+    return article
+
+
+def _build_fields(elem: ET.Element, fields: Dict[str, str], target):
+    """태그 → 속성 매핑으로 채우기 (부칙내용처럼 같은 태그가 반복되면 줄바꿈으로 연결)"""
+    for child in elem:
+        attr = fields.get(child.tag)
+        if attr:
+            text = _collect_text(child)
+            if text:
+                current = getattr(target, attr)
+                setattr(target, attr, f"{current}\n{text}" if current else text)
+    return target
+
+
+def build_unit(kind: str, elem: ET.Element):
+    """단위 요소 → 모델 (종류는 UNIT_TAGS 값)"""
+    if kind == '조문':
+        return build_article(elem)
+    if kind == '부칙':
+        return _build_fields(elem, ADDENDUM_FIELDS, Addendum(key=elem.get('부칙키', '')))
+    if kind == '별표':
+        return _build_fields(elem, TABLE_FIELDS, Table(key=elem.get('별표키', '')))
+    if kind == '기본정보':
+        return build_basic_info(elem)
+    # 개정문/제개정이유: 본문 텍스트 전체
+    return _collect_text(elem)
+
+
+def iter_law_units(chunks: Iterable[bytes]) -> Iterator[Tuple[str, object]]:
+    """
+    법령 상세 XML 스트리밍 파싱
+
+    Args:
+        chunks: XML 바이트 조각 (response.iter_content(), 파일 읽기 등)
+
+    Yields:
+        (종류, 데이터) - 종류는 '기본정보'(dict), '조문'(Article), '부칙'(Addendum),
+                         '별표'(Table), '개정문'/'제개정이유'(str)
+    """
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    stack = []
+    # 단위 요소 안쪽(예: 조문단위 안의 항)은 단위가 끝날 때 한꺼번에 처리
+    depth_in_unit = 0
+
+    def drain():
+        nonlocal depth_in_unit
+        for event, elem in parser.read_events():
+            if event == 'start':
+                stack.append(elem)
+                if depth_in_unit or elem.tag in UNIT_TAGS:
+                    depth_in_unit += 1
+                continue
+
+            stack.pop()
+            if not depth_in_unit:
+                continue
+
+            depth_in_unit -= 1
+            if depth_in_unit == 0:
+                yield UNIT_TAGS[elem.tag], build_unit(UNIT_TAGS[elem.tag], elem)
+                # 부모에서 떼어내야 트리가 커지지 않음
+                if stack:
+                    stack[-1].remove(elem)
+                elem.clear()
+
+    for chunk in chunks:
+        if chunk:
+            parser.feed(chunk)
+            yield from drain()
+
+    parser.close()
+    yield from drain()
+
+
+def parse_law_detail(xml_content) -> Law:
+    """
+    법령 상세 XML 전체 파싱 (트리를 한 번만 순회)
+
+    법령 → 기본정보/조문/부칙/별표/개정문/제개정이유 순으로 직계 자식만 따라 내려가며
+    조문단위 → 항 → 호 → 목 계층을 바로 구성 (하위 요소 전체 검색 없음)
+
+    Raises:
+        ET.ParseError: XML 형식 오류
+    """
+    if isinstance(xml_content, str):
+        xml_content = xml_content.encode('utf-8')
+    return build_law_detail(ET.fromstring(xml_content))
+
+
+def apply_basic_info(law: Law, info: Dict) -> Law:
+    """기본정보 필드 → Law 속성"""
+    law.law_id = info.get('법령ID', '')
+    law.name = info.get('법령명_한글', '')
+    law.promulgation_date = info.get('공포일자', '')
+    law.promulgation_number = info.get('공포번호', '')
+    law.effective_date = info.get('시행일자', '')
+    law.ministry = info.get('소관부처명') or info.get('소관부처', '')
+    law.revision_kind = info.get('제개정구분', '')
+    return law
+
+
+def build_law_detail(root: ET.Element) -> Law:
+    """파싱된 법령 트리 → Law (parse_law_detail의 순회 단계)"""
+    law = Law(law_key=root.get('법령키', ''))
+    targets = {'조문': law.articles, '부칙': law.addenda, '별표': law.tables}
+
+    for section in root:
+        kind = UNIT_TAGS.get(section.tag)
+        if kind == '기본정보':
+            apply_basic_info(law, build_basic_info(section))
+        elif kind == '개정문':
+            law.revision_text = build_unit(kind, section)
+        elif kind == '제개정이유':
+            law.reason_text = build_unit(kind, section)
+        elif section.tag in targets:
+            # 조문 → 조문단위, 부칙 → 부칙단위, 별표 → 별표단위
+            for unit in section:
+                if UNIT_TAGS.get(unit.tag) == section.tag:
+                    targets[section.tag].append(build_unit(section.tag, unit))
+
+    return law
+
+
+def iter_law_articles(chunks: Iterable[bytes]) -> Iterator[Article]:
+    """조문(Article)만 하나씩 yield (iter_law_units의 조문 필터)"""
+    for kind, data in iter_law_units(chunks):
+        if kind == '조문':
+            yield data
+
+
+def iter_file_chunks(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """파일을 조각 단위로 읽기 (캐시/저장된 XML 스트리밍용)"""
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
@@ -1,20 +1,35 @@
 #!/usr/bin/env python3
 """
 법제처 Open API 고급 클라이언트
-Version 1.0.0 (2025-01-11)
+Version 1.1.0 (2026-10-17)
 - 법령 본문 상세 조회 (특정 조문, 언어 선택)
 - 부칙, 별표, 개정문 조회
 - 다양한 출력 형식 지원 (HTML/XML/JSON)
+- 공용 HTTP 세션 사용 (연결 풀, keep-alive, gzip)
+- 상세 조회 응답 캐시 (변경 없는 법령은 재다운로드 생략)
+- 법령 상세 XML 스트리밍 파싱 (iter_law_detail_xml, 조문 단위 yield)
+- 구조화 파싱 한 번 순회로 재작성 (조문단위 → 항 → 호 → 목)
+- 구조화 결과를 공용 법령 모델(law_model.Law)로 생성
+- 토큰 버킷 속도 제한 + 429/5xx/시간 초과 재시도 (지수 백오프 + 지터)
+- API 주소 설정 (API_law.yaml의 base_url, 로컬 재생 서버 사용 가능)
+- JSON 응답은 바이트 그대로 파싱 (law_json_decode, orjson이 있으면 사용)
+- 상세 응답은 검증 후 캐시 저장 (HTTP 200 오류 페이지 제외), 손상된 캐시 항목은 삭제 후 재조회
 """
 
-import requests
 import xml.etree.ElementTree as ET
 import json
 import yaml
 import os
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, Iterator
 from datetime import datetime
 
+from law_api_cache import LawDetailCache, decode_detail, make_cache_key, DEFAULT_CACHE_DIR
+from law_api_ratelimit import create_rate_limiter, create_retry_policy
+from law_api_sanitize import sanitize_data
+from law_api_session import get_session, request_with_retry, DEFAULT_BASE_URL, DEFAULT_TIMEOUT
+from law_model import Law, Article
+from law_xml_stream import iter_law_articles, iter_file_chunks, parse_law_detail, CHUNK_SIZE
+
 class AdvancedLawAPIClient:
     def __init__(self):
         """YAML 파일에서 설정 로드"""
@@ -30,9 +45,20 @@ class AdvancedLawAPIClient:
         if '@' in self.email_id:
             self.email_id = self.email_id.split('@')[0]
         
-        self.base_url = "http://www.law.go.kr/DRF"
+        # API 주소 (API_law.yaml의 base_url로 로컬 재생 서버 등 지정 가능)
+        self.base_url = self.config.get('base_url', DEFAULT_BASE_URL)
         # 실행 시간 기준 폴더명 생성
         self.session_folder = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # 공용 HTTP 세션 (연결 풀 + keep-alive, 모든 클라이언트 공유)
+        self.session = get_session(self.config.get('http_pool_size'))
+        # 호출 속도 제한 + 재시도 (API_law.yaml의 requests_per_second, endpoint_rates, max_retries)
+        self.rate_limiter = create_rate_limiter(self.config)
+        self.retry_policy = create_retry_policy(self.config)
+        self.timeout = self.config.get('request_timeout', DEFAULT_TIMEOUT)
+        # 상세 조회 응답 캐시 (API_law.yaml의 detail_cache: false로 끌 수 있음)
+        self.detail_cache = None
+        if self.config.get('detail_cache', True):
+            self.detail_cache = LawDetailCache(self.config.get('cache_dir', DEFAULT_CACHE_DIR))
         print(f"✅ API 클라이언트 초기화 완료")
     
     def load_config(self) -> Dict:
@@ -74,7 +100,8 @@ class AdvancedLawAPIClient:
         print(f"\n🔍 '{query}' 검색 중...")
         
         try:
-            response = requests.get(url, params=params)
+            response = request_with_retry(self.session, url, params, self.rate_limiter,
+                                          self.retry_policy, self.timeout)
             if response.status_code == 200:
                 return self.parse_search_xml(response.content)
             else:
@@ -126,9 +153,10 @@ class AdvancedLawAPIClient:
                       mst: str = None,
                       output_type: str = "XML",
                       jo_num: str = None,
-                      lang: str = None) -> Optional[Any]:
+                      lang: str = None,
+                      law_info: Dict = None) -> Optional[Any]:
         """
-        법령 상세 조회 (고급 옵션)
+        법령 상세 조회 (고급 옵션, 캐시 우선)
         
         Args:
             law_id: 법령 ID (ID 또는 MST 중 하나는 필수)
@@ -136,6 +164,7 @@ class AdvancedLawAPIClient:
             output_type: 출력 형식 (HTML/XML/JSON)
             jo_num: 조번호 (6자리: 조번호4자리+조가지번호2자리, 예: 000200=2조)
             lang: 언어 (KO=한글, ORI=원문, 기본값=한글)
+            law_info: 검색 결과 항목 (시행일자/공포일자로 캐시 만료 판단)
         """
         
         if not law_id and not mst:
@@ -166,129 +195,115 @@ class AdvancedLawAPIClient:
             desc += f", 언어: {lang}"
         desc += ")"
         
+        cache_key = make_cache_key('law', mst=mst, law_id=law_id, jo=jo_num, lang=lang, output_type=output_type)
+        if self.detail_cache:
+            cached = self.detail_cache.get(cache_key, law_info)
+            if cached is not None:
+                try:
+                    result = decode_detail(cached, output_type)
+                    print(f"📦 캐시 사용 ({desc})")
+                    return result
+                except ValueError as e:
+                    # 손상된 항목은 지우고 다시 조회 (같은 키가 계속 실패하지 않게)
+                    print(f"⚠️ 캐시 항목 손상, 다시 조회: {e}")
+                    self.detail_cache.remove(cache_key)
+        
         print(f"📖 {desc}...")
         
         try:
-            response = requests.get(url, params=params)
+            response = request_with_retry(self.session, url, params, self.rate_limiter,
+                                          self.retry_policy, self.timeout)
             if response.status_code == 200:
-                if output_type == "JSON":
-                    return response.json()
-                else:
-                    return response.text
+                # 검증을 통과한 응답만 캐시에 저장 (HTTP 200 오류 페이지 제외)
+                result = decode_detail(response.content, output_type)
+                if self.detail_cache:
+                    self.detail_cache.put(cache_key, response.content, law_info)
+                return result
             else:
                 print(f"❌ 조회 실패: HTTP {response.status_code}")
                 return None
+        except ValueError as e:
+            print(f"❌ 응답 형식 오류: {e}")
+            return None
         except Exception as e:
             print(f"❌ 요청 오류: {e}")
             return None
     
-    def parse_law_detail_xml(self, xml_content: str) -> Dict:
-        """법령 상세 XML 파싱하여 구조화"""
+    def iter_law_detail_xml(self,
+                            law_id: str = None,
+                            mst: str = None,
+                            jo_num: str = None,
+                            lang: str = None,
+                            law_info: Dict = None) -> Iterator[Article]:
+        """
+        법령 상세 XML 스트리밍 조회 (조문을 하나씩 yield)
+        
+        전체 응답을 메모리에 올리지 않고 받는 즉시 파싱하므로
+        조세특례제한법처럼 큰 법령도 메모리가 일정하고,
+        다운로드가 끝나기 전부터 다음 단계 처리를 시작할 수 있음.
+        캐시에 있으면 캐시 파일에서 스트리밍 (스트리밍 조회 결과는 캐시에 저장하지 않음)
+        
+        Args:
+            get_law_detail()과 동일
+        
+        Raises:
+            ET.ParseError: XML 형식 오류 (그 전까지의 조문은 이미 yield됨 → 일부만 받은 법령을
+                           완전한 법령으로 오인하지 않도록 예외로 알림, 손상된 캐시 항목은 삭제)
+        """
+        if not law_id and not mst:
+            print("❌ law_id 또는 mst 중 하나는 필수입니다")
+            return
+        
+        cache_key = make_cache_key('law', mst=mst, law_id=law_id, jo=jo_num, lang=lang, output_type='XML')
+        cached_path = self.detail_cache.get_path(cache_key, law_info) if self.detail_cache else None
+        if cached_path:
+            print(f"📦 캐시에서 스트리밍 (MST: {mst or '-'}, ID: {law_id or '-'})")
+            try:
+                yield from iter_law_articles(iter_file_chunks(cached_path))
+            except ET.ParseError:
+                self.detail_cache.remove(cache_key)
+                raise
+            return
+        
+        url = f"{self.base_url}/lawService.do"
+        params = {
+            'OC': self.email_id,
+            'target': 'law',
+            'type': 'XML'
+        }
+        if law_id:
+            params['ID'] = law_id
+        if mst:
+            params['MST'] = mst
+        if jo_num:
+            params['JO'] = jo_num
+        if lang:
+            params['LANG'] = lang
+        
+        print(f"📖 법령 상세 스트리밍 조회 (MST: {mst or '-'}, ID: {law_id or '-'})...")
+        
+        with request_with_retry(self.session, url, params, self.rate_limiter, self.retry_policy,
+                                self.timeout, stream=True) as response:
+            if response.status_code != 200:
+                print(f"❌ 조회 실패: HTTP {response.status_code}")
+                return
+            yield from iter_law_articles(response.iter_content(CHUNK_SIZE))
+    
+    def parse_law_detail_xml(self, xml_content: str) -> Optional[Law]:
+        """
+        법령 상세 XML 파싱하여 구조화
+        
+        트리를 한 번만 순회하며 조문단위 → 항 → 호 → 목 계층을 직접 구성
+        (law_xml_stream.parse_law_detail 참고)
+        
+        Returns:
+            Law 모델 (파싱 실패 시 None)
+        """
         try:
-            root = ET.fromstring(xml_content)
-            
-            result = {
-                '기본정보': {},
-                '조문': [],
-                '부칙': [],
-                '별표': [],
-                '개정문': None,
-                '제개정이유': None
-            }
-            
-            # 기본 정보 추출
-            basic_fields = [
-                '법령ID', '법령명_한글', '법령명_한자', '법령명약칭',
-                '공포일자', '공포번호', '시행일자', '소관부처',
-                '제개정구분', '소관부처명', '부서명', '부서연락처'
-            ]
-            
-            for field in basic_fields:
-                elem = root.find(f'.//{field}')
-                if elem is not None and elem.text:
-                    result['기본정보'][field] = elem.text
-            
-            # 조문 추출
-            for article in root.findall('.//조문'):
-                article_info = {}
-                article_fields = [
-                    '조문번호', '조문가지번호', '조문제목', '조문내용',
-                    '조문시행일자', '조문제개정유형', '조문변경여부'
-                ]
-                
-                for field in article_fields:
-                    elem = article.find(field)
-                    if elem is not None and elem.text:
-                        article_info[field] = elem.text
-                
-                # 항 추출
-                article_info['항'] = []
-                for para in article.findall('.//항'):
-                    para_info = {}
-                    para_fields = ['항번호', '항내용', '항제개정유형']
-                    for field in para_fields:
-                        elem = para.find(field)
-                        if elem is not None and elem.text:
-                            para_info[field] = elem.text
-                    
-                    # 호 추출
-                    para_info['호'] = []
-                    for item in para.findall('.//호'):
-                        item_info = {}
-                        item_fields = ['호번호', '호내용']
-                        for field in item_fields:
-                            elem = item.find(field)
-                            if elem is not None and elem.text:
-                                item_info[field] = elem.text
-                        if item_info:
-                            para_info['호'].append(item_info)
-                    
-                    if para_info:
-                        article_info['항'].append(para_info)
-                
-                if article_info:
-                    result['조문'].append(article_info)
-            
-            # 부칙 추출
-            for addendum in root.findall('.//부칙'):
-                add_info = {}
-                add_fields = ['부칙공포일자', '부칙공포번호', '부칙내용']
-                for field in add_fields:
-                    elem = addendum.find(field)
-                    if elem is not None and elem.text:
-                        add_info[field] = elem.text
-                if add_info:
-                    result['부칙'].append(add_info)
-            
-            # 별표 추출
-            for table in root.findall('.//별표'):
-                table_info = {}
-                table_fields = [
-                    '별표번호', '별표가지번호', '별표구분', '별표제목',
-                    '별표내용', '별표서식파일링크', '별표HWP파일명',
-                    '별표서식PDF파일링크', '별표PDF파일명'
-                ]
-                for field in table_fields:
-                    elem = table.find(field)
-                    if elem is not None and elem.text:
-                        table_info[field] = elem.text
-                if table_info:
-                    result['별표'].append(table_info)
-            
-            # 개정문 및 제개정이유
-            revision_elem = root.find('.//개정문내용')
-            if revision_elem is not None and revision_elem.text:
-                result['개정문'] = revision_elem.text
-            
-            reason_elem = root.find('.//제개정이유내용')
-            if reason_elem is not None and reason_elem.text:
-                result['제개정이유'] = reason_elem.text
-            
-            return result
-            
+            return parse_law_detail(xml_content)
         except ET.ParseError as e:
             print(f"❌ XML 파싱 오류: {e}")
-            return {}
+            return None
     
     def interactive_search(self):
         """대화형 검색 및 상세 조회"""
@@ -457,15 +472,17 @@ class AdvancedLawAPIClient:
             mst=mst,
             output_type=output_type,
             jo_num=jo_num,
-            lang=lang
+            lang=lang,
+            law_info=law_info
         )
         
         if result:
             if choice == '4' and output_type == 'XML':
                 # 구조화된 분석
                 parsed = self.parse_law_detail_xml(result)
-                self.display_structured_result(parsed)
-                self.save_result(parsed, "구조화분석", 'JSON', law_name=law_name)
+                if parsed:
+                    self.display_structured_result(parsed)
+                    self.save_result(parsed.to_dict(), "구조화분석", 'JSON', law_name=law_name)
             else:
                 # 일반 저장
                 suffix = ""
@@ -475,44 +492,43 @@ class AdvancedLawAPIClient:
                     suffix += "_원문"
                 self.save_result(result, f"전체조문{suffix}", output_type, law_name=law_name)
     
-    def display_structured_result(self, parsed: Dict):
+    def display_structured_result(self, parsed: Law):
         """구조화된 결과 표시"""
         print("\n" + "=" * 60)
         print("📊 법령 구조 분석 결과")
         print("=" * 60)
         
         # 기본 정보
-        if parsed.get('기본정보'):
+        basic_info = parsed.to_dict()['기본정보']
+        if basic_info:
             print("\n[기본 정보]")
-            for key, value in parsed['기본정보'].items():
+            for key, value in basic_info.items():
                 print(f"  {key}: {value}")
         
-        # 조문 수
-        if parsed.get('조문'):
-            print(f"\n[조문] 총 {len(parsed['조문'])}개")
+        # 조문 수 (편/장/절 제목 행 제외)
+        articles = list(parsed.iter_articles())
+        if articles:
+            print(f"\n[조문] 총 {len(articles)}개")
             # 처음 3개만 미리보기
-            for article in parsed['조문'][:3]:
-                title = article.get('조문제목', '')
-                num = article.get('조문번호', '')
-                print(f"  제{num}조: {title}")
-            if len(parsed['조문']) > 3:
-                print(f"  ... 외 {len(parsed['조문']) - 3}개")
+            for article in articles[:3]:
+                print(f"  {article.label}: {article.title}")
+            if len(articles) > 3:
+                print(f"  ... 외 {len(articles) - 3}개")
         
         # 부칙
-        if parsed.get('부칙'):
-            print(f"\n[부칙] 총 {len(parsed['부칙'])}개")
+        if parsed.addenda:
+            print(f"\n[부칙] 총 {len(parsed.addenda)}개")
         
         # 별표
-        if parsed.get('별표'):
-            print(f"\n[별표] 총 {len(parsed['별표'])}개")
-            for table in parsed['별표'][:3]:
-                title = table.get('별표제목', '')
-                print(f"  - {title}")
+        if parsed.tables:
+            print(f"\n[별표] 총 {len(parsed.tables)}개")
+            for table in parsed.tables[:3]:
+                print(f"  - {table.title}")
         
         # 개정문/제개정이유
-        if parsed.get('개정문'):
+        if parsed.revision_text:
             print("\n[개정문] 있음")
-        if parsed.get('제개정이유'):
+        if parsed.reason_text:
             print("[제개정이유] 있음")
     
     def sanitize_data(self, data: Any) -> Any:
@@ -521,26 +537,7 @@ class AdvancedLawAPIClient:
         - OC 파라미터 제거
         - 이메일 ID 마스킹
         """
-        if isinstance(data, dict):
-            cleaned = {}
-            for key, value in data.items():
-                # OC 관련 필드 제거
-                if key.upper() == 'OC' or key == 'email_id':
-                    continue
-                # 값에서도 재귀적으로 제거
-                cleaned[key] = self.sanitize_data(value)
-            return cleaned
-        elif isinstance(data, list):
-            return [self.sanitize_data(item) for item in data]
-        elif isinstance(data, str):
-            # 문자열 내 이메일 ID 마스킹
-            if self.email_id and self.email_id in data:
-                return data.replace(self.email_id, "***MASKED***")
-            # 이메일 패턴 마스킹
-            import re
-            return re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '***@***.***', data)
-        else:
-            return data
+        return sanitize_data(data, self.email_id)
     
     def save_result(self, data: Any, filename_base: str, output_type: str, law_name: str = None):
         """
@@ -1,13 +1,16 @@
 #!/usr/bin/env python3
 """
 법제처 Open API 대화형 검색 도구
-Version 1.0.0 (2025-01-11)
+Version 1.1.0 (2026-10-17)
 - 사용자 입력을 받아 법령 검색
 - 검색 결과 목록 표시 및 선택
 - 다양한 형식으로 다운로드
+- 공용 HTTP 세션 사용 (연결 풀, keep-alive, gzip)
+- 상세 조회 응답 캐시 (변경 없는 법령은 재다운로드 생략)
+- 토큰 버킷 속도 제한 + 429/5xx/시간 초과 재시도 (지수 백오프 + 지터)
+- API 주소 설정 (API_law.yaml의 base_url, 로컬 재생 서버 사용 가능)
 """
 
-import requests
 import xml.etree.ElementTree as ET
 import json
 import yaml
@@ -15,6 +18,11 @@ import os
 from typing import Dict, Optional
 from datetime import datetime
 
+from law_api_cache import LawDetailCache, make_cache_key, DEFAULT_CACHE_DIR
+from law_api_ratelimit import create_rate_limiter, create_retry_policy
+from law_api_sanitize import sanitize_data
+from law_api_session import get_session, request_with_retry, DEFAULT_BASE_URL, DEFAULT_TIMEOUT
+
 class InteractiveLawSearch:
     def __init__(self):
         """YAML 파일에서 설정 로드"""
@@ -30,9 +38,20 @@ class InteractiveLawSearch:
         if '@' in self.email_id:
             self.email_id = self.email_id.split('@')[0]
         
-        self.base_url = "http://www.law.go.kr/DRF"
+        # API 주소 (API_law.yaml의 base_url로 로컬 재생 서버 등 지정 가능)
+        self.base_url = self.config.get('base_url', DEFAULT_BASE_URL)
         # 실행 시간 기준 폴더명 생성
         self.session_folder = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # 공용 HTTP 세션 (연결 풀 + keep-alive, 모든 클라이언트 공유)
+        self.session = get_session(self.config.get('http_pool_size'))
+        # 호출 속도 제한 + 재시도 (API_law.yaml의 requests_per_second, endpoint_rates, max_retries)
+        self.rate_limiter = create_rate_limiter(self.config)
+        self.retry_policy = create_retry_policy(self.config)
+        self.timeout = self.config.get('request_timeout', DEFAULT_TIMEOUT)
+        # 상세 조회 응답 캐시 (API_law.yaml의 detail_cache: false로 끌 수 있음)
+        self.detail_cache = None
+        if self.config.get('detail_cache', True):
+            self.detail_cache = LawDetailCache(self.config.get('cache_dir', DEFAULT_CACHE_DIR))
         print(f"✅ API 클라이언트 초기화 완료")
     
     def load_config(self) -> Dict:
@@ -75,7 +94,8 @@ class InteractiveLawSearch:
         print(f"\n🔍 '{query}' 검색 중...")
         
         try:
-            response = requests.get(url, params=params)
+            response = request_with_retry(self.session, url, params, self.rate_limiter,
+                                          self.retry_policy, self.timeout)
             if response.status_code == 200:
                 return self.parse_search_xml(response.content)
             else:
@@ -170,8 +190,8 @@ class InteractiveLawSearch:
             return f"{date_str[:4]}.{date_str[4:6]}.{date_str[6:]}"
         return date_str
     
-    def get_law_detail(self, law_id: str, output_type: str = "HTML") -> Optional[str]:
-        """법령 상세 조회"""
+    def get_law_detail(self, law_id: str, output_type: str = "HTML", law_info: Dict = None) -> Optional[str]:
+        """법령 상세 조회 (캐시 우선, law_info의 시행일자/공포일자로 만료 판단)"""
         url = f"{self.base_url}/lawService.do"
         params = {
             'OC': self.email_id,
@@ -180,11 +200,21 @@ class InteractiveLawSearch:
             'MST': law_id
         }
         
+        cache_key = make_cache_key('law', mst=law_id, output_type=output_type)
+        if self.detail_cache:
+            cached = self.detail_cache.get(cache_key, law_info)
+            if cached is not None:
+                print(f"📦 캐시 사용 (ID: {law_id}, Type: {output_type})")
+                return cached.decode('utf-8')
+        
         print(f"📖 법령 상세 조회 중 (Type: {output_type})...")
         
         try:
-            response = requests.get(url, params=params)
+            response = request_with_retry(self.session, url, params, self.rate_limiter,
+                                          self.retry_policy, self.timeout)
             if response.status_code == 200:
+                if self.detail_cache:
+                    self.detail_cache.put(cache_key, response.content, law_info)
                 return response.text
             else:
                 print(f"❌ 조회 실패: HTTP {response.status_code}")
@@ -199,26 +229,7 @@ class InteractiveLawSearch:
         - OC 파라미터 제거
         - 이메일 ID 마스킹
         """
-        if isinstance(data, dict):
-            cleaned = {}
-            for key, value in data.items():
-                # OC 관련 필드 제거
-                if key.upper() == 'OC' or key == 'email_id':
-                    continue
-                # 값에서도 재귀적으로 제거
-                cleaned[key] = self.sanitize_data(value)
-            return cleaned
-        elif isinstance(data, list):
-            return [self.sanitize_data(item) for item in data]
-        elif isinstance(data, str):
-            # 문자열 내 이메일 ID 마스킹
-            if self.email_id and self.email_id in data:
-                return data.replace(self.email_id, "***MASKED***")
-            # 이메일 패턴 마스킹
-            import re
-            return re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '***@***.***', data)
-        else:
-            return data
+        return sanitize_data(data, self.email_id)
     
     def download_law(self, law_info: Dict):
         """선택한 법령 다운로드"""
@@ -257,7 +268,7 @@ class InteractiveLawSearch:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
         for fmt in formats:
-            detail = self.get_law_detail(law_id, fmt)
+            detail = self.get_law_detail(law_id, fmt, law_info=law_info)
             if detail:
                 # 민감정보 제거
                 clean_detail = self.sanitize_data(detail)
@@ -1,18 +1,53 @@
 #!/usr/bin/env python3
 """
 법제처 Open API 클라이언트 - JSON 버전
-Version 1.0.0 (2025-01-12)
+Version 1.2.0 (2026-10-17)
 - JSON 형식을 기본으로 사용
 - XML과 동일한 데이터를 더 쉽게 파싱
+- 대량 다운로드 모드 (동시 실행 + 전역 호출 속도 제한)
+- 공용 HTTP 세션 사용 (연결 풀, keep-alive, gzip)
+- 상세 조회 응답 캐시 (변경 없는 법령은 재다운로드 생략)
+- 증분 동기화 모드 (--sync, 법령일련번호가 바뀐 법령만 상세 조회)
+- 구조화 결과를 공용 법령 모델(law_model.Law)로 생성
+- 코퍼스 내보내기 (--corpus, 캐시된 전체 법령 → 컬럼형 파일 하나)
+- 토큰 버킷 속도 제한 + 429/5xx/시간 초과 재시도 (지수 백오프 + 지터)
+- 전체 목록 조회 (--search, totalCnt 기준 모든 페이지 동시 조회)
+- 대량 다운로드 작업 저널 (중단된 실행은 완료된 작업을 건너뛰고 이어받기, --fresh로 새로 시작)
+- API 주소 설정 (API_law.yaml의 base_url, 로컬 재생 서버 사용 가능)
+- 상세 조회는 JSON 한 번만, XML/Markdown은 모델에서 생성 (--formats, 형식별 중복 요청 제거)
+- 법령 가족 다운로드 (--family, 법률 + 시행령/시행규칙 + 위임법령을 동시에)
+- JSON 응답은 바이트 그대로 파싱 (law_json_decode, orjson이 있으면 사용)
+- 검색 결과/법령 상세 구조화는 스키마에서 컴파일한 디코더 사용 (law_schema)
+- 편/장/절/관 계층 인덱스 저장 (_계층_*.json) 및 구조 출력에 장/절 목차 표시 (law_hierarchy)
+- 전체 목록 조회에서 재조회 후에도 누락된 페이지는 오류로 알림 (일부만 받은 목록을 완료로 보지 않음)
+- Markdown(--formats MD)은 조문 조각 단위로 파일에 바로 기록 (법령 전체 문자열을 만들지 않음)
+- 상세 응답은 검증 후 캐시 저장 (HTTP 200 오류 페이지 제외), 손상된 캐시 항목은 삭제 후 재조회
 """
 
-import requests
 import json
 import yaml
 import os
-from typing import Dict, Optional, List, Any
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from typing import Dict, Optional, List, Any, Iterator, Tuple
 from datetime import datetime
 
+from law_api_cache import LawDetailCache, decode_detail, make_cache_key, DEFAULT_CACHE_DIR
+from law_api_family import family_from_search, fetch_delegated, delegated_laws
+from law_api_journal import CrawlJournal, DEFAULT_JOURNAL_FILE
+from law_api_ratelimit import create_rate_limiter, create_retry_policy
+from law_api_sanitize import sanitize_data
+from law_api_search import IncompleteSearchError, iter_search
+from law_api_session import get_session, request_with_retry, DEFAULT_BASE_URL, DEFAULT_TIMEOUT
+from law_api_sync import LawSyncManifest, pick_search_hit, DEFAULT_MANIFEST_FILE
+from law_corpus_store import export_corpus
+from law_hierarchy import LawHierarchy, print_outline
+from law_json_decode import loads
+from law_markdown import iter_law_markdown, write_markdown
+from law_model import Law
+from law_render import render_law, RENDER_FORMATS
+from law_schema import decode_law, decode_search
+
 class LawAPIClientJSON:
     def __init__(self):
         """YAML 파일에서 설정 로드"""
@@ -28,9 +63,20 @@ class LawAPIClientJSON:
         if '@' in self.email_id:
             self.email_id = self.email_id.split('@')[0]
         
-        self.base_url = "http://www.law.go.kr/DRF"
+        # API 주소 (API_law.yaml의 base_url로 로컬 재생 서버 등 지정 가능)
+        self.base_url = self.config.get('base_url', DEFAULT_BASE_URL)
         # 실행 시간 기준 폴더명 생성
         self.session_folder = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # 공용 HTTP 세션 (연결 풀 + keep-alive, 모든 클라이언트 공유)
+        self.session = get_session(self.config.get('http_pool_size'))
+        # 상세 조회 응답 캐시 (API_law.yaml의 detail_cache: false로 끌 수 있음)
+        self.detail_cache = None
+        if self.config.get('detail_cache', True):
+            self.detail_cache = LawDetailCache(self.config.get('cache_dir', DEFAULT_CACHE_DIR))
+        # 모든 요청이 공유하는 호출 속도 제한 + 재시도 (requests_per_second, endpoint_rates, max_retries)
+        self.rate_limiter = create_rate_limiter(self.config)
+        self.retry_policy = create_retry_policy(self.config)
+        self.timeout = self.config.get('request_timeout', DEFAULT_TIMEOUT)
         print(f"✅ API 클라이언트 초기화 완료 (JSON 모드)")
     
     def load_config(self) -> Dict:
@@ -83,10 +129,11 @@ class LawAPIClientJSON:
         print(f"\n🔍 '{query}' 검색 중... (형식: {'JSON' if use_json else 'XML'})")
         
         try:
-            response = requests.get(url, params=params)
+            response = request_with_retry(self.session, url, params, self.rate_limiter,
+                                          self.retry_policy, self.timeout)
             if response.status_code == 200:
                 if use_json:
-                    return self.parse_search_json(response.text)
+                    return self.parse_search_json(response.content)
                 else:
                     return self.parse_search_xml(response.content)
             else:
@@ -96,37 +143,60 @@ class LawAPIClientJSON:
             print(f"❌ 요청 오류: {e}")
             return None
     
-    def parse_search_json(self, json_content: str) -> Dict:
-        """검색 결과 JSON 파싱"""
+    def iter_search_laws(self, query: str, target: str = 'law', max_pages: int = None,
+                         max_workers: int = 4, **params) -> Iterator[Dict]:
+        """
+        목록 전체 페이지 순회 (첫 페이지 이후는 동시 조회, 항목을 하나씩 yield)
+        
+        Args:
+            query: 검색어 ('세', '조세'처럼 넓은 검색어도 가능)
+            target: 검색 대상 (law, prec, expc, admr ...)
+            max_pages: 최대 페이지 수 (페이지당 100건, 없으면 전체)
+            max_workers: 동시에 조회할 페이지 수
+        """
+        print(f"\n🔍 '{query}' 전체 목록 조회 중... (대상: {target})")
+        return iter_search(self, query, target=target, max_workers=max_workers,
+                           max_pages=max_pages, **params)
+    
+    def save_search_listing(self, query: str, target: str = 'law', max_pages: int = None,
+                            max_workers: int = 4) -> int:
+        """
+        전체 목록을 JSON Lines 파일로 저장 (한 줄에 한 항목, 받는 대로 기록)
+        
+        Returns:
+            저장한 항목 수
+        
+        Raises:
+            IncompleteSearchError: 재조회 후에도 받지 못한 페이지가 있음 (받은 항목까지는 파일에 저장됨)
+        """
+        save_dir = f'_cache/{self.session_folder}'
+        os.makedirs(save_dir, exist_ok=True)
+        filepath = f'{save_dir}/{query}_{target}_전체목록.jsonl'
+        
+        count = 0
         try:
-            data = json.loads(json_content)
-            search_result = data.get('LawSearch', {})
-            
+            with open(filepath, 'w', encoding='utf-8') as f:
+                for item in self.iter_search_laws(query, target, max_pages, max_workers):
+                    f.write(json.dumps(self.sanitize_data(item), ensure_ascii=False) + '\n')
+                    count += 1
+        except IncompleteSearchError as e:
+            # 받은 항목은 저장하되 전체 목록이 아님을 알림
+            print(f"⚠️ {filepath} 일부만 저장 ({count}건, 누락 페이지 {e.failed_pages})")
+            raise
+        
+        print(f"💾 {filepath} 저장 완료 ({count}건)")
+        return count
+    
+    def parse_search_json(self, json_content: bytes) -> Dict:
+        """검색 결과 JSON 파싱 (응답 바이트 그대로)"""
+        try:
+            # 목록 항목 필드/단일 결과(dict) 정규화는 law_schema의 LAW_ITEM 스키마
+            search = decode_search(loads(json_content), 'law')
             result = {
-                'total_count': int(search_result.get('totalCnt', 0)),
-                'laws': []
+                'total_count': search['total_count'],
+                'laws': search['items']
             }
             
-            # 법령 목록 파싱
-            laws = search_result.get('law', [])
-            if isinstance(laws, dict):  # 단일 결과인 경우
-                laws = [laws]
-            
-            for law in laws:
-                law_info = {
-                    '법령일련번호': law.get('법령일련번호', ''),
-                    '법령명한글': law.get('법령명한글', ''),
-                    '법령약칭명': law.get('법령약칭명', ''),
-                    '법령ID': law.get('법령ID', ''),
-                    '공포일자': law.get('공포일자', ''),
-                    '공포번호': law.get('공포번호', ''),
-                    '제개정구분명': law.get('제개정구분명', ''),
-                    '시행일자': law.get('시행일자', ''),
-                    '소관부처명': law.get('소관부처명', ''),
-                    '법령상세링크': law.get('법령상세링크', '')
-                }
-                result['laws'].append(law_info)
-            
             print(f"✅ 총 {result['total_count']}건 검색됨")
             return result
             
@@ -173,13 +243,14 @@ class LawAPIClientJSON:
             print(f"❌ XML 파싱 오류: {e}")
             return result
     
-    def get_law_detail(self, law_id: str, output_type: str = "JSON") -> Optional[Any]:
+    def get_law_detail(self, law_id: str, output_type: str = "JSON", law_info: Dict = None) -> Optional[Any]:
         """
-        법령 상세 조회
+        법령 상세 조회 (캐시 우선)
         
         Args:
             law_id: 법령 일련번호
             output_type: 출력 형식 (JSON, XML, HTML)
+            law_info: 검색 결과 항목 (시행일자/공포일자로 캐시 만료 판단)
         """
         url = f"{self.base_url}/lawService.do"
         params = {
@@ -189,123 +260,54 @@ class LawAPIClientJSON:
             'MST': law_id
         }
         
+        cache_key = make_cache_key('law', mst=law_id, output_type=output_type)
+        if self.detail_cache:
+            cached = self.detail_cache.get(cache_key, law_info)
+            if cached is not None:
+                try:
+                    result = decode_detail(cached, output_type)
+                    print(f"📦 캐시 사용 (ID: {law_id}, Type: {output_type})")
+                    return result
+                except ValueError as e:
+                    # 손상된 항목은 지우고 다시 조회 (같은 키가 계속 실패하지 않게)
+                    print(f"⚠️ 캐시 항목 손상, 다시 조회: {e}")
+                    self.detail_cache.remove(cache_key)
+        
         print(f"📖 법령 상세 조회 중 (ID: {law_id}, Type: {output_type})...")
         
         try:
-            response = requests.get(url, params=params)
+            response = request_with_retry(self.session, url, params, self.rate_limiter,
+                                          self.retry_policy, self.timeout)
             if response.status_code == 200:
-                if output_type == 'JSON':
-                    return json.loads(response.text)
-                else:
-                    return response.text
+                # 검증을 통과한 응답만 캐시에 저장 (HTTP 200 오류 페이지 제외)
+                result = decode_detail(response.content, output_type)
+                if self.detail_cache:
+                    self.detail_cache.put(cache_key, response.content, law_info)
+                return result
             else:
                 print(f"❌ 조회 실패: HTTP {response.status_code}")
                 return None
+        except ValueError as e:
+            print(f"❌ 응답 형식 오류: {e}")
+            return None
         except Exception as e:
             print(f"❌ 요청 오류: {e}")
             return None
     
-    def parse_law_detail_json(self, json_data: Dict) -> Dict:
+    def parse_law_detail_json(self, json_data: Dict) -> Law:
         """
         JSON 법령 상세 파싱하여 구조화
         
         Returns:
-            구조화된 법령 데이터
+            Law 모델 (law_model 참고, 저장 시 to_dict()로 한글 키 JSON 변환)
         """
-        if '법령' not in json_data:
-            return {}
-        
-        법령 = json_data['법령']
-        
-        # 구조화된 데이터 생성
-        structured = {
-            '법령키': 법령.get('법령키', ''),
-            '기본정보': 법령.get('기본정보', {}),
-            '조문': [],
-            '부칙': [],
-            '개정문': 법령.get('개정문', {}),
-            '제개정이유': 법령.get('제개정이유', {})
-        }
-        
-        # 조문 파싱
-        조문단위들 = 법령.get('조문', {}).get('조문단위', [])
-        for 조문 in 조문단위들:
-            조문정보 = {
-                '조문키': 조문.get('조문키', ''),
-                '조문번호': 조문.get('조문번호', ''),
-                '조문제목': 조문.get('조문제목', ''),
-                '조문내용': 조문.get('조문내용', ''),
-                '조문여부': 조문.get('조문여부', ''),
-                '시행일자': 조문.get('조문시행일자', ''),
-                '항': []
-            }
-            
-            # 항 정보가 있으면 파싱
-            if '항' in 조문:
-                항단위들 = 조문['항'].get('항단위', [])
-                if isinstance(항단위들, dict):
-                    항단위들 = [항단위들]
-                
-                for 항 in 항단위들:
-                    항정보 = {
-                        '항번호': 항.get('항번호', ''),
-                        '항내용': 항.get('항내용', ''),
-                        '호': []
-                    }
-                    
-                    # 호 정보가 있으면 파싱
-                    if '호' in 항:
-                        호단위들 = 항['호'].get('호단위', [])
-                        if isinstance(호단위들, dict):
-                            호단위들 = [호단위들]
-                        
-                        for 호 in 호단위들:
-                            호정보 = {
-                                '호번호': 호.get('호번호', ''),
-                                '호내용': 호.get('호내용', '')
-                            }
-                            항정보['호'].append(호정보)
-                    
-                    조문정보['항'].append(항정보)
-            
-            structured['조문'].append(조문정보)
-        
-        # 부칙 파싱
-        부칙단위들 = 법령.get('부칙', {}).get('부칙단위', [])
-        if isinstance(부칙단위들, dict):
-            부칙단위들 = [부칙단위들]
-        
-        for 부칙 in 부칙단위들:
-            부칙정보 = {
-                '부칙키': 부칙.get('부칙키', ''),
-                '부칙공포일자': 부칙.get('부칙공포일자', ''),
-                '부칙공포번호': 부칙.get('부칙공포번호', ''),
-                '부칙내용': 부칙.get('부칙내용', [])
-            }
-            structured['부칙'].append(부칙정보)
-        
-        return structured
+        return decode_law(json_data)
     
     def sanitize_data(self, data: Any) -> Any:
         """
         민감정보 제거 (재귀적)
         """
-        if isinstance(data, dict):
-            cleaned = {}
-            for key, value in data.items():
-                if key.upper() == 'OC' or key == 'email_id':
-                    continue
-                cleaned[key] = self.sanitize_data(value)
-            return cleaned
-        elif isinstance(data, list):
-            return [self.sanitize_data(item) for item in data]
-        elif isinstance(data, str):
-            if self.email_id and self.email_id in data:
-                return data.replace(self.email_id, "***MASKED***")
-            import re
-            return re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '***@***.***', data)
-        else:
-            return data
+        return sanitize_data(data, self.email_id)
     
     def save_results(self, data: Any, filename: str):
         """
@@ -330,46 +332,62 @@ class LawAPIClientJSON:
                     f.write(str(clean_data))
         
         print(f"💾 {filepath} 저장 완료")
+        return filepath
     
-    def display_law_structure(self, structured_data: Dict):
-        """법령 구조를 보기 좋게 출력"""
-        기본정보 = structured_data.get('기본정보', {})
+    def save_markdown(self, law: Law, filename: str) -> str:
+        """
+        Markdown 스트리밍 저장 (조문 조각마다 민감정보 제거 후 바로 기록, 법령 전체 문자열 없음)
+        """
+        save_dir = f'_cache/{self.session_folder}'
+        os.makedirs(save_dir, exist_ok=True)
+        filepath = f'{save_dir}/{filename}'
+        
+        chunks = (self.sanitize_data(chunk) for chunk in iter_law_markdown(law))
+        written = write_markdown(filepath, chunks)
         
+        print(f"💾 {filepath} 저장 완료 ({written:,} bytes)")
+        return filepath
+    
+    def display_law_structure(self, law: Law, hierarchy: Optional[LawHierarchy] = None):
+        """법령 구조를 보기 좋게 출력 (장/절 목차 + 조문 범위)"""
+        hierarchy = hierarchy or LawHierarchy.from_law(law)
         print("\n" + "="*60)
-        print(f"📋 {기본정보.get('법령명_한글', 'Unknown')}")
+        print(f"📋 {law.name or 'Unknown'}")
         print("="*60)
-        print(f"공포일자: {기본정보.get('공포일자', '')}")
-        print(f"시행일자: {기본정보.get('시행일자', '')}")
-        print(f"소관부처: {기본정보.get('소관부처', {}).get('content', '')}")
-        print(f"제개정구분: {기본정보.get('제개정구분', '')}")
-        
-        조문들 = structured_data.get('조문', [])
-        print(f"\n총 {len(조문들)}개 조문")
-        
-        # 처음 5개 조문만 표시
-        for i, 조문 in enumerate(조문들[:5], 1):
-            if 조문.get('조문여부') == '전문':
-                print(f"\n[전문] {조문.get('조문내용', '')[:50]}...")
-            else:
-                제목 = 조문.get('조문제목', '')
-                번호 = 조문.get('조문번호', '')
-                print(f"\n제{번호}조({제목})")
-                
-                # 항이 있으면 개수 표시
-                항들 = 조문.get('항', [])
-                if 항들:
-                    print(f"  └─ {len(항들)}개 항")
+        print(f"공포일자: {law.promulgation_date}")
+        print(f"시행일자: {law.effective_date}")
+        print(f"소관부처: {law.ministry}")
+        print(f"제개정구분: {law.revision_kind}")
+        
+        print(f"\n총 {len(hierarchy.labels)}개 조문, 편/장/절/관 {len(hierarchy)}개")
+        
+        # 상위 두 단계 목차만 표시
+        if len(hierarchy):
+            print()
+            print_outline(hierarchy, max_depth=2)
+        
+        # 처음 5개 조문
+        for 조문 in [article for article in law.articles if not article.is_heading][:5]:
+            print(f"\n{조문.label}({조문.title})")
+            
+            # 항이 있으면 개수 표시
+            if 조문.paragraphs:
+                print(f"  └─ {len(조문.paragraphs)}개 항")
         
-        if len(조문들) > 5:
-            print(f"\n... 외 {len(조문들) - 5}개 조문")
+        if len(hierarchy.labels) > 5:
+            print(f"\n... 외 {len(hierarchy.labels) - 5}개 조문")
     
-    def download_law(self, law_name: str, formats: List[str] = None):
+    def download_law(self, law_name: str, formats: List[str] = None, journal: CrawlJournal = None):
         """
         법령 검색 및 다운로드 (JSON 우선)
         
         Args:
             law_name: 법령명
-            formats: 다운로드할 형식 리스트 ['JSON', 'XML', 'HTML']
+            formats: 저장할 형식 리스트 ['JSON', 'XML', 'MD', 'STRUCTURED', 'HTML']
+            journal: 작업 저널 (완료된 형식은 건너뜀)
+        
+        Returns:
+            검색 결과 (상세 저장에 실패하면 None)
         """
         if not formats:
             formats = ['JSON', 'XML']  # JSON을 기본으로!
@@ -389,41 +407,367 @@ class LawAPIClientJSON:
         print(f"  - 소관부처: {first_law.get('소관부처명', '')}")
         
         # 3. 각 형식으로 상세 정보 조회 및 저장
-        law_id = first_law.get('법령일련번호')
-        if law_id:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        success = self.save_law_detail(law_name, first_law, formats, timestamp, journal)
+        
+        # 4. 검색 결과 저장
+        self.save_results(search_result, f"{law_name}_검색결과_{timestamp}.json")
+        
+        return search_result if success else None
+    
+    def save_law_detail(self, law_name: str, law_info: Dict, formats: List[str] = None,
+                        timestamp: str = None, journal: CrawlJournal = None) -> bool:
+        """
+        검색 결과 항목의 상세 정보를 각 형식으로 조회 및 저장
+        
+        Args:
+            law_name: 법령명 (파일명에 사용)
+            law_info: 검색 결과 항목 (법령일련번호 필수)
+            formats: 저장할 형식 리스트 ['JSON', 'XML', 'MD', 'STRUCTURED', 'HTML']
+                     (HTML 외에는 JSON 한 번 조회 후 모델에서 생성)
+            timestamp: 파일명 타임스탬프 (없으면 현재 시각)
+            journal: 작업 저널 (형식마다 시작/완료/실패 기록, 완료된 형식은 건너뜀)
+        
+        Returns:
+            모든 형식 저장 성공 여부
+        """
+        if not formats:
+            formats = ['JSON', 'XML']
+        
+        law_id = law_info.get('법령일련번호')
+        if not law_id:
+            print(f"❌ '{law_name}'의 법령일련번호가 없습니다")
+            return False
+        
+        timestamp = timestamp or datetime.now().strftime('%Y%m%d_%H%M%S')
+        success = True
+        # JSON은 한 번만 받고 XML/MD는 모델에서 생성 (HTML만 따로 조회)
+        detail = None
+        structured = None
+        structured_requested = any(fmt.upper() == 'STRUCTURED' for fmt in formats)
+        
+        for fmt in formats:
+            fmt = fmt.upper()
+            if journal and journal.is_done(law_name, fmt, law_id):
+                print(f"⏭️ 이미 완료: {law_name} {fmt} (MST {law_id})")
+                continue
+            if journal:
+                journal.start(law_name, fmt, law_id)
             
-            for fmt in formats:
-                detail = self.get_law_detail(law_id, fmt)
+            if fmt in RENDER_FORMATS and detail is None:
+                detail = self.get_law_detail(law_id, 'JSON', law_info=law_info)
                 if detail:
-                    ext = fmt.lower()
-                    filename = f"{law_name}_전체조문_{timestamp}.{ext}"
+                    structured = self.parse_law_detail_json(detail)
+            
+            if fmt == 'JSON':
+                content = detail
+            elif fmt == 'MD':
+                # Markdown은 문자열을 만들지 않고 조문 조각 단위로 파일에 씀 (save_markdown)
+                content = structured
+            elif fmt in RENDER_FORMATS:
+                content = render_law(structured, fmt) if structured else None
+            else:
+                content = self.get_law_detail(law_id, fmt, law_info=law_info)
+            
+            if not content:
+                success = False
+                if journal:
+                    journal.fail(law_name, fmt, law_id, "상세 조회 실패")
+                continue
+            
+            ext = RENDER_FORMATS.get(fmt, fmt.lower())
+            label = '구조화' if fmt == 'STRUCTURED' else '전체조문'
+            filename = f"{law_name}_{label}_{timestamp}.{ext}"
+            if fmt == 'MD':
+                filepath = self.save_markdown(structured, filename)
+            else:
+                filepath = self.save_results(content, filename)
+            
+            # JSON인 경우 구조화된 데이터도 저장 (STRUCTURED를 함께 요청했으면 그 단계에서 한 번만 저장)
+            if fmt == 'JSON' and structured is not None:
+                if not structured_requested:
+                    self.save_results(structured.to_dict(), f"{law_name}_구조화_{timestamp}.json")
+                
+                # 편/장/절/관 계층 인덱스도 법령 옆에 저장 (law_hierarchy.py로 바로 조회)
+                hierarchy = LawHierarchy.from_law(structured)
+                self.save_results(hierarchy.to_dict(), f"{law_name}_계층_{timestamp}.json")
+                
+                # 구조 표시
+                self.display_law_structure(structured, hierarchy)
+            
+            # 파일 저장까지 끝나야 완료로 기록 (도중에 죽으면 다음 실행에서 다시 받음)
+            if journal:
+                journal.complete(law_name, fmt, law_id, filepath)
+        
+        return success
+    
+    def download_laws_bulk(self, law_names: List[str], formats: List[str] = None,
+                           max_workers: int = 4, journal: CrawlJournal = None) -> Dict[str, List[str]]:
+        """
+        여러 법령 동시 다운로드 (작업 저널로 중단된 실행 이어받기)
+        
+        Args:
+            law_names: 법령명 리스트 (법률/시행령/시행규칙 등)
+            formats: 다운로드할 형식 리스트
+            max_workers: 동시 작업 수 (호출 속도는 rate_limiter가 전역 제한)
+            journal: 작업 저널 (없으면 API_law.yaml의 crawl_journal 경로)
+        
+        Returns:
+            {'성공': [...], '실패': [...], '건너뜀': [...]}
+        """
+        if not formats:
+            formats = ['JSON', 'XML']
+        if journal is None:
+            journal = CrawlJournal(self.config.get('crawl_journal', DEFAULT_JOURNAL_FILE))
+        summary = {'성공': [], '실패': [], '건너뜀': []}
+        
+        # 중복 제거 (순서 유지)
+        law_names = list(dict.fromkeys(law_names))
+        
+        # 이전 실행에서 모든 형식을 받은 법령은 검색도 생략
+        if journal.resumed:
+            print(f"♻️ 중단된 이전 실행 이어받기 (완료 {len(journal.done)}건, "
+                  f"진행 중이던 작업 {len(journal.in_flight)}건은 다시 받음)")
+            for law_name in law_names:
+                if journal.completed_mst(law_name, formats):
+                    summary['건너뜀'].append(law_name)
+            law_names = [name for name in law_names if name not in summary['건너뜀']]
+        
+        print(f"\n📦 {len(law_names)}개 법령 대량 다운로드 시작 "
+              f"(작업 {max_workers}개, 초당 {self.rate_limiter.rate}회, 건너뜀 {len(summary['건너뜀'])}개)")
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.download_law, law_name, formats, journal): law_name
+                for law_name in law_names
+            }
+            for future in as_completed(futures):
+                law_name = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"❌ {law_name} 처리 오류: {e}")
+                    result = None
+                
+                summary['성공' if result else '실패'].append(law_name)
+                done = len(summary['성공']) + len(summary['실패'])
+                status = "✅ 처리 완료" if result else "❌ 처리 실패"
+                print(f"{status}: {law_name} ({done}/{len(law_names)})")
+        
+        # 실패 목록도 저장 (재실행용)
+        self.save_results(summary, f"대량다운로드_결과_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        
+        # 실패가 없을 때만 완료 기록 (실패가 있으면 다음 실행에서 실패한 작업만 다시 받음)
+        if not summary['실패']:
+            journal.finish()
+        journal.close()
+        return summary
+
+    def download_law_family(self, law_name: str, formats: List[str] = None, max_workers: int = 4,
+                            journal: CrawlJournal = None, use_delegated: bool = True) -> Dict[str, List[str]]:
+        """
+        법률과 시행령/시행규칙을 한 번에 동시 다운로드
+        
+        법률 검색 한 번으로 이름이 맞는 시행령/시행규칙을 찾아 바로 상세 조회를 시작하고,
+        위임법령(lsDelegated) 조회도 함께 보내 이름이 다른 하위법령까지 추가로 받음
+        
+        Args:
+            law_name: 법률명 (예: 법인세법)
+            formats: 다운로드할 형식 리스트
+            max_workers: 동시 작업 수 (호출 속도는 rate_limiter가 전역 제한)
+            journal: 작업 저널 (완료된 형식은 건너뜀)
+            use_delegated: 위임법령 조회로 하위법령 찾기
+        
+        Returns:
+            {'성공': [...], '실패': [...]} (법령명)
+        """
+        if not formats:
+            formats = ['JSON', 'XML']
+        summary = {'성공': [], '실패': []}
+        
+        # 시행령/시행규칙이 같은 검색 결과에 나오도록 넉넉하게 조회
+        search_result = self.search_law(law_name, display=100)
+        parent = pick_search_hit(search_result, law_name)
+        if not parent:
+            print(f"❌ '{law_name}'을 찾을 수 없습니다")
+            summary['실패'].append(law_name)
+            return summary
+        
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        scheduled = set()
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {}
+            
+            def schedule(item: Dict):
+                mst = item.get('법령일련번호')
+                if not mst or mst in scheduled:
+                    return
+                scheduled.add(mst)
+                name = item.get('법령명한글') or mst
+                pending[executor.submit(self.save_law_detail, name, item, formats, timestamp, journal)] = name
+            
+            schedule(parent)
+            for item in family_from_search(parent.get('법령명한글', law_name), search_result['laws']):
+                schedule(item)
+            if use_delegated and parent.get('법령ID'):
+                pending[executor.submit(fetch_delegated, self, parent['법령ID'])] = None
+            
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        print(f"❌ {name or '위임법령 조회'} 처리 오류: {e}")
+                        result = None
                     
-                    # JSON인 경우 구조화된 데이터도 저장
-                    if fmt == 'JSON':
-                        self.save_results(detail, filename)
-                        
-                        # 구조화된 버전도 저장
-                        structured = self.parse_law_detail_json(detail)
-                        self.save_results(structured, f"{law_name}_구조화_{timestamp}.json")
-                        
-                        # 구조 표시
-                        self.display_law_structure(structured)
-                    else:
-                        self.save_results(detail, filename)
+                    if name is None:
+                        # 위임법령 조회 결과: 아직 받지 않은 하위법령 추가
+                        delegated = delegated_laws(result)
+                        new_members = [item for item in delegated if item['법령일련번호'] not in scheduled]
+                        print(f"🔗 위임법령 {len(delegated)}건 (추가 {len(new_members)}건)")
+                        for item in new_members:
+                            schedule(item)
+                        continue
+                    
+                    summary['성공' if result else '실패'].append(name)
         
-        # 4. 검색 결과 저장
-        self.save_results(search_result, f"{law_name}_검색결과_{timestamp}.json")
+        print(f"👪 {law_name} 가족 다운로드: 성공 {len(summary['성공'])}건, 실패 {len(summary['실패'])}건")
+        return summary
+    
+    def sync_laws(self, law_names: List[str], formats: List[str] = None,
+                  max_workers: int = 4, manifest: LawSyncManifest = None) -> Dict[str, List[str]]:
+        """
+        증분 동기화: 검색만 수행하고 법령일련번호(MST)가 바뀐 법령만 상세 조회
+        
+        Args:
+            law_names: 법령명 리스트
+            formats: 다운로드할 형식 리스트 (기본 JSON)
+            max_workers: 동시 작업 수
+            manifest: 동기화 매니페스트 (없으면 API_law.yaml의 sync_manifest 경로)
+        
+        Returns:
+            {'신규': [...], '변경': [...], '유지': [...], '실패': [...]} (요청한 법령명 기준,
+            여러 이름이 같은 법령으로 검색되면 상세 조회는 한 번만 하고 모든 이름을 같은 결과에 기록)
+        """
+        if not formats:
+            formats = ['JSON']
+        if manifest is None:
+            manifest = LawSyncManifest(self.config.get('sync_manifest', DEFAULT_MANIFEST_FILE))
+        
+        law_names = list(dict.fromkeys(law_names))
+        summary = {'신규': [], '변경': [], '유지': [], '실패': []}
+        print(f"\n🔄 {len(law_names)}개 법령 증분 동기화 시작 (매니페스트 {len(manifest.entries)}건)")
+        
+        # 1. 검색만 수행 (목록 API는 응답이 작음)
+        # 법령ID → ([요청한 법령명 ...], 검색 결과 항목)
+        hits: Dict[str, Tuple[List[str], Dict]] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.search_law, law_name, use_json=True): law_name
+                for law_name in law_names
+            }
+            for future in as_completed(futures):
+                law_name = futures[future]
+                try:
+                    hit = pick_search_hit(future.result(), law_name)
+                except Exception as e:
+                    print(f"❌ {law_name} 검색 오류: {e}")
+                    hit = None
+                
+                if hit and hit.get('법령ID') and hit.get('법령일련번호'):
+                    hits.setdefault(hit['법령ID'], ([], hit))[0].append(law_name)
+                else:
+                    summary['실패'].append(law_name)
+        
+        order = {law_name: i for i, law_name in enumerate(law_names)}
+        for names, hit in hits.values():
+            names.sort(key=order.get)
+            if len(names) > 1:
+                print(f"⚠️ 같은 법령으로 검색됨: {', '.join(names)} → "
+                      f"{hit.get('법령명한글', hit['법령ID'])} (상세 조회는 '{names[0]}'로 한 번만)")
+        
+        # 2. 매니페스트와 비교
+        changes = manifest.diff([hit for _, hit in hits.values()])
+        summary['유지'] = [law_name for hit in changes['유지'] for law_name in hits[hit['법령ID']][0]]
+        print(f"📊 신규 {len(changes['신규'])}건 / 변경 {len(changes['변경'])}건 / 유지 {len(changes['유지'])}건")
+        
+        # 3. 신규/변경 법령만 상세 조회
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for kind in ('신규', '변경'):
+                for hit in changes[kind]:
+                    names = hits[hit['법령ID']][0]
+                    future = executor.submit(self.save_law_detail, names[0], hit, formats, timestamp)
+                    futures[future] = (kind, names, hit)
+            
+            for future in as_completed(futures):
+                kind, names, hit = futures[future]
+                law_name = names[0]
+                try:
+                    ok = future.result()
+                except Exception as e:
+                    print(f"❌ {law_name} 처리 오류: {e}")
+                    ok = False
+                
+                if ok:
+                    manifest.update(hit)
+                    summary[kind].extend(names)
+                    print(f"✅ {kind}: {law_name} (MST {hit['법령일련번호']})")
+                else:
+                    summary['실패'].extend(names)
         
-        return search_result
+        self.save_results(summary, f"동기화_결과_{timestamp}.json")
+        return summary
+
+def load_law_names(laws_file: str) -> List[str]:
+    """법령 목록 파일 로드 (한 줄에 하나, # 주석 허용)"""
+    with open(laws_file, 'r', encoding='utf-8') as f:
+        return [
+            line.strip() for line in f
+            if line.strip() and not line.strip().startswith('#')
+        ]
 
 def main():
+    parser = argparse.ArgumentParser(description="법제처 Open API 클라이언트 (JSON 버전)")
+    parser.add_argument('laws', nargs='*', help="다운로드할 법령명")
+    parser.add_argument('--laws-file', help="법령 목록 파일 (한 줄에 하나)")
+    parser.add_argument('--workers', type=int, default=4, help="동시 작업 수 (기본 4)")
+    parser.add_argument('--rate', type=float, help="초당 최대 요청 수 (기본: API_law.yaml 또는 3)")
+    parser.add_argument('--sync', action='store_true', help="증분 동기화 (MST가 바뀐 법령만 다운로드)")
+    parser.add_argument('--family', action='store_true',
+                        help="법률마다 시행령/시행규칙(이름 패턴 + 위임법령)까지 동시에 다운로드")
+    parser.add_argument('--fresh', action='store_true',
+                        help="중단된 이전 대량 다운로드를 이어받지 않고 새로 시작")
+    parser.add_argument('--search', metavar='QUERY',
+                        help="검색어의 전체 목록만 저장 (모든 페이지, JSON Lines)")
+    parser.add_argument('--target', default='law', help="--search 검색 대상 (기본 law)")
+    parser.add_argument('--max-pages', type=int, help="--search 최대 페이지 수 (페이지당 100건)")
+    parser.add_argument('--formats', nargs='+', default=['JSON'], type=str.upper,
+                        help="저장 형식 (JSON XML MD STRUCTURED HTML, 기본 JSON; HTML 외에는 JSON 한 번만 조회)")
+    parser.add_argument('--corpus', metavar='PATH',
+                        help="완료 후 캐시된 법령 전체를 컬럼형 코퍼스로 저장 (예: _corpus/tax_laws.lawcol)")
+    args = parser.parse_args()
+    
     print("="*60)
     print("🚀 법제처 Open API 클라이언트 (JSON 버전)")
     print("="*60)
     
     # 클라이언트 초기화
     client = LawAPIClientJSON()
+    if args.rate is not None:
+        client.rate_limiter = create_rate_limiter(client.config, args.rate)
+    
+    # 전체 목록만 저장
+    if args.search:
+        try:
+            client.save_search_listing(args.search, args.target, args.max_pages, args.workers)
+        except IncompleteSearchError as e:
+            print(f"❌ {e}")
+        return
     
     # 법령 검색 및 다운로드
     laws_to_search = [
@@ -431,19 +775,47 @@ def main():
         # "소득세법",
         # "부가가치세법",
     ]
+    if args.laws_file:
+        laws_to_search = load_law_names(args.laws_file)
+    elif args.laws:
+        laws_to_search = args.laws
     
-    for law_name in laws_to_search:
-        result = client.download_law(law_name, formats=['JSON'])  # JSON만!
-        if result:
-            print(f"✅ {law_name} 처리 완료\n")
-        else:
-            print(f"❌ {law_name} 처리 실패\n")
+    if args.sync:
+        summary = client.sync_laws(laws_to_search, formats=args.formats, max_workers=args.workers)
+        
+        print("\n" + "="*60)
+        print(f"🆕 신규 {len(summary['신규'])}건 / 🔄 변경 {len(summary['변경'])}건 / "
+              f"⏸️ 유지 {len(summary['유지'])}건 / ❌ 실패 {len(summary['실패'])}건")
+    elif args.family:
+        journal = CrawlJournal(client.config.get('crawl_journal', DEFAULT_JOURNAL_FILE), fresh=args.fresh)
+        summary = {'성공': [], '실패': []}
+        for law_name in laws_to_search:
+            result = client.download_law_family(law_name, formats=args.formats, max_workers=args.workers,
+                                                journal=journal)
+            summary['성공'] += result['성공']
+            summary['실패'] += result['실패']
+        if not summary['실패']:
+            journal.finish()
+        journal.close()
         
-        # API 부하 방지
-        import time
-        time.sleep(1)
+        print("\n" + "="*60)
+        print(f"✅ 성공 {len(summary['성공'])}건 / ❌ 실패 {len(summary['실패'])}건")
+    else:
+        journal = CrawlJournal(client.config.get('crawl_journal', DEFAULT_JOURNAL_FILE), fresh=args.fresh)
+        summary = client.download_laws_bulk(laws_to_search, formats=args.formats, max_workers=args.workers,
+                                            journal=journal)
+        
+        print("\n" + "="*60)
+        print(f"✅ 성공 {len(summary['성공'])}건 / ⏭️ 건너뜀 {len(summary['건너뜀'])}건 / "
+              f"❌ 실패 {len(summary['실패'])}건")
+    for law_name in summary['실패']:
+        print(f"  - 실패: {law_name}")
     
-    print("\n" + "="*60)
+    if args.corpus:
+        if client.detail_cache:
+            export_corpus(args.corpus, client.detail_cache.cache_dir)
+        else:
+            print("⚠️ 코퍼스 내보내기는 상세 조회 캐시(detail_cache)가 필요합니다")
     print("📊 처리 완료!")
     print("_cache/ 폴더에서 결과를 확인하세요")
     print("JSON 파일로 저장되어 파싱이 더 쉽습니다!")
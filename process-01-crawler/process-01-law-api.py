@@ -1,13 +1,19 @@
 #!/usr/bin/env python3
 """
 법제처 Open API 클라이언트
-Version 3.0.0 (2025-01-11)
+Version 3.1.0 (2026-10-17)
 - API_law.yaml 설정 파일 사용
 - 법령 검색 및 상세 내용 다운로드
 - DART 크롤러와 동일한 패턴 적용
+- 공용 HTTP 세션 사용 (연결 풀, keep-alive, gzip)
+- 상세 조회 응답 캐시 (변경 없는 법령은 재다운로드 생략)
+- 고정 time.sleep(1) 대신 토큰 버킷 속도 제한 + 429/5xx/시간 초과 재시도
+- API 주소 설정 (API_law.yaml의 base_url, 로컬 재생 서버 사용 가능)
+- 상세 조회는 XML 한 번만, JSON/Markdown은 모델에서 생성 (형식별 중복 요청 제거)
+- Markdown은 조문 조각 단위로 파일에 바로 기록 (법령 전체 문자열을 만들지 않음)
+- 상세 응답은 검증 후 캐시 저장 (HTTP 200 오류 페이지 제외), 손상된 캐시 항목은 삭제 후 재조회
 """
 
-import requests
 import xml.etree.ElementTree as ET
 import json
 import yaml
@@ -15,6 +21,15 @@ import os
 from typing import Dict, Optional, List
 from datetime import datetime
 
+from law_api_cache import LawDetailCache, decode_detail, make_cache_key, DEFAULT_CACHE_DIR
+from law_api_ratelimit import create_rate_limiter, create_retry_policy
+from law_api_sanitize import sanitize_data
+from law_api_session import get_session, request_with_retry, DEFAULT_BASE_URL, DEFAULT_TIMEOUT
+from law_markdown import iter_law_markdown, write_markdown
+from law_model import Law
+from law_render import render_law, RENDER_FORMATS
+from law_xml_stream import parse_law_detail
+
 class LawAPIClient:
     def __init__(self):
         """YAML 파일에서 설정 로드"""
@@ -30,9 +45,20 @@ class LawAPIClient:
         if '@' in self.email_id:
             self.email_id = self.email_id.split('@')[0]
         
-        self.base_url = "http://www.law.go.kr/DRF"
+        # API 주소 (API_law.yaml의 base_url로 로컬 재생 서버 등 지정 가능)
+        self.base_url = self.config.get('base_url', DEFAULT_BASE_URL)
         # 실행 시간 기준 폴더명 생성
         self.session_folder = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # 공용 HTTP 세션 (연결 풀 + keep-alive, 모든 클라이언트 공유)
+        self.session = get_session(self.config.get('http_pool_size'))
+        # 호출 속도 제한 + 재시도 (API_law.yaml의 requests_per_second, endpoint_rates, max_retries)
+        self.rate_limiter = create_rate_limiter(self.config)
+        self.retry_policy = create_retry_policy(self.config)
+        self.timeout = self.config.get('request_timeout', DEFAULT_TIMEOUT)
+        # 상세 조회 응답 캐시 (API_law.yaml의 detail_cache: false로 끌 수 있음)
+        self.detail_cache = None
+        if self.config.get('detail_cache', True):
+            self.detail_cache = LawDetailCache(self.config.get('cache_dir', DEFAULT_CACHE_DIR))
         print(f"✅ API 클라이언트 초기화 완료")
     
     def load_config(self) -> Dict:
@@ -87,7 +113,8 @@ class LawAPIClient:
         print(f"\n🔍 '{query}' 검색 중...")
         
         try:
-            response = requests.get(url, params=params)
+            response = request_with_retry(self.session, url, params, self.rate_limiter,
+                                          self.retry_policy, self.timeout)
             if response.status_code == 200:
                 return self.parse_search_xml(response.content)
             else:
@@ -137,13 +164,14 @@ class LawAPIClient:
             print(f"❌ XML 파싱 오류: {e}")
             return result
     
-    def get_law_detail(self, law_id: str, output_type: str = "HTML") -> Optional[str]:
+    def get_law_detail(self, law_id: str, output_type: str = "HTML", law_info: Dict = None) -> Optional[str]:
         """
-        법령 상세 조회
+        법령 상세 조회 (캐시 우선)
         
         Args:
             law_id: 법령 일련번호
             output_type: 출력 형식 (HTML, XML)
+            law_info: 검색 결과 항목 (시행일자/공포일자로 캐시 만료 판단)
         """
         url = f"{self.base_url}/lawService.do"
         params = {
@@ -153,15 +181,36 @@ class LawAPIClient:
             'MST': law_id
         }
         
+        cache_key = make_cache_key('law', mst=law_id, output_type=output_type)
+        if self.detail_cache:
+            cached = self.detail_cache.get(cache_key, law_info)
+            if cached is not None:
+                try:
+                    result = decode_detail(cached, output_type)
+                    print(f"📦 캐시 사용 (ID: {law_id}, Type: {output_type})")
+                    return result
+                except ValueError as e:
+                    # 손상된 항목은 지우고 다시 조회 (같은 키가 계속 실패하지 않게)
+                    print(f"⚠️ 캐시 항목 손상, 다시 조회: {e}")
+                    self.detail_cache.remove(cache_key)
+        
         print(f"📖 법령 상세 조회 중 (ID: {law_id}, Type: {output_type})...")
         
         try:
-            response = requests.get(url, params=params)
+            response = request_with_retry(self.session, url, params, self.rate_limiter,
+                                          self.retry_policy, self.timeout)
             if response.status_code == 200:
-                return response.text
+                # 검증을 통과한 응답만 캐시에 저장 (HTTP 200 오류 페이지 제외)
+                result = decode_detail(response.content, output_type)
+                if self.detail_cache:
+                    self.detail_cache.put(cache_key, response.content, law_info)
+                return result
             else:
                 print(f"❌ 조회 실패: HTTP {response.status_code}")
                 return None
+        except ValueError as e:
+            print(f"❌ 응답 형식 오류: {e}")
+            return None
         except Exception as e:
             print(f"❌ 요청 오류: {e}")
             return None
@@ -172,26 +221,7 @@ class LawAPIClient:
         - OC 파라미터 제거
         - 이메일 ID 마스킹
         """
-        if isinstance(data, dict):
-            cleaned = {}
-            for key, value in data.items():
-                # OC 관련 필드 제거
-                if key.upper() == 'OC' or key == 'email_id':
-                    continue
-                # 값에서도 재귀적으로 제거
-                cleaned[key] = self.sanitize_data(value)
-            return cleaned
-        elif isinstance(data, list):
-            return [self.sanitize_data(item) for item in data]
-        elif isinstance(data, str):
-            # 문자열 내 이메일 ID 마스킹
-            if self.email_id and self.email_id in data:
-                return data.replace(self.email_id, "***MASKED***")
-            # 이메일 패턴 마스킹
-            import re
-            return re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '***@***.***', data)
-        else:
-            return data
+        return sanitize_data(data, self.email_id)
     
     def save_results(self, data: any, filename: str, law_name: str = None):
         """
@@ -225,13 +255,26 @@ class LawAPIClient:
         
         print(f"💾 {filepath} 저장 완료")
     
+    def save_markdown(self, law: Law, filename: str) -> str:
+        """Markdown 스트리밍 저장 (조문 조각마다 민감정보 제거 후 바로 기록)"""
+        save_dir = f'_cache/{self.session_folder}'
+        os.makedirs(save_dir, exist_ok=True)
+        filepath = f'{save_dir}/{filename}'
+        
+        chunks = (self.sanitize_data(chunk) for chunk in iter_law_markdown(law))
+        written = write_markdown(filepath, chunks)
+        
+        print(f"💾 {filepath} 저장 완료 ({written:,} bytes)")
+        return filepath
+    
     def download_law(self, law_name: str, formats: List[str] = None):
         """
         법령 검색 및 다운로드
         
         Args:
             law_name: 법령명
-            formats: 다운로드할 형식 리스트 ['HTML', 'XML']
+            formats: 저장할 형식 리스트 ['HTML', 'XML', 'JSON', 'MD', 'STRUCTURED']
+                     (HTML 외에는 XML 한 번 조회 후 모델에서 생성)
         """
         if not formats:
             formats = ['HTML', 'XML']
@@ -255,12 +298,38 @@ class LawAPIClient:
         if law_id:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             
+            # XML은 한 번만 받고 JSON/MD는 모델에서 생성 (HTML만 따로 조회)
+            xml_detail = None
+            law = None
+            
             for fmt in formats:
-                detail = self.get_law_detail(law_id, fmt)
+                fmt = fmt.upper()
+                if fmt in RENDER_FORMATS and xml_detail is None:
+                    xml_detail = self.get_law_detail(law_id, 'XML', law_info=first_law)
+                    if xml_detail:
+                        try:
+                            law = parse_law_detail(xml_detail)
+                        except ET.ParseError as e:
+                            print(f"❌ XML 파싱 오류: {e}")
+                
+                if fmt == 'XML':
+                    detail = xml_detail
+                elif fmt == 'MD':
+                    # Markdown은 문자열을 만들지 않고 조문 조각 단위로 파일에 씀 (save_markdown)
+                    detail = law
+                elif fmt in RENDER_FORMATS:
+                    detail = render_law(law, fmt) if law else None
+                else:
+                    detail = self.get_law_detail(law_id, fmt, law_info=first_law)
+                
                 if detail:
-                    ext = 'html' if fmt == 'HTML' else 'xml'
-                    filename = f"{law_name}_전체조문_{timestamp}.{ext}"
-                    self.save_results(detail, filename, law_name=law_name)
+                    ext = RENDER_FORMATS.get(fmt, fmt.lower())
+                    label = '구조화' if fmt == 'STRUCTURED' else '전체조문'
+                    filename = f"{law_name}_{label}_{timestamp}.{ext}"
+                    if fmt == 'MD':
+                        self.save_markdown(law, filename)
+                    else:
+                        self.save_results(detail, filename, law_name=law_name)
         
         # 4. 검색 결과 저장
         self.save_results(search_result, f"{law_name}_검색결과_{timestamp}.json", law_name=law_name)
@@ -293,10 +362,6 @@ def main():
             print(f"✅ {law_name} 처리 완료\n")
         else:
             print(f"❌ {law_name} 처리 실패\n")
-        
-        # API 부하 방지
-        import time
-        time.sleep(1)
     
     print("\n" + "="*60)
     print("📊 처리 완료!")
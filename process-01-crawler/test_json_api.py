@@ -43,7 +43,8 @@ def test_json_api():
     if '@' in email_id:
         email_id = email_id.split('@')[0]
     
-    base_url = "http://www.law.go.kr/DRF"
+    # 로컬 재생 서버(law_api_replay.py)로 오프라인 실행 가능
+    base_url = config.get('base_url', "http://www.law.go.kr/DRF")
     
     # 세션 폴더 생성
     session_folder = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+시점 기준 조문 조회 테스트 (law_asof_index)
+- 조문시행일자가 늦은 개정(유예), 유예 중 삭제, 삭제 후 다시 신설
+- 버전을 시행일자 순서와 다르게 추가해도 같은 시행 구간
+
+실행 (process-01-crawler 폴더에서, 네트워크 불필요):
+    python -m pytest -q test_law_asof_index.py
+"""
+
+from typing import Optional
+
+from law_asof_index import AsOfIndex, OPEN_END
+from law_model import Law, Article
+from law_version_store import VersionedLawStore
+
+LAW_ID = '009999'
+
+
+def make_article(number: int, text: str, effective_date: str = '') -> Article:
+    return Article(key=f"{number:04d}001", number=str(number), kind='조문',
+                   text=f"제{number}조 {text}", effective_date=effective_date)
+
+
+def make_law(effective_date: str, *articles: Article) -> Law:
+    return Law(law_id=LAW_ID, name='시험법', effective_date=effective_date, promulgation_date=effective_date,
+               articles=list(articles))
+
+
+def build_store(tmp_path, laws, order=None) -> AsOfIndex:
+    """버전 추가 (order: 추가 순서) → 새 인덱스"""
+    store = VersionedLawStore(str(tmp_path / 'store'))
+    for i in order or range(len(laws)):
+        store.add(laws[i], mst=f"m{i}")
+    return AsOfIndex(VersionedLawStore(str(tmp_path / 'store')), str(tmp_path / 'asof'))
+
+
+def text_at(index: AsOfIndex, label: str, date: str) -> Optional[str]:
+    article = index.article_at(LAW_ID, label, date)
+    return article.text if article else None
+
+
+def test_deferred_amendment(tmp_path):
+    """조문시행일자가 버전 시행일보다 늦으면 그때까지 이전 조문 시행"""
+    index = build_store(tmp_path, [
+        make_law('20190101', make_article(1, '원문')),
+        make_law('20200101', make_article(1, '개정', '20210101')),
+    ])
+    assert text_at(index, '제1조', '20181231') is None
+    assert text_at(index, '제1조', '20200601') == '제1조 원문'
+    assert text_at(index, '제1조', '20210101') == '제1조 개정'
+    assert [(start, end) for start, end, _ in index.history(LAW_ID, '제1조')] == [
+        (20190101, 20210101), (20210101, OPEN_END)]
+
+
+def test_deleted_after_deferred_amendment(tmp_path):
+    """유예된 개정이 시행되기 전에 삭제되면 개정은 시행되지 않고 삭제일에 이전 조문 종료"""
+    index = build_store(tmp_path, [
+        make_law('20190101', make_article(1, '원문'), make_article(2, '원문')),
+        make_law('20200101', make_article(1, '개정', '20210101'), make_article(2, '원문')),
+        make_law('20200601', make_article(2, '원문')),
+    ])
+    assert text_at(index, '제1조', '20200301') == '제1조 원문'
+    assert text_at(index, '제1조', '20200801') is None
+    assert text_at(index, '제1조', '20210201') is None
+    assert [(start, end) for start, end, _ in index.history(LAW_ID, '제1조')] == [(20190101, 20200601)]
+    assert text_at(index, '제2조', '20210201') == '제2조 원문'
+
+
+def test_new_deferred_article_deleted_before_start(tmp_path):
+    """나중에 시행될 예정이던 신설 조문이 시행 전에 삭제되면 어느 시점에도 없음"""
+    index = build_store(tmp_path, [
+        make_law('20220101', make_article(2, '원문'), make_article(3, '신설', '20230101')),
+        make_law('20220601', make_article(2, '원문')),
+        make_law('20240101', make_article(2, '개정')),
+    ])
+    assert index.history(LAW_ID, '제3조') == []
+    assert text_at(index, '제3조', '20230601') is None
+    assert text_at(index, '제2조', '20240101') == '제2조 개정'
+
+
+def test_readd_after_deletion(tmp_path):
+    """삭제된 조문이 다시 신설되면 삭제 기간에는 없고 신설일부터 새 조문 (같은 내용이어도 구간 분리)"""
+    index = build_store(tmp_path, [
+        make_law('20180101', make_article(1, '원문'), make_article(2, '원문')),
+        make_law('20190101', make_article(2, '원문')),
+        make_law('20200101', make_article(1, '재신설'), make_article(2, '원문')),
+        make_law('20210101', make_article(2, '원문')),
+        make_law('20220101', make_article(1, '재신설'), make_article(2, '원문')),
+    ])
+    assert text_at(index, '제1조', '20180601') == '제1조 원문'
+    assert text_at(index, '제1조', '20190601') is None
+    assert text_at(index, '제1조', '20200601') == '제1조 재신설'
+    assert text_at(index, '제1조', '20210601') is None
+    assert text_at(index, '제1조', '20220601') == '제1조 재신설'
+    assert [(start, end) for start, end, _ in index.history(LAW_ID, '제1조')] == [
+        (20180101, 20190101), (20200101, 20210101), (20220101, OPEN_END)]
+
+
+def test_out_of_order_add_same_timelines(tmp_path):
+    """이전 시행일 버전을 뒤늦게 추가해도 시행일자 순으로 추가한 것과 같은 구간"""
+    laws = [
+        make_law('20190101', make_article(1, '원문'), make_article(2, '원문')),
+        make_law('20200101', make_article(1, '개정', '20210101'), make_article(2, '원문')),
+        make_law('20200601', make_article(2, '개정')),
+        make_law('20220101', make_article(1, '재신설'), make_article(2, '개정')),
+    ]
+    in_order = build_store(tmp_path / 'a', laws)
+    shuffled = build_store(tmp_path / 'b', laws, order=(3, 1, 0, 2))
+    for label in ('제1조', '제2조'):
+        assert shuffled.history(LAW_ID, label) == in_order.history(LAW_ID, label)
+    assert text_at(shuffled, '제1조', '20200801') is None
+    assert text_at(shuffled, '제2조', '20200801') == '제2조 개정'
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+법령 버전 저장소 테스트 (law_version_store)
+- 변경분 사슬 복원: 시행일자 순서와 다르게 추가, 기준 사슬 길이 초과(전체 목록 기록)
+- 복원한 버전이 저장 전 Law와 같은지
+
+실행 (process-01-crawler 폴더에서, 네트워크 불필요):
+    python -m pytest -q test_law_version_store.py
+"""
+
+import os
+import sys
+
+from law_json_decode import loads
+from law_model import Law, Article, Paragraph, Addendum, Table, law_from_json
+from law_version_store import VersionedLawStore
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks'))
+from synthetic_law import build_law, law_to_json  # noqa: E402
+
+LAW_ID = '009999'
+
+
+def make_article(number: int, text: str, effective_date: str = '') -> Article:
+    return Article(key=f"{number:04d}001", number=str(number), kind='조문', title=f"조문{number}",
+                   text=f"제{number}조(조문{number}) {text}", effective_date=effective_date,
+                   paragraphs=[Paragraph(number='①', text=f"① {text}")])
+
+
+def make_law(effective_date: str, articles, addenda=None) -> Law:
+    return Law(law_id=LAW_ID, name='시험법', effective_date=effective_date, promulgation_date=effective_date,
+               articles=list(articles), addenda=list(addenda or []))
+
+
+def version_laws():
+    """시행일자 순 다섯 버전 (개정, 삭제, 신설, 순서 변경, 부칙 추가)"""
+    a1, a2, a3 = make_article(1, '원문'), make_article(2, '원문'), make_article(3, '원문')
+    a2_new = make_article(2, '개정')
+    a4 = make_article(4, '신설')
+    return [
+        make_law('20180101', [a1, a2, a3]),
+        make_law('20190101', [a1, a2_new, a3]),
+        make_law('20200101', [a1, a3]),
+        make_law('20210101', [a1, a4, a3]),
+        make_law('20220101', [a4, a1, a3], [Addendum(key='2022', text='부칙 <2022. 1. 1.>')]),
+    ]
+
+
+def assert_versions(store_dir: str, laws):
+    """새 저장소 인스턴스로 열어 (메모리 캐시 없이 사슬을 따라) 모든 버전 복원 확인"""
+    store = VersionedLawStore(store_dir)
+    versions = store.versions(LAW_ID)
+    assert [v['effective_date'] for v in versions] == sorted(law.effective_date for law in laws)
+    by_date = {law.effective_date: law for law in laws}
+    for record in versions:
+        assert store.load(LAW_ID, record['id']) == by_date[record['effective_date']]
+
+
+def test_in_order_add_round_trip(tmp_path):
+    laws = version_laws()
+    store = VersionedLawStore(str(tmp_path))
+    for i, law in enumerate(laws):
+        store.add(law, mst=f"m{i}")
+    assert_versions(str(tmp_path), laws)
+
+
+def test_out_of_order_add(tmp_path):
+    """나중 버전을 먼저 받아도 (이전 시행일 법령을 뒤늦게 수집) 모든 버전이 그대로 복원됨"""
+    laws = version_laws()
+    store = VersionedLawStore(str(tmp_path))
+    for i in (4, 0, 2, 1, 3):
+        store.add(laws[i], mst=f"m{i}")
+
+    versions = store.versions(LAW_ID)
+    assert [v['effective_date'] for v in versions] == [law.effective_date for law in laws]
+    assert_versions(str(tmp_path), laws)
+
+    # 같은 버전을 다시 추가하면 기존 기록 그대로
+    again = store.add(laws[2], mst='m2')
+    assert again == store.find_version(LAW_ID, again['id'])
+    assert len(store.versions(LAW_ID)) == len(laws)
+
+
+def test_keyframe_rollover(tmp_path):
+    """기준 사슬이 keyframe_every에 이르면 전체 목록을 기록하고, 그 뒤 버전도 복원됨"""
+    keyframe_every = 3
+    store = VersionedLawStore(str(tmp_path), keyframe_every=keyframe_every)
+    laws = []
+    for i in range(8):
+        law = make_law(f"{2010 + i}0101", [make_article(1, f"개정 {i}"), make_article(2, '원문')])
+        laws.append(law)
+        store.add(law, mst=f"m{i}")
+
+    versions = store.versions(LAW_ID)
+    depths = [v['depth'] for v in versions]
+    assert max(depths) < keyframe_every
+    keyframes = [v for v in versions if v['base'] is None]
+    assert len(keyframes) > 1
+    # 전체 목록 기록 버전은 변경분이 아니라 모든 단위를 담음
+    for record in keyframes:
+        assert set(record['sections']['조문']['set']) == {'0001001', '0002001'}
+    assert_versions(str(tmp_path), laws)
+
+
+def test_load_equals_ingested_law(tmp_path):
+    """항/호/목, 부칙, 별표까지 있는 법령 → 저장 → 복원 결과가 저장 전 Law와 같음"""
+    law = law_from_json(loads(law_to_json(build_law('부가가치세법', 20250101))))
+    law.tables.append(Table(key='000100', number='1', kind='별표', title='세율표', text='[별표 1] 세율표'))
+    law.revision_text = '부가가치세법 일부를 다음과 같이 개정한다.'
+    store = VersionedLawStore(str(tmp_path))
+    record = store.add(law, mst='268602')
+
+    restored = VersionedLawStore(str(tmp_path)).load(law.law_id, record['id'])
+    assert restored == law
+    assert len(restored.articles) == len(law.articles)